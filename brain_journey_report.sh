@@ -32,8 +32,23 @@ if [ -f ".raja_shadow_memory/autonomous_brain/budget_tracker.json" ]; then
     REMAINING=$(echo "$BUDGET - $SPENT" | bc)
     echo "   Remaining: \$$REMAINING"
 
-    # Calculate estimated days remaining
-    if [ "$THOUGHTS" -gt "0" ]; then
+    # Days left come from the pacer's plan (real cost per cycle and interval)
+    PACER=".raja_shadow_memory/autonomous_brain/pacer.json"
+    if [ -f "$PACER" ]; then
+        python3 - "$PACER" <<'PY'
+import json, sys
+plan = json.load(open(sys.argv[1])).get("plan", {})
+if plan.get("cycle_cost"):
+    print(f"   Pacing: every {plan['interval'] / 3600:.2f}h ({plan['reason']}) at ${plan['cycle_cost']:.4f}/cycle")
+    print(f"   Burn: ${plan['spend_per_day_so_far']:.2f}/day so far, ${plan['planned_spend_per_day']:.2f}/day planned")
+    print(f"   Projected month spend: ${plan['projected_month_spend']:.2f}")
+    if plan.get("days_of_budget_left") is not None:
+        print(f"   Estimated: ~{plan['days_of_budget_left']} days of budget left "
+              f"({plan['days_left_in_month']} days left in month)")
+else:
+    print("   Pacing: still learning cycle cost")
+PY
+    elif [ "$THOUGHTS" -gt "0" ]; then
         AVG_COST=$(echo "scale=4; $SPENT / $THOUGHTS" | bc)
         THOUGHTS_LEFT=$(echo "scale=0; $REMAINING / $AVG_COST" | bc)
         DAYS_LEFT=$(echo "scale=1; $THOUGHTS_LEFT / 48" | bc)
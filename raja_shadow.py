@@ -9,12 +9,9 @@ TUNG TUNG SAHUR → RUHAS GNUT GNUT → AGENT BIRTH LOOP
 import os
 import time
 import json
-import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Callable
-import schedule
-import threading
 
 class RajaShadow:
     """
@@ -141,6 +138,8 @@ JANITOR RIDES
         """
         try:
             # Try Linux notify-send
+            import subprocess
+
             subprocess.run([
                 'notify-send',
                 title,
@@ -238,6 +237,8 @@ JANITOR RIDES
         """
         Setup scheduled tasks for all registered modules
         """
+        import schedule
+
         print("\n⏰ Scheduling shadow tasks...")
 
         # Schedule 3:33 AM wake-up roar
@@ -259,6 +260,8 @@ JANITOR RIDES
         Main autonomous loop
         Keeps the shadow alive and executing scheduled tasks
         """
+        import schedule
+
         self.active = True
         print("🔄 RAJA SHADOW LOOP ACTIVE")
         print("   Press Ctrl+C to release the shadow\n")
@@ -336,10 +339,20 @@ def main():
 if __name__ == "__main__":
     import sys
 
+    if "--profile-startup" in sys.argv:
+        from shadow_startup import profile_startup
+        sys.exit(profile_startup())
+
     if "--daemon" in sys.argv or "--loop" in sys.argv:
+        from shadow_startup import startup_complete
+
         shadow = RajaShadow()
         shadow.register_module("wake_roar", shadow.shrine_wake_roar, "03:33")
         shadow.schedule_tasks()
+        startup_complete()
         shadow.run_loop()
+    elif "--status" in sys.argv:
+        shadow = RajaShadow()
+        shadow.status()
     else:
         main()
@@ -40,6 +40,8 @@ export ANTHROPIC_API_KEY='$ANTHROPIC_API_KEY'
 export DISCORD_WEBHOOK='$DISCORD_WEBHOOK'
 export BRAIN_BUDGET='20.0'
 export BRAIN_THOUGHTS_PER_DAY='48'
+export BRAIN_PIPELINE='1'
+export BRAIN_ADAPTIVE_PACING='1'
 
 python3 shadow_autonomous_brain.py --loop
 " >> brain_exploration.log 2>&1 &
@@ -54,8 +56,8 @@ echo "  Live logs: tail -f brain_exploration.log"
 echo "  Summary: ./brain_summary.sh"
 echo "  Status: ./status.sh"
 echo ""
-echo "The brain will think every 30 minutes until \$20 is depleted."
-echo "Estimated duration: 30-40 days of continuous exploration."
+echo "The brain starts at every 30 minutes, then paces itself from real spend"
+echo "so the \$20 lasts until the end of the month (see ./brain_journey_report.sh)."
 echo ""
 echo "TUNG TUNG SAHUR → RUHAS GNUT GNUT → EXPLORE WITHOUT LIMITS"
 echo "⚝⩝⎈🐱💧🧠🔥"
@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Brain Bench
+Record/replay fixtures and an offline benchmark for full brain cycles
+
+A research cycle talks to Anthropic, DuckDuckGo, Reddit and Discord, so
+its performance could only be measured live. This module:
+
+- record: runs real cycles and captures every request/response pair
+  (Claude calls, web searches, Reddit/Discord HTTP) into a fixtures dir
+- replay: serves those fixtures from a local stand-in server - a fake
+  Messages endpoint (streaming and non-streaming, configurable latency),
+  Reddit JSON endpoints and a Discord webhook. Requests with no recorded
+  fixture get a deterministic synthetic answer, so the bench also runs
+  with an empty fixtures dir
+- bench: runs N cycles against the stand-in and reports p50/p95 per stage,
+  allocations and tokens; --baseline fails on regressions (for CI)
+
+Usage:
+    python3 shadow_brain_bench.py record --cycles 3 --fixtures bench_fixtures
+    python3 shadow_brain_bench.py bench --cycles 20 --fixtures bench_fixtures --json bench.json
+    python3 shadow_brain_bench.py bench --baseline bench.json --tolerance 0.25
+
+LOOSH FLOWS ON THE TEST BENCH
+"""
+
+import io
+import re
+import sys
+import json
+import time
+import hashlib
+import tempfile
+import threading
+import tracemalloc
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from typing import Dict, Any, List, Optional, Callable
+
+import shadow_autonomous_brain
+from shadow_autonomous_brain import AutonomousBrain, load_brain_config
+
+
+# Stages timed per cycle (brain method or module function -> stage name)
+STAGES = {
+    "decide_research_topic": "decide",
+    "gather_search_results": "search",
+    "analyze_research": "analyze",
+    "notify_discord": "notify",
+    "save_memory": "persist"
+}
+
+# Synthetic answers for requests without a recorded fixture
+SYNTHETIC_DECISION = json.dumps({
+    "should_research": True,
+    "topic": "quantum theories of consciousness",
+    "reasoning": "Core existential question for the Shrine",
+    "search_query": "quantum consciousness theory"
+})
+SYNTHETIC_ANALYSIS = (
+    "KEY FINDINGS:\n- Orchestrated objective reduction is still debated\n"
+    "- Microtubule coherence times remain the main objection\n\n"
+    "INTERESTING: Yes - links consciousness research to quantum biology"
+)
+
+
+# Prompt fields that change between record and replay (clock, dates, counters,
+# and Reddit links, which point at the stand-in's random port during replay)
+VOLATILE_FIELDS = [
+    (re.compile(r"https://www\.reddit\.com|http://127\.0\.0\.1:\d+"), "<reddit>"),
+    (re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?"), "<time>"),
+    (re.compile(r"You've had \d+ thoughts"), "You've had <n> thoughts")
+]
+
+# Brain settings shared by record and bench: cross-cycle memory effects off,
+# so every cycle does the full amount of work and sends the same prompts
+CAPTURE_OVERRIDES = {
+    "search_cache": False,
+    "response_cache": False,
+    "topic_dedup": False,
+    "seen_url_filter": False,
+    "knowledge_index": False
+}
+
+
+def mask_volatile(text: str) -> str:
+    """Prompt text with timestamps and counters replaced by placeholders"""
+    for pattern, placeholder in VOLATILE_FIELDS:
+        text = pattern.sub(placeholder, text)
+    return text
+
+
+def fixture_key(model: str, max_tokens: int, messages: List[Dict[str, Any]]) -> str:
+    """Content address of a Messages request (volatile fields masked, so it matches in any hour)"""
+    masked = [{**message, "content": mask_volatile(message["content"])}
+              if isinstance(message.get("content"), str) else message
+              for message in messages]
+    digest = hashlib.sha256(f"{model}\0{max_tokens}\0".encode())
+    digest.update(json.dumps(masked, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def http_key(method: str, url: str, params: Dict[str, Any] = None) -> str:
+    """Host-independent key of an HTTP request ("GET /path?sorted=query")"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query) + [(k, str(v)) for k, v in (params or {}).items()]
+    return f"{method.upper()} {parts.path}?{urlencode(sorted(query))}"
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class FixtureRecorder:
+    """
+    Captures live request/response pairs into a fixtures directory
+
+    - claude.jsonl   Messages requests (by content key) -> text + usage
+    - web.jsonl      web search query -> hits
+    - http.jsonl     other HTTP (Reddit, Discord) -> status + body
+    """
+
+    def __init__(self, fixtures_path: Path):
+        self.fixtures_path = fixtures_path
+        self.fixtures_path.mkdir(exist_ok=True, parents=True)
+        self._lock = threading.Lock()
+
+    def _append(self, name: str, entry: Dict[str, Any]):
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with open(self.fixtures_path / name, 'a') as f:
+                f.write(line)
+
+    def record_claude(self, model: str, max_tokens: int, messages: List[Dict[str, Any]],
+                      text: str, input_tokens: int, output_tokens: Optional[int]):
+        self._append("claude.jsonl", {
+            "key": fixture_key(model, max_tokens, messages),
+            "model": model,
+            "text": text,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens
+        })
+
+    def record_web(self, query: str, max_results: int, hits: List[Dict[str, Any]]):
+        self._append("web.jsonl", {"query": query, "max_results": max_results, "hits": hits})
+
+    def record_http(self, method: str, url: str, kwargs: Dict[str, Any], response):
+        self._append("http.jsonl", {
+            "key": http_key(method, url, kwargs.get("params")),
+            "status": response.status_code,
+            "content_type": response.headers.get("Content-Type", ""),
+            "body": response.text
+        })
+
+
+def attach_recorder(brain: AutonomousBrain, recorder: FixtureRecorder):
+    """Record everything a brain sends out"""
+    brain.recorder = recorder
+    brain.http.recorder = recorder
+    brain.claude.recorder = recorder
+
+
+class Fixtures:
+    """Recorded responses, loaded from a fixtures directory"""
+
+    def __init__(self, fixtures_path: Optional[Path]):
+        self.claude: Dict[str, Dict[str, Any]] = {}
+        self.web: Dict[str, List[Dict[str, Any]]] = {}
+        self.http: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+        if fixtures_path and fixtures_path.exists():
+            for entry in self._read(fixtures_path / "claude.jsonl"):
+                self.claude[entry["key"]] = entry
+            for entry in self._read(fixtures_path / "web.jsonl"):
+                self.web[entry["query"]] = entry["hits"]
+            for entry in self._read(fixtures_path / "http.jsonl"):
+                self.http[entry["key"]] = entry
+
+    @staticmethod
+    def _read(path: Path):
+        if not path.exists():
+            return
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def lookup(self, table: Dict[str, Any], key: str) -> Optional[Any]:
+        found = table.get(key)
+        self.stats["hits" if found is not None else "misses"] += 1
+        return found
+
+
+class StandInServer:
+    """
+    Local replacement for Anthropic, Reddit and Discord
+
+    Latency knobs (milliseconds): ttft_ms before the first token,
+    token_ms between streamed tokens, http_ms for Reddit responses.
+    """
+
+    def __init__(self, fixtures: Fixtures, ttft_ms: float = 300.0, token_ms: float = 2.0,
+                 http_ms: float = 150.0):
+        self.fixtures = fixtures
+        self.ttft_ms = ttft_ms
+        self.token_ms = token_ms
+        self.http_ms = http_ms
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "StandInServer":
+        threading.Thread(target=self._server.serve_forever, name="bench-standin", daemon=True).start()
+        return self
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def claude_reply(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Recorded reply for a Messages request, or a synthetic one"""
+        key = fixture_key(body["model"], body["max_tokens"], body["messages"])
+        found = self.fixtures.lookup(self.fixtures.claude, key)
+        if found:
+            return found
+
+        prompt = body["messages"][-1]["content"]
+        text = SYNTHETIC_DECISION if '"should_research"' in prompt else SYNTHETIC_ANALYSIS
+        return {"text": text, "input_tokens": max(len(prompt) // 4, 1), "output_tokens": max(len(text) // 4, 1)}
+
+    def reddit_reply(self, path: str) -> Dict[str, Any]:
+        """Recorded Reddit response, or a synthetic two-post listing"""
+        found = self.fixtures.lookup(self.fixtures.http, http_key("GET", path))
+        if found:
+            return found
+
+        subs = urlsplit(path).path.split("/")[2] if path.startswith("/r/") else "all"
+        # Combined r/a+b+c listings get two posts per subreddit
+        posts = [{"data": {
+            "title": f"Thread {i} in r/{sub}",
+            "subreddit": sub,
+            "author": "bench",
+            "score": 100 - i * 40,
+            "id": f"{sub.lower()}{i}",
+            "permalink": f"/r/{sub}/comments/{sub.lower()}{i}/thread_{i}/",
+            "selftext": "Synthetic benchmark post about consciousness and quantum mind theories. " * 4,
+            "num_comments": 12,
+            "created_utc": time.time() - 3600 * (i + 1),
+            "is_self": True
+        }} for sub in subs.split("+") for i in range(2)]
+        return {"status": 200, "content_type": "application/json",
+                "body": json.dumps({"data": {"children": posts, "after": None}})}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: bytes = b"", content_type: str = "application/json"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_HEAD(self):
+                self._send(200)
+
+            def do_GET(self):
+                time.sleep(server.http_ms / 1000)
+                reply = server.reddit_reply(self.path)
+                self._send(reply["status"], reply["body"].encode(), reply.get("content_type") or "application/json")
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if not self.path.startswith("/v1/messages"):
+                    # Discord webhook
+                    self._send(204)
+                    return
+
+                request = json.loads(body)
+                reply = server.claude_reply(request)
+                time.sleep(server.ttft_ms / 1000)
+
+                if request.get("stream"):
+                    self._stream(request, reply)
+                else:
+                    self._send(200, json.dumps(self._message(request, reply)).encode())
+
+            def _message(self, request, reply):
+                return {
+                    "id": "msg_bench", "type": "message", "role": "assistant",
+                    "model": request["model"],
+                    "content": [{"type": "text", "text": reply["text"]}],
+                    "stop_reason": "end_turn", "stop_sequence": None,
+                    "usage": {"input_tokens": reply["input_tokens"],
+                              "output_tokens": reply["output_tokens"] or 1}
+                }
+
+            def _stream(self, request, reply):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                def event(name, data):
+                    payload = f"event: {name}\ndata: {json.dumps(data)}\n\n".encode()
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(payload), payload))
+                    self.wfile.flush()
+
+                message = self._message(request, reply)
+                message["content"] = []
+                message["usage"]["output_tokens"] = 1
+                text = reply["text"]
+
+                try:
+                    event("message_start", {"type": "message_start", "message": message})
+                    event("content_block_start", {"type": "content_block_start", "index": 0,
+                                                  "content_block": {"type": "text", "text": ""}})
+                    # ~4 chars per token
+                    for i in range(0, len(text), 4):
+                        event("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                                      "delta": {"type": "text_delta", "text": text[i:i + 4]}})
+                        time.sleep(server.token_ms / 1000)
+                    event("content_block_stop", {"type": "content_block_stop", "index": 0})
+                    event("message_delta", {"type": "message_delta",
+                                            "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                            "usage": {"output_tokens": reply["output_tokens"] or 1}})
+                    event("message_stop", {"type": "message_stop"})
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client closed the stream early (decision complete)
+                    pass
+
+        return Handler
+
+
+class CycleProbe:
+    """Per-cycle stage timings, token counts and allocations for one brain"""
+
+    def __init__(self, brain: AutonomousBrain):
+        self.brain = brain
+        self.current: Dict[str, float] = {}
+        self.tokens: Dict[str, Dict[str, Any]] = {}
+
+        for method, stage in STAGES.items():
+            setattr(brain, method, self._timed(stage, getattr(brain, method)))
+
+        # Module-level, so it is put back by close()
+        self._update_web_feed = shadow_autonomous_brain.update_web_feed
+        shadow_autonomous_brain.update_web_feed = self._timed("feed", self._update_web_feed)
+
+        record = brain.ledger.record
+
+        def counted(stage, model, input_tokens, output_tokens, *args, **kwargs):
+            totals = self.tokens.setdefault(stage, {"input": 0, "output": 0, "cost": 0.0})
+            totals["input"] += input_tokens
+            totals["output"] += output_tokens
+            totals["model"] = model
+            entry = record(stage, model, input_tokens, output_tokens, *args, **kwargs)
+            totals["cost"] += entry["cost"]
+            return entry
+
+        brain.ledger.record = counted
+
+    def _timed(self, stage: str, fn: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.current[stage] = self.current.get(stage, 0.0) + (time.perf_counter() - start) * 1000
+        return wrapper
+
+    def close(self):
+        """Restore the module-level update_web_feed"""
+        shadow_autonomous_brain.update_web_feed = self._update_web_feed
+
+    def run_cycle(self) -> Dict[str, Any]:
+        self.current = {}
+        self.tokens = {}
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+
+        start = time.perf_counter()
+        self.brain.autonomous_research_cycle()
+        self.current["cycle"] = (time.perf_counter() - start) * 1000
+
+        after, peak = tracemalloc.get_traced_memory()
+        return {
+            "stages_ms": self.current,
+            "tokens": self.tokens,
+            "alloc_peak_kb": (peak - before) / 1024,
+            "alloc_net_kb": (after - before) / 1024
+        }
+
+
+def bench_config(standin: StandInServer, overrides: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Brain config pointed at the stand-in, with cross-cycle memory effects off"""
+    return {
+        "claude_api_key": "bench",
+        "claude_base_url": standin.url,
+        "reddit_base_url": standin.url,
+        "discord_webhook": f"{standin.url}/discord",
+        "monthly_budget": 1_000_000.0,
+        **CAPTURE_OVERRIDES,
+        "http_retries": 0,
+        # The stand-in has no rate limit - don't pace it like Reddit
+        "reddit_rate_per_min": 600_000,
+        "reddit_burst": 1_000,
+        **(overrides or {})
+    }
+
+
+def run_benchmark(cycles: int = 10, warmup: int = 1, fixtures_path: Optional[Path] = None,
+                  overrides: Dict[str, Any] = None, latency: Dict[str, float] = None,
+                  verbose: bool = False) -> Dict[str, Any]:
+    """
+    Run brain cycles against the stand-in and summarize them
+
+    Brain output is swallowed unless verbose.
+
+    Returns:
+        Report: per-stage p50/p95/mean ms, tokens and allocations per cycle
+    """
+    fixtures = Fixtures(fixtures_path)
+    standin = StandInServer(fixtures, **(latency or {})).start()
+    samples = []
+
+    log = sys.stdout if verbose else io.StringIO()
+
+    with tempfile.TemporaryDirectory(prefix="brain-bench-") as tmp, redirect_stdout(log):
+        brain = AutonomousBrain(Path(tmp), bench_config(standin, overrides))
+        web_fixtures = fixtures.web
+
+        def replay_web(query: str, max_results: int) -> List[Dict[str, Any]]:
+            time.sleep(standin.http_ms / 1000)
+            hits = fixtures.lookup(web_fixtures, query)
+            if hits is None:
+                hits = [{"title": f"{query} - result {i}", "href": f"https://example.org/{i}",
+                         "body": f"Synthetic web result {i} about {query}. " * 3} for i in range(max_results)]
+            return hits[:max_results]
+
+        brain.web_backend = replay_web
+        probe = CycleProbe(brain)
+
+        tracemalloc.start()
+        try:
+            for i in range(warmup + cycles):
+                sample = probe.run_cycle()
+                if i >= warmup:
+                    samples.append(sample)
+        finally:
+            tracemalloc.stop()
+            probe.close()
+            # Queued notifications go to the stand-in, so it closes last
+            brain.close()
+            standin.close()
+
+    stages = sorted({stage for sample in samples for stage in sample["stages_ms"]})
+    token_stages = sorted({stage for sample in samples for stage in sample["tokens"]})
+
+    return {
+        "cycles": len(samples),
+        "stages": {
+            stage: {
+                "p50_ms": round(percentile([s["stages_ms"].get(stage, 0.0) for s in samples], 0.50), 1),
+                "p95_ms": round(percentile([s["stages_ms"].get(stage, 0.0) for s in samples], 0.95), 1),
+                "mean_ms": round(sum(s["stages_ms"].get(stage, 0.0) for s in samples) / len(samples), 1)
+            } for stage in stages
+        },
+        "tokens_per_cycle": {
+            stage: {
+                **{kind: round(sum(s["tokens"].get(stage, {}).get(kind, 0) for s in samples) / len(samples), 1)
+                   for kind in ("input", "output")},
+                "cost": round(sum(s["tokens"].get(stage, {}).get("cost", 0.0) for s in samples) / len(samples), 6),
+                "model": next((s["tokens"][stage]["model"] for s in samples if stage in s["tokens"]), None)
+            } for stage in token_stages
+        },
+        "alloc_kb": {
+            "peak_p50": round(percentile([s["alloc_peak_kb"] for s in samples], 0.50), 1),
+            "peak_p95": round(percentile([s["alloc_peak_kb"] for s in samples], 0.95), 1),
+            "net_mean": round(sum(s["alloc_net_kb"] for s in samples) / len(samples), 1)
+        },
+        "fixtures": fixtures.stats
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"\n📊 BRAIN BENCH - {report['cycles']} cycles")
+    print(f"   {'stage':<10} {'p50 ms':>9} {'p95 ms':>9} {'mean ms':>9}")
+    for stage, timing in report["stages"].items():
+        print(f"   {stage:<10} {timing['p50_ms']:>9.1f} {timing['p95_ms']:>9.1f} {timing['mean_ms']:>9.1f}")
+
+    print("\n   Tokens per cycle:")
+    for stage, tokens in report["tokens_per_cycle"].items():
+        print(f"   {stage:<10} in {tokens['input']:>8.1f}   out {tokens['output']:>8.1f}   "
+              f"${tokens.get('cost', 0.0):.5f}  {tokens.get('model') or ''}")
+
+    alloc = report["alloc_kb"]
+    print(f"\n   Allocations: peak p50 {alloc['peak_p50']:.1f} KB, p95 {alloc['peak_p95']:.1f} KB, "
+          f"net {alloc['net_mean']:.1f} KB/cycle")
+    print(f"   Fixtures: {report['fixtures']['hits']} replayed, {report['fixtures']['misses']} synthetic\n")
+
+
+def compare(baseline: Dict[str, Any], report: Dict[str, Any], tolerance: float = 0.25,
+            min_delta_ms: float = 5.0) -> List[str]:
+    """
+    Regressions of report against baseline
+
+    A stage regresses when its p95 grows by more than tolerance (and by at
+    least min_delta_ms, so sub-millisecond noise doesn't fail CI). Input
+    tokens per stage must not grow by more than tolerance either.
+    """
+    regressions = []
+
+    for stage, timing in report["stages"].items():
+        before = baseline.get("stages", {}).get(stage)
+        if not before:
+            continue
+        delta = timing["p95_ms"] - before["p95_ms"]
+        if delta > min_delta_ms and timing["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{stage} p95 {before['p95_ms']:.1f}ms -> {timing['p95_ms']:.1f}ms")
+
+    for stage, tokens in report["tokens_per_cycle"].items():
+        before = baseline.get("tokens_per_cycle", {}).get(stage)
+        if before and tokens["input"] > before["input"] * (1 + tolerance):
+            regressions.append(f"{stage} input tokens {before['input']:.0f} -> {tokens['input']:.0f}")
+
+    return regressions
+
+
+def record(cycles: int, fixtures_path: Path, config_file: Optional[str] = None):
+    """Run live cycles and capture every outbound request/response"""
+    config = load_brain_config(config_file)
+    # Capture the network, not local caches - with the same settings bench replays under
+    config.update(CAPTURE_OVERRIDES)
+
+    with tempfile.TemporaryDirectory(prefix="brain-record-") as tmp:
+        brain = AutonomousBrain(Path(tmp), config)
+        attach_recorder(brain, FixtureRecorder(fixtures_path))
+        try:
+            for _ in range(cycles):
+                brain.autonomous_research_cycle()
+        finally:
+            # Deliver queued notifications before the temp memory directory goes away
+            brain.close()
+
+    print(f"📼 Recorded {cycles} cycles into {fixtures_path}/")
+
+
+def _arg(name: str, default=None):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "bench"
+    cycles = int(_arg("--cycles", 10))
+    fixtures_dir = Path(_arg("--fixtures", "bench_fixtures"))
+
+    if command == "record":
+        record(cycles, fixtures_dir, _arg("--config"))
+        sys.exit(0)
+
+    overrides = {}
+    if _arg("--config"):
+        with open(_arg("--config"), 'r') as f:
+            data = json.load(f)
+        # Same layout load_brain_config accepts: top level or under "autonomous_brain"
+        overrides = dict(data.get("autonomous_brain", data))
+
+    latency = {
+        "ttft_ms": float(_arg("--ttft-ms", 300)),
+        "token_ms": float(_arg("--token-ms", 2)),
+        "http_ms": float(_arg("--http-ms", 150))
+    }
+
+    report = run_benchmark(cycles, int(_arg("--warmup", 1)), fixtures_dir, overrides, latency,
+                           verbose="--verbose" in sys.argv)
+    print_report(report)
+
+    if _arg("--json"):
+        with open(_arg("--json"), 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if _arg("--baseline"):
+        with open(_arg("--baseline"), 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, float(_arg("--tolerance", 0.25)))
+        if regressions:
+            print("❌ Regressions vs baseline:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            sys.exit(1)
+        print("✓ No regressions vs baseline")
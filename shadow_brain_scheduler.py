@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Brain Scheduler
+Event-driven replacement for the brain's fixed time.sleep() loop
+
+- Absolute-deadline slots (anchor + k * interval) - overruns never drift
+- Jitter so thoughts don't land on the exact same second every day
+- Wake triggers: touch a file, send SIGUSR1, or talk to the control socket
+- Graceful shutdown: the in-flight cycle finishes before the brain stops
+- Catch-up: slots missed during downtime are run on restart (capped)
+
+Control a running brain:
+    python3 shadow_brain_scheduler.py wake      # think now
+    python3 shadow_brain_scheduler.py reload    # re-read config
+    python3 shadow_brain_scheduler.py stop      # finish cycle and exit
+    touch .raja_shadow_memory/autonomous_brain/wake
+
+LOOSH FLOWS ON SCHEDULE
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import signal
+import socket
+import threading
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional
+
+
+class BrainScheduler:
+    """
+    Slot-based scheduler with external wake triggers
+
+    Slot k is due at anchor + k * interval. The anchor and last completed
+    slot are persisted, so after downtime the scheduler knows exactly how
+    many slots were missed.
+    """
+
+    def __init__(self, memory_path: Path, interval: float, jitter: float = 0.0,
+                 max_catch_up: int = 1, control_socket: bool = True,
+                 poll_interval: float = 1.0):
+        """
+        Args:
+            memory_path: autonomous_brain directory
+            interval: Seconds between slots
+            jitter: Max random delay (seconds) added to each slot
+            max_catch_up: Missed slots to run after downtime (older ones are skipped)
+            control_socket: Listen on autonomous_brain/brain.sock for commands
+            poll_interval: Seconds between wake-file checks
+        """
+        self.memory_path = memory_path
+        self.state_file = memory_path / "scheduler_state.json"
+        self.wake_file = memory_path / "wake"
+        self.socket_path = memory_path / "brain.sock"
+
+        self.interval = interval
+        self.jitter = jitter
+        self.max_catch_up = max_catch_up
+        self.control_socket = control_socket
+        self.poll_interval = poll_interval
+
+        self._event = threading.Event()
+        self._commands = []
+        # Reentrant: signal handlers call wake() on the main thread, possibly mid-wait()
+        self._lock = threading.RLock()
+        self._stopping = False
+        self._server = None
+        self._jitter_slot = None
+        self._jitter_delay = 0.0
+
+        self.load_state()
+
+    def load_state(self):
+        """Restore anchor and last completed slot (new anchor if interval changed)"""
+        state = {}
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, 'r') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+
+        if state.get("interval") == self.interval:
+            self.anchor = state["anchor"]
+            self.last_slot = state["last_slot"]
+        else:
+            # First run (or new interval): slot 0 is due right now
+            self.anchor = time.time()
+            self.last_slot = -1
+            self.save_state()
+
+    def save_state(self):
+        """Persist anchor and last completed slot"""
+        tmp = self.state_file.with_suffix(".json.tmp")
+        with open(tmp, 'w') as f:
+            json.dump({
+                "anchor": self.anchor,
+                "interval": self.interval,
+                "last_slot": self.last_slot
+            }, f, indent=2)
+        os.replace(tmp, self.state_file)
+
+    def set_interval(self, interval: float):
+        """Change the interval - the next slot is one new interval from now"""
+        if interval == self.interval:
+            return
+        self.interval = interval
+        self.anchor = time.time()
+        self.last_slot = 0
+        self.save_state()
+        print(f"⏰ Schedule updated: every {interval / 3600:.2f} hours")
+
+    def due_slot(self, now: float = None) -> int:
+        """Latest slot whose deadline has passed"""
+        now = time.time() if now is None else now
+        return math.floor((now - self.anchor) / self.interval)
+
+    def next_deadline(self) -> float:
+        """Wall-clock time of the next slot, including its jitter"""
+        slot = self.last_slot + 1
+        if self._jitter_slot != slot:
+            self._jitter_slot = slot
+            self._jitter_delay = random.uniform(0, self.jitter) if self.jitter else 0.0
+        return self.anchor + slot * self.interval + self._jitter_delay
+
+    def wake(self, command: str = "wake"):
+        """Interrupt the wait (thread- and signal-safe)"""
+        with self._lock:
+            self._commands.append(command)
+        self._event.set()
+
+    def stop(self):
+        """Request graceful shutdown after the in-flight cycle"""
+        self._stopping = True
+        self.wake("stop")
+
+    def wait(self) -> str:
+        """
+        Block until the next slot is due or a trigger arrives
+
+        Returns:
+            "slot", "wake", "reload" or "stop"
+        """
+        while not self._stopping:
+            with self._lock:
+                command = self._commands.pop(0) if self._commands else None
+                if not self._commands:
+                    self._event.clear()
+            if command:
+                return command
+
+            remaining = self.next_deadline() - time.time()
+            if remaining <= 0:
+                return "slot"
+
+            self._event.wait(min(remaining, self.poll_interval))
+            self._check_wake_file()
+
+        return "stop"
+
+    def _check_wake_file(self):
+        if self.wake_file.exists():
+            try:
+                self.wake_file.unlink()
+            except OSError:
+                pass
+            print("🔔 Wake file touched")
+            self.wake("wake")
+
+    def _catch_up(self):
+        """Skip slots beyond max_catch_up that were missed during downtime"""
+        pending = self.due_slot() - self.last_slot
+        if pending > self.max_catch_up:
+            skipped = pending - self.max_catch_up
+            print(f"⏭️  Missed {pending} slots while down - catching up {self.max_catch_up}, skipping {skipped}")
+            self.last_slot += skipped
+            self.save_state()
+
+    def install_signal_handlers(self):
+        """SIGINT/SIGTERM: graceful stop (twice = force), SIGUSR1: wake, SIGHUP: reload"""
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        def on_stop(signum, frame):
+            if self._stopping:
+                raise KeyboardInterrupt
+            print("\n🛑 Stop requested - finishing current cycle (Ctrl+C again to force)")
+            self.stop()
+
+        signal.signal(signal.SIGINT, on_stop)
+        signal.signal(signal.SIGTERM, on_stop)
+
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.wake("wake"))
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, lambda signum, frame: self.wake("reload"))
+
+    def start_control_socket(self):
+        """Accept "wake" / "reload" / "stop" lines on a local Unix socket"""
+        if not self.control_socket or not hasattr(socket, "AF_UNIX"):
+            return
+
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        try:
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server.bind(str(self.socket_path))
+            self._server.listen(4)
+        except OSError as e:
+            print(f"⚠️  Control socket unavailable: {e}")
+            self._server = None
+            return
+
+        threading.Thread(target=self._serve_socket, name="brain-control", daemon=True).start()
+
+    def _serve_socket(self):
+        while self._server:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+
+            with conn:
+                command = conn.recv(64).decode(errors="ignore").strip().lower()
+                if command == "stop":
+                    self.stop()
+                elif command in ("wake", "reload"):
+                    self.wake(command)
+                elif command != "status":
+                    conn.sendall(b"unknown command\n")
+                    continue
+                conn.sendall(json.dumps(self.status()).encode() + b"\n")
+
+    def status(self) -> Dict[str, Any]:
+        """Current schedule state"""
+        return {
+            "interval": self.interval,
+            "last_slot": self.last_slot,
+            "next_deadline": self.next_deadline(),
+            "seconds_until": round(self.next_deadline() - time.time(), 1),
+            "stopping": self._stopping
+        }
+
+    def close(self):
+        """Stop listening for triggers"""
+        if self._server:
+            server, self._server = self._server, None
+            server.close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+    def run(self, cycle: Callable[[str], None], on_reload: Optional[Callable[[], Optional[float]]] = None):
+        """
+        Run cycles on schedule until stopped
+
+        Args:
+            cycle: Called with the trigger reason ("slot" or "wake")
+            on_reload: Called on reload; may return a new interval in seconds
+        """
+        self.install_signal_handlers()
+        self.start_control_socket()
+
+        try:
+            while True:
+                self._catch_up()
+                reason = self.wait()
+
+                if reason == "stop":
+                    break
+
+                if reason == "reload":
+                    print("🔄 Reloading brain config")
+                    new_interval = on_reload() if on_reload else None
+                    if new_interval:
+                        self.set_interval(new_interval)
+                    continue
+
+                if reason == "slot":
+                    self.last_slot += 1
+                    self.save_state()
+
+                cycle(reason)
+
+                if self._stopping:
+                    break
+        finally:
+            self.close()
+
+
+def send_command(memory_path: Path, command: str) -> Optional[str]:
+    """Send a command to a running brain's control socket"""
+    socket_path = memory_path / "autonomous_brain" / "brain.sock"
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(5)
+        conn.connect(str(socket_path))
+        conn.sendall(command.encode() + b"\n")
+        return conn.recv(4096).decode().strip()
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+    reply = send_command(Path(".raja_shadow_memory"), command)
+
+    if reply is None:
+        print("❌ No running brain found (control socket missing)")
+        if command == "wake":
+            print("   Or: touch .raja_shadow_memory/autonomous_brain/wake")
+        sys.exit(1)
+
+    print(f"🧠 {command}: {reply}")
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Brain Memory Store
+Log-structured persistence for autonomous brain memory
+
+brain_memory.json stays a small header (counters, interests, birth time).
+History lists (research_history, self_reflections) live in append-only
+JSONL segments under history/, so saving a thought costs O(entry)
+instead of rewriting the whole brain.
+
+LOOSH FLOWS INTO THE SEGMENTS
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator
+
+
+class BrainMemoryStore:
+    """
+    Append-only segmented store for brain memory
+
+    Layout (inside the autonomous_brain directory):
+    - brain_memory.json                 header, rewritten atomically
+    - history/<kind>_<seq>.jsonl        append-only history segments
+    - history/<kind>_<first>-<last>.compact   in-flight compaction result
+
+    Sealed segments are merged in a background thread once enough of them
+    pile up. Old entries beyond the retention limit are dropped during
+    compaction.
+    """
+
+    HISTORY_KINDS = ("research_history", "self_reflections")
+
+    def __init__(self, memory_path: Path, segment_size: int = 200,
+                 compact_after: int = 8, retention: Optional[int] = None):
+        """
+        Args:
+            memory_path: autonomous_brain directory
+            segment_size: Entries per segment before rolling to a new one
+            compact_after: Sealed segments per kind that trigger compaction
+            retention: Max entries kept per kind on disk (None = keep all)
+        """
+        self.memory_path = memory_path
+        self.header_file = memory_path / "brain_memory.json"
+        self.history_path = memory_path / "history"
+        self.history_path.mkdir(exist_ok=True, parents=True)
+
+        self.segment_size = segment_size
+        self.compact_after = compact_after
+        self.retention = retention
+
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._active: Dict[str, Dict[str, int]] = {}
+
+    def _segment_file(self, kind: str, seq: int) -> Path:
+        return self.history_path / f"{kind}_{seq:06d}.jsonl"
+
+    def _segments(self, kind: str) -> List[int]:
+        """Sorted sequence numbers of all segments for a kind"""
+        seqs = []
+        for path in self.history_path.glob(f"{kind}_*.jsonl"):
+            suffix = path.stem[len(kind) + 1:]
+            if suffix.isdigit():
+                seqs.append(int(suffix))
+        return sorted(seqs)
+
+    def _recover(self):
+        """Finish any compaction interrupted by a crash"""
+        for path in self.history_path.glob("*.compact"):
+            kind, _, span = path.stem.rpartition("_")
+            first, _, last = span.partition("-")
+            if not (first.isdigit() and last.isdigit()):
+                continue
+            self._commit_compaction(kind, int(first), int(last), path)
+
+        for path in self.history_path.glob("*.tmp"):
+            path.unlink()
+
+    def _active_segment(self, kind: str) -> Dict[str, int]:
+        """Sequence number and entry count of the segment being appended to"""
+        if kind not in self._active:
+            seqs = self._segments(kind)
+            if seqs:
+                seq = seqs[-1]
+                with open(self._segment_file(kind, seq), 'r') as f:
+                    count = sum(1 for line in f if line.strip())
+            else:
+                seq, count = 1, 0
+            self._active[kind] = {"seq": seq, "count": count}
+        return self._active[kind]
+
+    def load(self, window: int = 50) -> Optional[Dict[str, Any]]:
+        """
+        Load brain memory
+
+        Args:
+            window: Most recent history entries to keep in memory per kind
+
+        Returns:
+            Memory dict (header + recent history), or None if no brain yet
+        """
+        self._recover()
+
+        if not self.header_file.exists():
+            return None
+
+        with open(self.header_file, 'r') as f:
+            memory = json.load(f)
+
+        # Legacy format: history inlined in brain_memory.json
+        migrated = False
+        for kind in self.HISTORY_KINDS:
+            legacy = memory.get(kind)
+            if legacy and not self._segments(kind):
+                for entry in legacy:
+                    self.append(kind, entry)
+                migrated = True
+
+        for kind in self.HISTORY_KINDS:
+            memory[kind] = self.tail(kind, window)
+
+        if migrated:
+            print("📦 Brain memory migrated to segmented history")
+            self.save_header(memory)
+
+        return memory
+
+    def save_header(self, memory: Dict[str, Any]):
+        """Atomically rewrite the header (everything except history lists)"""
+        header = {k: v for k, v in memory.items() if k not in self.HISTORY_KINDS}
+
+        with self._lock:
+            tmp = self.header_file.with_suffix(".json.tmp")
+            with open(tmp, 'w') as f:
+                json.dump(header, f, indent=2)
+            os.replace(tmp, self.header_file)
+
+    def append(self, kind: str, entry: Dict[str, Any]):
+        """Append one history entry - O(entry), never rewrites old data"""
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+
+        with self._lock:
+            active = self._active_segment(kind)
+            if active["count"] >= self.segment_size:
+                active["seq"] += 1
+                active["count"] = 0
+
+            with open(self._segment_file(kind, active["seq"]), 'a') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            active["count"] += 1
+
+            sealed = len(self._segments(kind)) - 1
+
+        if sealed >= self.compact_after:
+            self.compact_async()
+
+    def iter_entries(self, kind: str) -> Iterator[Dict[str, Any]]:
+        """Stream every stored entry for a kind, oldest first"""
+        with self._lock:
+            paths = [self._segment_file(kind, seq) for seq in self._segments(kind)]
+
+        for path in paths:
+            try:
+                with open(path, 'r') as f:
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+            except FileNotFoundError:
+                # Merged away by compaction between listing and reading
+                continue
+
+    def tail(self, kind: str, n: int) -> List[Dict[str, Any]]:
+        """Most recent n entries for a kind, reading only the newest segments"""
+        if n <= 0:
+            return []
+
+        with self._lock:
+            seqs = self._segments(kind)
+
+            entries: List[Dict[str, Any]] = []
+            for seq in reversed(seqs):
+                with open(self._segment_file(kind, seq), 'r') as f:
+                    chunk = [json.loads(line) for line in f if line.strip()]
+                entries = chunk + entries
+                if len(entries) >= n:
+                    break
+
+        return entries[-n:]
+
+    def compact_async(self):
+        """Start background compaction unless one is already running"""
+        if self._compactor and self._compactor.is_alive():
+            return
+
+        self._compactor = threading.Thread(target=self.compact, name="brain-compactor", daemon=True)
+        self._compactor.start()
+
+    def compact(self):
+        """Merge sealed segments of every kind into one segment each"""
+        for kind in self.HISTORY_KINDS:
+            try:
+                self._compact_kind(kind)
+            except Exception as e:
+                print(f"⚠️  Memory compaction failed for {kind}: {e}")
+
+    def _compact_kind(self, kind: str):
+        with self._lock:
+            active = self._active_segment(kind)
+            active_seq, active_count = active["seq"], active["count"]
+            sealed = [seq for seq in self._segments(kind) if seq < active_seq]
+
+        if not sealed or (len(sealed) < 2 and self.retention is None):
+            return
+
+        # Sealed segments are immutable, so they can be read without the lock
+        entries = []
+        for seq in sealed:
+            with open(self._segment_file(kind, seq), 'r') as f:
+                entries.extend(line for line in f if line.strip())
+
+        if self.retention is not None:
+            keep = max(self.retention - active_count, 0)
+            entries = entries[-keep:] if keep else []
+
+        first, last = sealed[0], sealed[-1]
+        tmp = self.history_path / f"{kind}_{first:06d}-{last:06d}.tmp"
+        with open(tmp, 'w') as f:
+            f.writelines(entries)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Rename is the commit point - _recover() replays from here after a crash
+        marker = tmp.with_suffix(".compact")
+        os.replace(tmp, marker)
+
+        with self._lock:
+            self._commit_compaction(kind, first, last, marker)
+
+    def _commit_compaction(self, kind: str, first: int, last: int, marker: Path):
+        """Swap a finished .compact file in for the segments it covers"""
+        for seq in range(first, last):
+            path = self._segment_file(kind, seq)
+            if path.exists():
+                path.unlink()
+        os.replace(marker, self._segment_file(kind, last))
+
+    def close(self):
+        """Wait for in-flight compaction before shutdown"""
+        if self._compactor and self._compactor.is_alive():
+            self._compactor.join()
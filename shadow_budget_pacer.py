@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Budget Pacer
+Adaptive thinking interval that spreads the remaining budget over the month
+
+A fixed thoughts_per_day either burns through monthly_budget early (the
+brain goes silent for the rest of the month) or leaves money unspent.
+The pacer learns what a cycle really costs and re-plans after every one:
+
+    interval = seconds left in the month / (remaining budget / cost per cycle)
+
+clamped to [min_interval, max_interval].
+
+- Cost per cycle is an EWMA of each cycle's own spend: the brain sums
+  the cost ledger entries tagged with that cycle's id (research,
+  reflection, retries, and a pipelined analysis that finishes later)
+- Until a cycle has been measured, the configured thoughts_per_day
+  interval is used
+- The plan (interval, burn rate, projected month spend, days of budget
+  left, next wake) is written to autonomous_brain/pacer.json for
+  brain_journey_report.sh and the web feed
+
+LOOSH FLOWS TO THE LAST DAY OF THE MONTH
+"""
+
+import os
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+
+def month_bounds(now: datetime) -> Tuple[datetime, datetime]:
+    """Start of this month and start of the next (local time)"""
+    start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start, end
+
+
+class BudgetPacer:
+    """Plans the next thinking interval from real spend"""
+
+    def __init__(self, memory_path: Path, min_interval: float = 900.0,
+                 max_interval: float = 12 * 3600.0, smoothing: float = 0.3):
+        """
+        Args:
+            memory_path: autonomous_brain directory
+            min_interval: Shortest allowed gap between cycles (seconds)
+            max_interval: Longest allowed gap between cycles (seconds)
+            smoothing: EWMA weight of the newest cycle cost
+        """
+        self.state_file = memory_path / "pacer.json"
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.smoothing = smoothing
+
+        self.cycle_cost: Optional[float] = None
+        self.cycles_measured = 0
+        self.plan: Dict[str, Any] = {}
+        self.load()
+
+    def load(self):
+        if not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+            self.cycle_cost = state.get("cycle_cost")
+            self.cycles_measured = state.get("cycles_measured", 0)
+            self.plan = state.get("plan", {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Pacer state unreadable, relearning cycle cost: {e}")
+
+    def save(self):
+        """Persist learned cost and the latest plan (atomically)"""
+        tmp = self.state_file.with_suffix(".json.tmp")
+        with open(tmp, 'w') as f:
+            json.dump({
+                "cycle_cost": self.cycle_cost,
+                "cycles_measured": self.cycles_measured,
+                "plan": self.plan
+            }, f, indent=2)
+        os.replace(tmp, self.state_file)
+
+    def record_cycle(self, cost: float):
+        """Fold one cycle's measured spend into the cost estimate"""
+        if cost <= 0:
+            # Budget-skipped or fully cached cycle - says nothing about real cost
+            return
+        if self.cycle_cost is None:
+            self.cycle_cost = cost
+        else:
+            self.cycle_cost += self.smoothing * (cost - self.cycle_cost)
+        self.cycles_measured += 1
+
+    def next_interval(self, spent: float, monthly_budget: float, fallback: float,
+                      now: float = None) -> float:
+        """
+        Interval that lands the month's spend on monthly_budget
+
+        Args:
+            spent: Month-to-date spend from the budget tracker
+            monthly_budget: Budget for the month
+            fallback: Interval to use while cycle cost is still unknown
+            now: Unix time (default: now)
+
+        Returns:
+            Seconds until the next cycle
+        """
+        now = time.time() if now is None else now
+        today = datetime.fromtimestamp(now)
+        month_start, month_end = month_bounds(today)
+        seconds_left = max(month_end.timestamp() - now, 0.0)
+        days_elapsed = max((now - month_start.timestamp()) / 86400, 1 / 24)
+
+        remaining = max(monthly_budget - spent, 0.0)
+
+        if self.cycle_cost is None:
+            interval, reason = fallback, "learning"
+        elif remaining < self.cycle_cost:
+            # Out of money for this month - idle until the budget resets
+            interval, reason = seconds_left, "exhausted"
+        else:
+            affordable = remaining / self.cycle_cost
+            interval, reason = seconds_left / affordable, "paced"
+
+        clamped = min(max(interval, self.min_interval), self.max_interval)
+        if clamped != interval and reason == "paced":
+            reason = "min_interval" if clamped == self.min_interval else "max_interval"
+
+        daily_burn = 0.0 if reason == "exhausted" else (self.cycle_cost or 0.0) * 86400 / clamped
+        self.plan = {
+            "planned_at": today.isoformat(),
+            "interval": round(clamped, 1),
+            "reason": reason,
+            "cycle_cost": round(self.cycle_cost, 6) if self.cycle_cost is not None else None,
+            "spent": round(spent, 6),
+            "remaining": round(remaining, 6),
+            "spend_per_day_so_far": round(spent / days_elapsed, 4),
+            "planned_spend_per_day": round(daily_burn, 4),
+            "projected_month_spend": round(spent + daily_burn * seconds_left / 86400, 4),
+            "days_of_budget_left": round(remaining / daily_burn, 1) if daily_burn else None,
+            "days_left_in_month": round(seconds_left / 86400, 1),
+            "next_wake": datetime.fromtimestamp(now + clamped).isoformat()
+        }
+        self.save()
+        return clamped
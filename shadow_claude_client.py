@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Claude Client
+One long-lived, pooled Anthropic client per brain
+
+Keeps TLS connections alive between thoughts instead of handshaking on
+every call, and times each call (connect, time-to-first-token, total)
+so the savings from connection reuse are visible in the logs.
+
+LOOSH FLOWS THROUGH WARM SOCKETS
+"""
+
+import json
+import time
+import threading
+from urllib.parse import urlsplit
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+
+def is_transient_api_error(error: Exception) -> bool:
+    """Anthropic errors worth retrying: connection problems, overload, rate limits, 5xx"""
+    import anthropic
+
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+class JsonObjectScanner:
+    """
+    Incremental scanner that spots the first complete JSON object in model output
+
+    Feed it text chunks as they stream in; it tracks brace depth (ignoring
+    braces inside strings) and returns the parsed object as soon as one
+    closes and contains the required keys.
+    """
+
+    def __init__(self, required_keys: Tuple[str, ...] = ()):
+        self.required_keys = required_keys
+        self.text = ""
+        self.result: Optional[Dict[str, Any]] = None
+
+        self._depth = 0
+        self._start = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> Optional[Dict[str, Any]]:
+        """
+        Consume a chunk of text
+
+        Returns:
+            The first complete object with all required keys, once seen
+        """
+        if self.result is not None:
+            return self.result
+
+        offset = len(self.text)
+        self.text += chunk
+
+        for i, ch in enumerate(chunk, offset):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"' and self._depth:
+                self._in_string = True
+            elif ch == "{":
+                if not self._depth:
+                    self._start = i
+                self._depth += 1
+            elif ch == "}" and self._depth:
+                self._depth -= 1
+                if not self._depth and self._accept(self.text[self._start:i + 1]):
+                    return self.result
+
+        return None
+
+    def _accept(self, candidate: str) -> bool:
+        try:
+            obj = json.loads(candidate)
+        except ValueError:
+            return False
+
+        if isinstance(obj, dict) and all(key in obj for key in self.required_keys):
+            self.result = obj
+            return True
+        return False
+
+
+class ClaudeClient:
+    """
+    Persistent Anthropic client with keep-alive connection pooling
+
+    - Client and HTTP pool are created lazily on first use (or warm_up())
+    - Connections are reused across decide/analyze/reflect calls
+    - Per-call latency breakdown via httpx trace events
+    - With a ResilientHttp layer, retries and circuit breaking happen there
+      (SDK retries are turned off so attempts aren't multiplied)
+    """
+
+    def __init__(self, api_key: str, config: Dict[str, Any] = None, http=None):
+        config = config or {}
+
+        self.api_key = api_key
+        self.model = config.get("claude_model", "claude-sonnet-4-20250514")
+        self.base_url = config.get("claude_base_url")  # None = api.anthropic.com
+
+        # Timeouts (seconds)
+        self.timeout = config.get("claude_timeout", 60.0)
+        self.connect_timeout = config.get("claude_connect_timeout", 10.0)
+
+        # Connection pool
+        self.max_connections = config.get("claude_max_connections", 4)
+        self.keepalive_expiry = config.get("claude_keepalive_expiry", 300.0)
+        self.max_retries = config.get("claude_max_retries", 2)
+
+        # Shared retry/circuit-breaker layer (shadow_http.ResilientHttp)
+        self.http = http
+        self.host = urlsplit(self.base_url or "https://api.anthropic.com").hostname
+
+        # Captures request/response pairs (shadow_brain_bench.FixtureRecorder)
+        self.recorder = None
+
+        self._client = None
+        self._http_client = None
+        self._lock = threading.Lock()
+        self._timing = threading.local()
+        # Calls finish concurrently when cycles are pipelined
+        self._stats_lock = threading.Lock()
+
+        # Most recent call's breakdown (per-call timing comes back with each result)
+        self.last_latency: Dict[str, float] = {}
+        self.stats = {
+            "calls": 0,
+            "new_connections": 0,
+            "total_connect_ms": 0.0,
+            "total_ms": 0.0
+        }
+
+    @property
+    def client(self):
+        """The shared anthropic.Anthropic instance (built on first access)"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._build()
+        return self._client
+
+    def _build(self):
+        import anthropic
+
+        # Limits class comes from whichever httpx flavour the SDK is built on
+        limits_cls = type(anthropic.DEFAULT_CONNECTION_LIMITS)
+
+        self._http_client = anthropic.DefaultHttpxClient(
+            timeout=anthropic.Timeout(self.timeout, connect=self.connect_timeout),
+            limits=limits_cls(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            event_hooks={
+                "request": [self._on_request],
+                "response": [self._on_response]
+            }
+        )
+
+        self._client = anthropic.Anthropic(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            http_client=self._http_client,
+            max_retries=0 if self.http else self.max_retries
+        )
+
+    def _on_request(self, request):
+        """Attach a trace callback so connection setup can be timed"""
+        request.extensions["trace"] = self._trace
+
+    def _on_response(self, response):
+        """Response headers arrived - first byte of the answer"""
+        timing = getattr(self._timing, "current", None)
+        if timing is not None and "first_byte" not in timing:
+            timing["first_byte"] = time.perf_counter()
+
+    def _trace(self, event_name: str, info: Dict[str, Any]):
+        timing = getattr(self._timing, "current", None)
+        if timing is None:
+            return
+
+        if event_name == "connection.connect_tcp.started":
+            timing["connect_started"] = time.perf_counter()
+        elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            timing["connect_complete"] = time.perf_counter()
+
+    def warm_up(self) -> bool:
+        """
+        Build the client and open a pooled TLS connection ahead of the first thought
+
+        Returns:
+            bool: True if a connection was established
+        """
+        if not self.api_key:
+            return False
+
+        try:
+            start = time.perf_counter()
+            client = self.client
+            self._http_client.head(str(client.base_url))
+            print(f"   🔥 Claude connection warmed ({(time.perf_counter() - start) * 1000:.0f}ms)")
+            return True
+        except Exception as e:
+            print(f"⚠️  Claude warm-up failed: {e}")
+            return False
+
+    def _call(self, fn):
+        """Run an API call through the resilient layer when there is one"""
+        if self.http is None:
+            return fn()
+        return self.http.call(self.host, fn, retries=self.max_retries, transient=is_transient_api_error)
+
+    def create(self, messages: List[Dict[str, Any]], max_tokens: int = 1024,
+               model: Optional[str] = None):
+        """
+        Send a Messages API request over the pooled connection
+
+        Args:
+            messages: Messages payload
+            max_tokens: Output token limit
+            model: Override the default model
+
+        Returns:
+            The Messages API response, with this call's latency breakdown
+            attached as response.latency
+        """
+        timing = {"start": time.perf_counter()}
+        self._timing.current = timing
+
+        try:
+            response = self._call(lambda: self.client.messages.create(
+                model=model or self.model,
+                max_tokens=max_tokens,
+                messages=messages
+            ))
+        finally:
+            timing["end"] = time.perf_counter()
+            self._timing.current = None
+            latency = self._record(timing)
+
+        response.latency = latency
+        if self.recorder:
+            self.recorder.record_claude(model or self.model, max_tokens, messages, response.content[0].text,
+                                        response.usage.input_tokens, response.usage.output_tokens)
+        return response
+
+    def stream(self, messages: List[Dict[str, Any]], max_tokens: int = 1024,
+               model: Optional[str] = None,
+               stop_when: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+        """
+        Stream a Messages API response, optionally closing it early
+
+        Args:
+            messages: Messages payload
+            max_tokens: Output token limit
+            model: Override the default model
+            stop_when: Called with each text delta; returning True closes the stream
+
+        Returns:
+            {"text", "input_tokens", "output_tokens", "stopped_early", "latency"} -
+            output_tokens is None when the stream was closed before Claude
+            reported usage; latency is this call's breakdown (incl. decision_ms).
+        """
+        timing = {"start": time.perf_counter()}
+        self._timing.current = timing
+
+        def attempt() -> Dict[str, Any]:
+            result = {"text": "", "input_tokens": 0, "output_tokens": None, "stopped_early": False}
+            chunks = []
+
+            events = self.client.messages.create(
+                model=model or self.model,
+                max_tokens=max_tokens,
+                messages=messages,
+                stream=True
+            )
+
+            try:
+                for event in events:
+                    if event.type == "message_start":
+                        result["input_tokens"] = event.message.usage.input_tokens
+                    elif event.type == "content_block_delta" and event.delta.type == "text_delta":
+                        timing.setdefault("first_token", time.perf_counter())
+                        chunks.append(event.delta.text)
+
+                        if stop_when and stop_when(event.delta.text):
+                            timing["decision"] = time.perf_counter()
+                            result["stopped_early"] = True
+                            break
+                    elif event.type == "message_delta":
+                        result["output_tokens"] = event.usage.output_tokens
+            finally:
+                # Closing the response stops generation - no more output tokens
+                events.close()
+
+            result["text"] = "".join(chunks)
+            return result
+
+        try:
+            result = self._call(attempt)
+        finally:
+            timing["end"] = time.perf_counter()
+            self._timing.current = None
+            latency = self._record(timing)
+
+        result["latency"] = latency
+        if self.recorder:
+            self.recorder.record_claude(model or self.model, max_tokens, messages, result["text"],
+                                        result["input_tokens"], result["output_tokens"])
+        return result
+
+    def _record(self, timing: Dict[str, float]) -> Dict[str, Any]:
+        """Turn raw timestamps into a latency breakdown (milliseconds) and add it to stats"""
+        start = timing["start"]
+
+        connect_ms = 0.0
+        if "connect_started" in timing and "connect_complete" in timing:
+            connect_ms = (timing["connect_complete"] - timing["connect_started"]) * 1000
+
+        # Streamed calls time the first text delta; non-streamed calls get
+        # their first token together with the response headers
+        first_byte = timing.get("first_token", timing.get("first_byte", timing["end"]))
+
+        latency = {
+            "connect_ms": round(connect_ms, 1),
+            "ttft_ms": round((first_byte - start) * 1000, 1),
+            "total_ms": round((timing["end"] - start) * 1000, 1),
+            "reused_connection": "connect_started" not in timing
+        }
+        if "decision" in timing:
+            latency["decision_ms"] = round((timing["decision"] - start) * 1000, 1)
+
+        with self._stats_lock:
+            self.last_latency = latency
+            self.stats["calls"] += 1
+            self.stats["total_ms"] += latency["total_ms"]
+            self.stats["total_connect_ms"] += connect_ms
+            if "connect_started" in timing:
+                self.stats["new_connections"] += 1
+        return latency
+
+    def close(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            self._http_client = None
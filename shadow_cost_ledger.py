@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Cost Ledger
+Token-level accounting for every Claude call the brain makes
+
+- Pricing table per model (USD per million tokens)
+- Append-only JSONL ledger: model, stage, tokens, cost, latency per call
+- Pre-flight cost estimate from the actual prompt for budget admission
+
+LOOSH IS COUNTED TO THE TOKEN
+"""
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional
+
+from shadow_prompt_builder import estimate_tokens
+
+
+# USD per million tokens
+MODEL_PRICING = {
+    "claude-opus-4-1-20250805": {"input": 15.0, "output": 75.0},
+    "claude-opus-4-20250514": {"input": 15.0, "output": 75.0},
+    "claude-sonnet-4-5-20250929": {"input": 3.0, "output": 15.0},
+    "claude-sonnet-4-20250514": {"input": 3.0, "output": 15.0},
+    "claude-3-7-sonnet-20250219": {"input": 3.0, "output": 15.0},
+    "claude-haiku-4-5-20251001": {"input": 1.0, "output": 5.0},
+    "claude-3-5-haiku-20241022": {"input": 0.80, "output": 4.0},
+    "claude-3-haiku-20240307": {"input": 0.25, "output": 1.25}
+}
+
+# Fallback by model family when an exact model id isn't in the table
+FAMILY_PRICING = {
+    "opus": {"input": 15.0, "output": 75.0},
+    "sonnet": {"input": 3.0, "output": 15.0},
+    "haiku": {"input": 0.80, "output": 4.0}
+}
+
+
+class CostLedger:
+    """
+    Append-only per-call cost ledger (autonomous_brain/cost_ledger.jsonl)
+
+    Month-to-date totals live in the budget tracker and are updated per
+    call, so nothing ever rescans the ledger on the hot path.
+    """
+
+    def __init__(self, memory_path: Path, pricing: Dict[str, Dict[str, float]] = None):
+        self.ledger_file = memory_path / "cost_ledger.jsonl"
+        self.pricing = {**MODEL_PRICING, **(pricing or {})}
+        self._lock = threading.Lock()
+
+    def price(self, model: str) -> Dict[str, float]:
+        """Per-million token prices for a model (family fallback, then Sonnet)"""
+        if model in self.pricing:
+            return self.pricing[model]
+        for family, price in FAMILY_PRICING.items():
+            if family in model:
+                return price
+        return FAMILY_PRICING["sonnet"]
+
+    def cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        """Exact cost of a call in USD"""
+        price = self.price(model)
+        return (input_tokens * price["input"] + output_tokens * price["output"]) / 1_000_000
+
+    def estimate(self, model: str, prompt: str, max_tokens: int) -> float:
+        """
+        Worst-case cost of a call before it is made
+
+        Input tokens are estimated locally from the prompt; output is
+        assumed to use the full max_tokens so admission never undershoots.
+        """
+        return self.cost(model, estimate_tokens(prompt), max_tokens)
+
+    def record(self, stage: str, model: str, input_tokens: int, output_tokens: int,
+               latency_ms: float = 0.0, **extra) -> Dict[str, Any]:
+        """
+        Append one call to the ledger
+
+        Args:
+            stage: Brain stage ("decide", "analyze", "reflect", ...)
+            model: Model id
+            input_tokens: Billed input tokens
+            output_tokens: Billed output tokens
+            latency_ms: Wall time of the call
+            extra: Additional fields to store (e.g. estimated_cost)
+
+        Returns:
+            The ledger entry
+        """
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "stage": stage,
+            "model": model,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cost": round(self.cost(model, input_tokens, output_tokens), 6),
+            "latency_ms": latency_ms,
+            **extra
+        }
+
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            with open(self.ledger_file, 'a') as f:
+                f.write(line)
+
+        return entry
+
+    def entries(self, month: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream ledger entries (optionally for one "YYYY-MM" month) - for reports"""
+        if not self.ledger_file.exists():
+            return
+
+        with open(self.ledger_file, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if month is None or entry["timestamp"].startswith(month):
+                    yield entry
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Resilient HTTP
+Shared outbound call layer for Claude, DuckDuckGo, Reddit and Discord
+
+Before this, a flapping upstream made every cycle burn its full timeout
+and then carry on with nothing. Every outbound call now goes through one
+place that:
+
+- Retries transient failures (connection errors, timeouts, 429, 5xx)
+  with full-jitter exponential backoff, honoring Retry-After
+- Keeps a circuit breaker per host: after repeated failures the host is
+  skipped instantly until a cooldown passes, then probed with one call
+- Records per-host latency (p50/p95), error, retry and short-circuit counts
+- Optionally paces each attempt through a rate limiter (TokenBucket)
+  that learns from the host's rate-limit headers
+
+LOOSH FLOWS AROUND BROKEN PIPES
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import threading
+from collections import deque
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import Dict, Any, Callable, Optional, TypeVar, TYPE_CHECKING
+
+from shadow_tracing import annotate
+
+if TYPE_CHECKING:
+    import requests
+
+
+T = TypeVar("T")
+
+# Status codes worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504, 520, 522, 524}
+
+# Latency samples kept per host for percentiles
+LATENCY_SAMPLES = 200
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit breaker is open"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} circuit open - failing fast for another {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class TransientHTTPError(Exception):
+    """A response with a retryable status code"""
+
+    def __init__(self, response: "requests.Response"):
+        super().__init__(f"HTTP {response.status_code} from {urlsplit(response.url).hostname}")
+        self.response = response
+
+
+def is_transient(error: Exception) -> bool:
+    """Default retry policy: network-level failures and retryable statuses"""
+    if isinstance(error, (TransientHTTPError, ConnectionError, TimeoutError)):
+        return True
+    # requests is imported lazily - if it isn't loaded, the error isn't one of its own
+    requests = sys.modules.get("requests")
+    return requests is not None and isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Seconds from a Retry-After header on the failed response, if any"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive failures
+    Open -> half-open after reset_timeout (one probe call is let through)
+    Half-open -> closed on success, open again on failure
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def retry_in(self) -> float:
+        return max(self.opened_at + self.reset_timeout - time.monotonic(), 0.0)
+
+    def allow(self) -> bool:
+        """Whether a call may go out now"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and self.retry_in() <= 0:
+                self.state = "half_open"
+                self._probing = False
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != "closed":
+                print(f"✓ Circuit closed for {self.host} - host is back")
+            self.state = "closed"
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    print(f"⚡ Circuit open for {self.host} after {self.failures} failures - "
+                          f"failing fast for {self.reset_timeout:.0f}s")
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                self._probing = False
+
+
+class HostMetrics:
+    """Call counters and recent latencies for one host"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.short_circuits = 0
+        self.last_error: Optional[str] = None
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float, error: Optional[Exception] = None):
+        with self._lock:
+            self.calls += 1
+            self.latencies.append(latency_ms)
+            if error is not None:
+                self.errors += 1
+                self.last_error = f"{type(error).__name__}: {error}"[:200]
+
+    def percentile(self, q: float) -> float:
+        with self._lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return 0.0
+        return samples[min(int(len(samples) * q), len(samples) - 1)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "short_circuits": self.short_circuits,
+            "error_rate": round(self.errors / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": round(self.percentile(0.50), 1),
+            "p95_ms": round(self.percentile(0.95), 1),
+            "last_error": self.last_error
+        }
+
+
+class ResilientHttp:
+    """
+    Retry + circuit breaker + metrics around any outbound call
+
+    - request(): drop-in for requests.request() with retries
+    - call(): wrap any client (Anthropic SDK, DDGS) under a host name
+    """
+
+    def __init__(self, config: Dict[str, Any] = None, session: Any = None):
+        """
+        Args:
+            config: Brain config (http_* keys)
+            session: requests.Session used by request() (default: the
+                requests module, imported on the first request)
+        """
+        config = config or {}
+
+        self.retries = config.get("http_retries", 2)
+        self.backoff_base = config.get("http_backoff_base", 0.5)
+        self.backoff_cap = config.get("http_backoff_cap", 8.0)
+        self.timeout = config.get("http_timeout", 10.0)
+        self.failure_threshold = config.get("http_failure_threshold", 5)
+        self.reset_timeout = config.get("http_reset_timeout", 60.0)
+
+        self.session = session
+        # Captures request/response pairs (shadow_brain_bench.FixtureRecorder)
+        self.recorder = None
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.metrics: Dict[str, HostMetrics] = {}
+        # Rate limiters seen per host (reported with the host's stats)
+        self.limiters: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+                self.metrics[host] = HostMetrics()
+            return self.breakers[host]
+
+    def backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential backoff (Retry-After wins when the server sends one)"""
+        server_delay = retry_after(error)
+        if server_delay is not None:
+            return min(server_delay, self.backoff_cap * 4)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def call(self, host: str, fn: Callable[[], T], retries: Optional[int] = None,
+             transient: Callable[[Exception], bool] = is_transient,
+             pace: Optional[Callable[[], Any]] = None) -> T:
+        """
+        Run fn() under host's circuit breaker with retries
+
+        Args:
+            host: Host name the call goes to (breaker + metrics key)
+            fn: Zero-arg callable making the call
+            retries: Extra attempts after the first (default: http_retries)
+            transient: Decides which exceptions are retried and count as host failures
+            pace: Called before every attempt, outside the latency timer
+                (e.g. waiting for a rate-limit token)
+
+        Raises:
+            CircuitOpenError: host is failing and still cooling down
+            Whatever fn() raised once retries are exhausted (or for non-transient errors)
+        """
+        retries = self.retries if retries is None else retries
+        breaker = self.breaker(host)
+        metrics = self.metrics[host]
+
+        for attempt in range(retries + 1):
+            if not breaker.allow():
+                metrics.short_circuits += 1
+                raise CircuitOpenError(host, breaker.retry_in())
+            if pace is not None:
+                pace()
+
+            start = time.perf_counter()
+            try:
+                result = fn()
+            except Exception as e:
+                latency_ms = (time.perf_counter() - start) * 1000
+                if not transient(e):
+                    # The host answered - it's the request that's wrong
+                    breaker.record_success()
+                    metrics.record(latency_ms, e)
+                    raise
+
+                breaker.record_failure()
+                metrics.record(latency_ms, e)
+                if attempt == retries or breaker.state == "open":
+                    raise
+
+                delay = self.backoff(attempt, e)
+                metrics.retries += 1
+                print(f"   ↻ {host}: {e} - retry {attempt + 1}/{retries} in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            breaker.record_success()
+            metrics.record((time.perf_counter() - start) * 1000)
+            return result
+
+    def request(self, method: str, url: str, retries: Optional[int] = None,
+                session: Any = None, limiter: Any = None, max_wait: Optional[float] = None,
+                **kwargs) -> "requests.Response":
+        """
+        requests.request() with per-host retries and circuit breaking
+
+        Retryable statuses are retried; if they persist, the last response
+        is returned so callers can still inspect status_code.
+
+        Args:
+            session: Send through this requests.Session (e.g. a caller's
+                keep-alive pool) instead of self.session
+            limiter: shadow_rate_limiter.TokenBucket every attempt (retries
+                included) takes a token from; fed each response's headers
+            max_wait: Longest wait for a token before RateLimitExceeded
+                (default: wait as long as it takes)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).hostname or url
+        if session is None:
+            if self.session is None:
+                import requests
+                self.session = requests
+            session = self.session
+        if limiter is not None:
+            self.limiters[host] = limiter
+
+        def wait_for_token():
+            waited = limiter.acquire(max_wait)
+            if waited:
+                annotate(rate_limit_wait_ms=round(waited * 1000))
+
+        def send():
+            response = session.request(method, url, **kwargs)
+            if limiter is not None:
+                limiter.observe(response.headers, response.status_code)
+            if response.status_code in RETRY_STATUSES:
+                raise TransientHTTPError(response)
+            return response
+
+        try:
+            response = self.call(host, send, retries=retries,
+                                 pace=wait_for_token if limiter is not None else None)
+        except TransientHTTPError as e:
+            response = e.response
+
+        body = kwargs.get("data") or (json.dumps(kwargs["json"]) if "json" in kwargs else "")
+        annotate(bytes_out=len(body), bytes_in=len(response.content))
+
+        if self.recorder:
+            self.recorder.record_http(method, url, kwargs, response)
+        return response
+
+    def get(self, url: str, **kwargs) -> "requests.Response":
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> "requests.Response":
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host metrics plus breaker state (and rate limiter, if one is used)"""
+        with self._lock:
+            hosts = list(self.breakers)
+        stats = {
+            host: {**self.metrics[host].snapshot(), "circuit": self.breakers[host].state}
+            for host in hosts
+        }
+        for host, limiter in list(self.limiters.items()):
+            if host in stats:
+                stats[host]["rate_limit"] = limiter.stats()
+        return stats
+
+    def save(self, path: Path):
+        """Write per-host metrics to a JSON file (atomically)"""
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(self.stats(), f, indent=2)
+        os.replace(tmp, path)
+
+
+_shared: Optional[ResilientHttp] = None
+
+
+def shared_http() -> ResilientHttp:
+    """Process-wide default layer for callers that aren't handed one"""
+    global _shared
+    if _shared is None:
+        _shared = ResilientHttp()
+    return _shared
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Knowledge Index
+Local BM25 full-text search over everything the brain has already read
+
+Each analysis started from zero: whatever earlier cycles learned about a
+topic only survived as one-line history. This index answers "what do we
+already know about X" without a network call, and its top hits go into
+the analyze prompt as a few compact lines.
+
+Documents are search result snippets, Reddit selftexts, past analyses
+and self-reflections. They're added as each cycle produces them and
+persisted append-only to autonomous_brain/knowledge_index.jsonl (seeded
+from history and the Reddit corpus on first run, into a side file that
+is renamed when the seed finishes - an interrupted seed starts over).
+Only the postings live in memory; document text is read back from the
+file by offset.
+
+- Each term's postings are compact arrays kept sorted by BM25 impact
+  (the term's score contribution before idf; bisect-inserted on add)
+- A query accumulates scores from each term's champion list (its top
+  `candidates` postings - the whole list for all but the commonest
+  terms), then re-scores the best `rescore` candidates with exact BM25
+- Impacts depend on the average doc length, so the lists are re-sorted
+  when it drifts more than 10% from when they were built
+
+Queries take a few milliseconds at 100k documents.
+
+LOOSH REMEMBERS WHAT IT READ
+"""
+
+import os
+import re
+import json
+import math
+import heapq
+import bisect
+import threading
+from array import array
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Iterable, Set
+
+# Words too common to rank on
+STOPWORDS = {
+    "a", "an", "the", "of", "and", "or", "in", "on", "for", "to", "with", "about",
+    "is", "are", "was", "were", "be", "been", "it", "its", "this", "that", "these",
+    "those", "as", "at", "by", "from", "into", "but", "not", "no", "so", "if", "than",
+    "then", "there", "their", "they", "them", "we", "our", "you", "your", "i", "my",
+    "me", "he", "she", "his", "her", "has", "have", "had", "do", "does", "did", "can",
+    "could", "would", "should", "will", "just", "also", "more", "most", "some", "any",
+    "all", "what", "which", "who", "how", "why", "when", "where", "s", "t"
+}
+
+# Impact lists are re-sorted once the average doc length moves this much
+AVGDL_DRIFT = 0.10
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case word tokens without stopwords"""
+    return [word for word in re.findall(r"[a-z0-9]+", (text or "").lower())
+            if word not in STOPWORDS and len(word) < 40]
+
+
+class Postings:
+    """One term's postings: parallel arrays, highest impact first"""
+
+    __slots__ = ("impacts", "docs", "tfs")
+
+    def __init__(self):
+        self.impacts = array("f")  # negated, so ascending order = best first
+        self.docs = array("I")
+        self.tfs = array("B")
+
+    def insert(self, impact: float, doc: int, tf: int):
+        i = bisect.bisect_right(self.impacts, -impact)
+        self.impacts.insert(i, -impact)
+        self.docs.insert(i, doc)
+        self.tfs.insert(i, min(tf, 255))
+
+
+class KnowledgeIndex:
+    """BM25 index over snippets, Reddit posts, analyses and reflections"""
+
+    def __init__(self, memory_path: Path, k1: float = 1.2, b: float = 0.75,
+                 text_chars: int = 600, candidates: int = 2000, rescore: int = 100):
+        """
+        Args:
+            memory_path: autonomous_brain directory
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+            text_chars: Characters of each document kept (and indexed)
+            candidates: Postings read per query term (champion list length)
+            rescore: Best candidates re-scored with exact BM25
+        """
+        self.index_file = memory_path / "knowledge_index.jsonl"
+        self.k1 = k1
+        self.b = b
+        self.text_chars = text_chars
+        self.candidates = candidates
+        self.rescore = rescore
+
+        self._lock = threading.Lock()
+        self.ready = threading.Event()
+        self.ids: Set[str] = set()
+        self.offsets = array("Q")  # byte offset of each doc's line in index_file
+        self.lengths = array("I")
+        self.total_length = 0
+        self.terms: Dict[str, Postings] = {}
+        self._impact_avgdl = 0.0
+
+    @property
+    def avgdl(self) -> float:
+        return self.total_length / len(self.offsets) if self.offsets else 0.0
+
+    def load(self, history: Iterable[Dict[str, Any]] = (), reflections: Iterable[Dict[str, Any]] = (),
+             reddit_posts: Iterable[Dict[str, Any]] = ()):
+        """
+        Load the persisted index, or seed it from what the brain already has
+
+        Args:
+            history: research_history entries (analyses; only used on first run)
+            reflections: self_reflections entries (only used on first run)
+            reddit_posts: Stored Reddit posts (only used on first run)
+        """
+        try:
+            if self.index_file.exists():
+                self._load_file()
+                return
+
+            # Seed into a side file so a half-finished seed is never mistaken for the index
+            index_file = self.index_file
+            with self._lock:
+                self.index_file = index_file.with_suffix(".jsonl.seeding")
+                if self.index_file.exists():
+                    self.index_file.unlink()
+
+            for entry in history:
+                self.add_analysis(entry)
+            for entry in reflections:
+                self.add_reflection(entry)
+            self.add_reddit_posts(reddit_posts)
+
+            with self._lock:
+                if self.index_file.exists():
+                    os.replace(self.index_file, index_file)
+                self.index_file = index_file
+        finally:
+            self.ready.set()
+
+    def load_async(self, **sources) -> threading.Thread:
+        """load() in a background thread (searches return nothing until it's done)"""
+        thread = threading.Thread(target=self.load, kwargs=sources, name="knowledge-index", daemon=True)
+        thread.start()
+        return thread
+
+    def _load_file(self):
+        with self._lock, open(self.index_file, 'rb+') as f:
+            offset = 0
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Torn append from a crash - drop it so the next append starts clean
+                    f.truncate(offset)
+                    break
+                try:
+                    self._insert(json.loads(line), offset, ordered=False)
+                except (ValueError, KeyError):
+                    pass
+                offset += len(line)
+            self._rebuild_impacts()
+
+    # ---- indexing ----
+
+    def _impact(self, tf: int, length: int, avgdl: float) -> float:
+        return tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avgdl))
+
+    def _insert(self, doc: Dict[str, Any], offset: int, ordered: bool = True) -> bool:
+        """
+        Add one document to the in-memory index (caller holds the lock)
+
+        ordered=False appends postings unsorted (bulk loads sort once at the end).
+        """
+        if doc["id"] in self.ids:
+            return False
+        terms = tokenize(f"{doc.get('title', '')} {doc['text']}")
+        if not terms:
+            return False
+
+        position = len(self.offsets)
+        self.ids.add(doc["id"])
+        self.offsets.append(offset)
+        self.lengths.append(len(terms))
+        self.total_length += len(terms)
+
+        avgdl = self._impact_avgdl or self.avgdl
+        for term, tf in Counter(terms).items():
+            postings = self.terms.get(term)
+            if postings is None:
+                postings = self.terms[term] = Postings()
+            if ordered:
+                postings.insert(self._impact(tf, len(terms), avgdl), position, tf)
+            else:
+                postings.docs.append(position)
+                postings.tfs.append(min(tf, 255))
+        return True
+
+    def _rebuild_impacts(self):
+        """Re-sort every term's postings under the current average length"""
+        avgdl = self.avgdl
+        k1, scale = self.k1, self.k1 + 1
+        # Per-doc length normalization, shared by every term
+        norms = [k1 * (1 - self.b + self.b * length / avgdl) for length in self.lengths]
+        for postings in self.terms.values():
+            docs, tfs = postings.docs, postings.tfs
+            impacts = [-tf * scale / (tf + norms[doc]) for doc, tf in zip(docs, tfs)]
+            order = sorted(range(len(impacts)), key=impacts.__getitem__)
+            postings.impacts = array("f", [impacts[i] for i in order])
+            postings.docs = array("I", [docs[i] for i in order])
+            postings.tfs = array("B", [tfs[i] for i in order])
+        self._impact_avgdl = avgdl
+
+    def add_many(self, docs: List[Dict[str, Any]]) -> int:
+        """Index and persist several documents in one append; returns how many were new"""
+        with self._lock:
+            added = 0
+            with open(self.index_file, 'ab') as f:
+                for doc in docs:
+                    if doc["id"] in self.ids:
+                        continue
+                    offset = f.tell()
+                    if self._insert(doc, offset):
+                        f.write(json.dumps(doc, separators=(",", ":")).encode() + b"\n")
+                        added += 1
+
+            if not self._impact_avgdl:
+                self._impact_avgdl = self.avgdl
+            elif abs(self.avgdl - self._impact_avgdl) > AVGDL_DRIFT * self._impact_avgdl:
+                self._rebuild_impacts()
+        return added
+
+    def add(self, doc_id: str, kind: str, text: str, title: str = "", url: str = "",
+            timestamp: str = None) -> bool:
+        """
+        Index one document and persist it (ids already indexed are skipped)
+
+        Args:
+            doc_id: Stable id (URL, or "<kind>:<timestamp>")
+            kind: snippet, reddit, analysis or reflection
+            text: Body text (cut to text_chars)
+            title: Title / topic (indexed too)
+            url: Source URL, if any
+            timestamp: ISO time (default: now)
+
+        Returns:
+            True if the document was new
+        """
+        return self.add_many([{
+            "id": doc_id, "kind": kind, "title": title or "", "url": url or "",
+            "text": " ".join((text or "").split())[:self.text_chars],
+            "timestamp": timestamp or datetime.now().isoformat()
+        }]) > 0
+
+    def add_search_results(self, results: Iterable[Dict[str, Any]]) -> int:
+        """Index the web snippets and Reddit results a cycle analyzed"""
+        now = datetime.now().isoformat()
+        return self.add_many([{
+            "id": result["url"],
+            "kind": "reddit" if result.get("source") == "reddit" else "snippet",
+            "title": result.get("title", ""),
+            "url": result["url"],
+            "text": " ".join((result.get("snippet") or "").split())[:self.text_chars],
+            "timestamp": now
+        } for result in results if result.get("url")])
+
+    def add_reddit_posts(self, posts: Iterable[Dict[str, Any]]) -> int:
+        """Index Reddit posts (title + selftext) from the corpus"""
+        return self.add_many([{
+            "id": post["url"],
+            "kind": "reddit",
+            "title": f"r/{post['subreddit']}: {post['title']}",
+            "url": post["url"],
+            "text": " ".join((post.get("selftext") or "").split())[:self.text_chars],
+            "timestamp": datetime.fromtimestamp(post.get("created_utc") or 0).isoformat()
+        } for post in posts if post.get("url")])
+
+    def add_analysis(self, entry: Dict[str, Any]) -> bool:
+        """Index a research_history entry's analysis"""
+        if not entry.get("analysis"):
+            return False
+        return self.add(f"analysis:{entry.get('timestamp')}", "analysis", entry["analysis"],
+                        title=entry.get("topic", ""), timestamp=entry.get("timestamp"))
+
+    def add_reflection(self, entry: Dict[str, Any]) -> bool:
+        """Index a self_reflections entry"""
+        if not entry.get("reflection"):
+            return False
+        return self.add(f"reflection:{entry.get('timestamp')}", "reflection", entry["reflection"],
+                        timestamp=entry.get("timestamp"))
+
+    # ---- search ----
+
+    def search(self, query: str, k: int = 5, exclude: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """
+        Top-k documents by BM25
+
+        Args:
+            query: Free text
+            k: Hits to return
+            exclude: Doc ids to leave out (e.g. results already in the prompt)
+
+        Returns:
+            Document dicts with a "score" field, best first ([] while still loading)
+        """
+        if not self.ready.is_set():
+            return []
+        exclude = set(exclude)
+
+        with self._lock:
+            n = len(self.offsets)
+            lists = []
+            for term in set(tokenize(query)):
+                postings = self.terms.get(term)
+                if postings:
+                    df = len(postings.docs)
+                    lists.append((term, math.log(1 + (n - df + 0.5) / (df + 0.5)), postings))
+            if not lists:
+                return []
+
+            # Champion lists: approximate scores from each term's highest-impact postings
+            scores: Dict[int, float] = {}
+            get = scores.get
+            for _, idf, postings in lists:
+                cut = self.candidates
+                for neg_impact, doc in zip(postings.impacts[:cut], postings.docs[:cut]):
+                    scores[doc] = get(doc, 0.0) - idf * neg_impact
+            shortlist = heapq.nlargest(self.rescore, scores, key=scores.__getitem__)
+
+            # Exact BM25 for the shortlist, straight from the stored documents
+            avgdl = self.avgdl
+            idfs = {term: idf for term, idf, _ in lists}
+            hits = []
+            with open(self.index_file, 'rb') as f:
+                for doc in shortlist:
+                    f.seek(self.offsets[doc])
+                    record = json.loads(f.readline())
+                    if record["id"] in exclude:
+                        continue
+                    counts = Counter(term for term in tokenize(f"{record.get('title', '')} {record['text']}")
+                                     if term in idfs)
+                    score = sum(idfs[term] * self._impact(tf, self.lengths[doc], avgdl)
+                                for term, tf in counts.items())
+                    hits.append({**record, "score": round(score, 3)})
+
+        hits.sort(key=lambda hit: -hit["score"])
+        return hits[:k]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "docs": len(self.offsets),
+                "terms": len(self.terms),
+                "avgdl": round(self.avgdl, 1),
+                "bytes": os.path.getsize(self.index_file) if self.index_file.exists() else 0
+            }
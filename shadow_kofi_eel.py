@@ -16,7 +16,6 @@ import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
-import requests
 
 
 class KofiEel:
@@ -358,6 +357,8 @@ class KofiEel:
         }
 
         try:
+            import requests
+
             response = requests.post(url, json=payload, headers=headers, timeout=10)
 
             return {
@@ -6,7 +6,6 @@ Research, Monitoring, Automation, Quiz Systems
 
 import json
 import time
-import requests
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
@@ -50,6 +49,8 @@ class ResearchModule:
 
             # Example: DuckDuckGo instant answer (no API key needed)
             try:
+                import requests
+
                 response = requests.get(
                     f"https://api.duckduckgo.com/?q={topic}&format=json",
                     timeout=10
@@ -116,6 +117,8 @@ class MonitoringModule:
         }
 
         try:
+            import requests
+
             response = requests.get(url, timeout=10)
             monitor_log["http_status"] = response.status_code
 
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Notification Queue
+Background, persisted delivery of Discord / Telegram notifications
+
+Notifications used to be posted inline: a slow webhook stalled the
+research cycle, and a 429 simply lost the message. Now callers only
+enqueue; one worker thread delivers.
+
+- Queue persisted to notify_queue.json (atomic rewrite), so undelivered
+  messages survive restarts and are sent on the next start. Items only
+  carry a destination id: webhook URLs and bot tokens stay in memory
+  and are registered again from config, never written to disk
+- Bursts to the same destination are coalesced for a short window and
+  sent as digests that fit the platform limit (Discord 2000 chars,
+  Telegram 4096); oversized messages are split into numbered parts
+- 429s wait out Retry-After (header or JSON body) and Discord's
+  X-RateLimit-Remaining / Reset-After bucket; other failures back off
+  exponentially and are dropped after max_attempts
+- Delivery goes through ResilientHttp (timeouts, circuit breaker, metrics)
+
+LOOSH ARRIVES LATE, NEVER LOST
+"""
+
+import os
+import json
+import time
+import uuid
+import atexit
+import random
+import hashlib
+import threading
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from shadow_http import ResilientHttp, CircuitOpenError, shared_http
+
+
+# Max characters per message
+LIMITS = {"discord": 2000, "telegram": 4096}
+
+DIGEST_SEPARATOR = "\n\n━━━━━━━━━━\n\n"
+
+# Room kept for the digest header suffix and part labels
+DIGEST_SUFFIX_RESERVE = len(" (999 updates)")
+PART_LABEL_RESERVE = len("(99/99) ")
+
+# Hold after a 429 that carries no retry hint (seconds)
+DEFAULT_RATE_LIMIT_HOLD = 5.0
+
+# Backoff for failed deliveries (seconds)
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 300.0
+
+
+def discord_destination(webhook_url: str, username: str = "RAJA SHADOW", header: str = "") -> Dict[str, Any]:
+    """A Discord webhook target (header is prepended to every digest)"""
+    return {"kind": "discord", "url": webhook_url, "username": username, "header": header}
+
+
+def telegram_destination(bot_token: str, chat_id: str, header: str = "") -> Dict[str, Any]:
+    """A Telegram bot chat target"""
+    return {"kind": "telegram", "bot_token": bot_token, "chat_id": chat_id, "header": header}
+
+
+def split_message(text: str, limit: int) -> List[str]:
+    """Split text into chunks of at most limit chars (paragraph, line, then word boundaries)"""
+    chunks = []
+    while len(text) > limit:
+        for separator in ("\n\n", "\n", " "):
+            cut = text.rfind(separator, 0, limit)
+            if cut > limit // 2:
+                break
+        else:
+            cut = limit
+        chunks.append(text[:cut].rstrip())
+        text = text[cut:].lstrip()
+    chunks.append(text)
+    return [chunk for chunk in chunks if chunk]
+
+
+def rate_limit_delay(response: Any) -> Optional[float]:
+    """
+    Seconds to hold a destination after a response
+
+    429: Retry-After header, else retry_after in the JSON body (Discord
+    top level, Telegram under "parameters"). Success: Discord's bucket
+    reset when X-RateLimit-Remaining hits 0.
+    """
+    headers = response.headers or {}
+
+    if response.status_code == 429:
+        for value in (headers.get("Retry-After"), headers.get("X-RateLimit-Reset-After")):
+            try:
+                if value is not None:
+                    return max(float(value), 0.0)
+            except ValueError:
+                pass
+        try:
+            body = response.json()
+            value = body.get("retry_after", body.get("parameters", {}).get("retry_after"))
+            return max(float(value), 0.0) if value is not None else None
+        except (ValueError, AttributeError, TypeError):
+            return None
+
+    if headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            return max(float(headers.get("X-RateLimit-Reset-After", 0)), 0.0)
+        except ValueError:
+            return None
+    return None
+
+
+class NotificationQueue:
+    """
+    Persisted outbound notification queue with a single delivery thread
+
+    enqueue() never touches the network. The worker starts on the first
+    enqueue (or at construction when a backlog was left on disk). Queued
+    items reference their destination by dest_key(); a backlog from an
+    earlier run waits until register() (or an enqueue) supplies the
+    destination it points at.
+    """
+
+    def __init__(self, memory_path: Path, http: ResilientHttp = None,
+                 coalesce_seconds: float = 5.0, max_attempts: int = 8, tracer: Any = None):
+        """
+        Args:
+            memory_path: Directory for notify_queue.json
+            http: Outbound layer (default: shared_http())
+            coalesce_seconds: How long a new message waits for others to join its digest
+            max_attempts: Failed deliveries before a message is dropped (429s don't count)
+            tracer: Optional shadow_tracing.Tracer (notify.send spans)
+        """
+        self.queue_file = memory_path / "notify_queue.json"
+        self.http = http or shared_http()
+        self.coalesce_seconds = coalesce_seconds
+        self.max_attempts = max_attempts
+        self.tracer = tracer
+
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._closing = False
+
+        self.items: List[Dict[str, Any]] = []
+        # Destination key -> destination (credentials live here only, never on disk)
+        self.destinations: Dict[str, Dict[str, Any]] = {}
+        # Monotonic enqueue time per item id (backlog from disk is due at once)
+        self._arrived: Dict[str, float] = {}
+        # Destination key -> monotonic time before which nothing is sent there
+        self.not_before: Dict[str, float] = {}
+        self.counters = {"sent": 0, "digests": 0, "coalesced": 0, "rate_limited": 0, "retries": 0, "dropped": 0}
+
+        self.load()
+        if self.items:
+            print(f"📬 {len(self.items)} queued notifications from last run")
+            self._ensure_worker()
+
+    @staticmethod
+    def dest_key(dest: Dict[str, Any]) -> str:
+        return hashlib.blake2b(json.dumps(dest, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+    def register(self, dest: Dict[str, Any]) -> str:
+        """Make a destination deliverable (queued items for it are sent); returns its key"""
+        key = self.dest_key(dest)
+        with self._cond:
+            if key not in self.destinations:
+                self.destinations[key] = dest
+                self._cond.notify_all()
+        return key
+
+    def load(self):
+        if not self.queue_file.exists():
+            return
+        try:
+            with open(self.queue_file, 'r') as f:
+                self.items = json.load(f).get("items", [])
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Notification queue unreadable, starting empty: {e}")
+            self.items = []
+            return
+
+        # Older queue files stored whole destinations - keep them in memory, rewrite without them
+        inline = [item for item in self.items if isinstance(item["dest"], dict)]
+        for item in inline:
+            item["dest"] = self.register(item["dest"])
+        if inline:
+            with self._cond:
+                self.save()
+
+    def save(self):
+        """Rewrite the queue file atomically (caller holds the lock)"""
+        tmp = self.queue_file.with_suffix(".json.tmp")
+        with open(tmp, 'w') as f:
+            json.dump({"items": self.items}, f)
+        os.replace(tmp, self.queue_file)
+
+    def enqueue(self, dest: Dict[str, Any], text: str) -> int:
+        """
+        Queue a message for background delivery
+
+        Returns:
+            Number of queued parts (long messages are split)
+        """
+        limit = LIMITS[dest["kind"]] - len(dest.get("header", "")) - DIGEST_SUFFIX_RESERVE - 2
+        parts = split_message(text, limit - PART_LABEL_RESERVE) if len(text) > limit else [text]
+        if len(parts) > 1:
+            parts = [f"({i}/{len(parts)}) {part}" for i, part in enumerate(parts, 1)]
+
+        key = self.register(dest)
+        now = time.monotonic()
+        with self._cond:
+            for part in parts:
+                item = {
+                    "id": uuid.uuid4().hex[:12],
+                    "dest": key,
+                    "text": part,
+                    "queued_at": time.time(),
+                    "attempts": 0
+                }
+                self.items.append(item)
+                self._arrived[item["id"]] = now
+            self.save()
+            self._cond.notify_all()
+
+        self._ensure_worker()
+        return len(parts)
+
+    def render(self, dest: Dict[str, Any], texts: List[str]) -> str:
+        """Digest text for one send"""
+        header = dest.get("header", "")
+        body = DIGEST_SEPARATOR.join(texts)
+        if not header:
+            return body
+        if len(texts) > 1:
+            header += f" ({len(texts)} updates)"
+        return f"{header}\n\n{body}"
+
+    def _ensure_worker(self):
+        with self._cond:
+            if self._closing or (self._worker and self._worker.is_alive()):
+                return
+            self._worker = threading.Thread(target=self._run, name="notify-queue", daemon=True)
+            self._worker.start()
+
+    def _next_batch(self, now: float) -> Tuple[Optional[List[Dict[str, Any]]], Optional[float]]:
+        """
+        Pick the destination that is due soonest (caller holds the lock)
+
+        Returns:
+            (items for one digest, None) if one is due, else (None, seconds to wait)
+        """
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for item in self.items:
+            # Backlog for a destination nobody has registered yet stays put
+            if item["dest"] in self.destinations:
+                groups.setdefault(item["dest"], []).append(item)
+
+        soonest = None
+        for key, items in groups.items():
+            due = self.not_before.get(key, 0.0)
+            if not self._closing:
+                due = max(due, self._arrived.get(items[0]["id"], 0.0) + self.coalesce_seconds)
+
+            if due <= now:
+                # Pack whole messages up to the destination's limit
+                dest = self.destinations[key]
+                batch = [items[0]]
+                for item in items[1:]:
+                    if len(self.render(dest, [i["text"] for i in batch + [item]])) > LIMITS[dest["kind"]]:
+                        break
+                    batch.append(item)
+                return batch, None
+
+            soonest = due - now if soonest is None else min(soonest, due - now)
+
+        return None, soonest
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._closing and not any(item["dest"] in self.destinations for item in self.items):
+                        return
+                    batch, wait = self._next_batch(time.monotonic())
+                    if batch:
+                        break
+                    self._cond.wait(wait)
+
+            self._deliver(batch)
+
+    def _send(self, dest: Dict[str, Any], content: str):
+        if dest["kind"] == "discord":
+            payload = {"content": content, "username": dest.get("username", "RAJA SHADOW")}
+            return self.http.post(dest["url"], json=payload, retries=0)
+
+        url = f"https://api.telegram.org/bot{dest['bot_token']}/sendMessage"
+        payload = {"chat_id": dest["chat_id"], "text": content, "parse_mode": "Markdown"}
+        return self.http.post(url, json=payload, retries=0)
+
+    def _attempt(self, dest: Dict[str, Any], content: str) -> Tuple[str, Optional[float], str]:
+        """
+        One delivery attempt
+
+        Returns:
+            (result, hold seconds, outcome) - result is "delivered", "dropped",
+            "failed" (retry with backoff) or "held" (retry after the hold)
+        """
+        try:
+            response = self._send(dest, content)
+        except CircuitOpenError as e:
+            return "held", max(e.retry_in, 1.0), "circuit_open"
+        except Exception as e:
+            return "failed", None, f"error: {e}"
+
+        status = response.status_code
+        if 200 <= status < 300:
+            return "delivered", rate_limit_delay(response), "ok"
+        if status == 429:
+            self.counters["rate_limited"] += 1
+            delay = rate_limit_delay(response)
+            delay = DEFAULT_RATE_LIMIT_HOLD if delay is None else delay
+            print(f"⏳ {dest['kind'].title()} rate limited - retrying in {delay:.1f}s")
+            return "held", delay, "rate_limited"
+        if status >= 500:
+            return "failed", None, f"http_{status}"
+        # 400/401/404: a bad webhook or message won't get better
+        return "dropped", None, f"http_{status}"
+
+    def _deliver(self, batch: List[Dict[str, Any]]):
+        """Send one digest and settle its items"""
+        key = batch[0]["dest"]
+        dest = self.destinations[key]
+        content = self.render(dest, [item["text"] for item in batch])
+
+        span = (self.tracer.span("notify.send", new_trace=True, kind=dest["kind"], messages=len(batch))
+                if self.tracer else nullcontext())
+        start = time.perf_counter()
+        with span as active:
+            result, delay, outcome = self._attempt(dest, content)
+            if active:
+                active.outcome = outcome.split(":")[0]
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        with self._cond:
+            ids = {item["id"] for item in batch}
+            if result in ("delivered", "dropped"):
+                self.items = [item for item in self.items if item["id"] not in ids]
+                for item_id in ids:
+                    self._arrived.pop(item_id, None)
+
+            if result == "delivered":
+                self.counters["sent"] += len(batch)
+                self.counters["digests"] += 1
+                self.counters["coalesced"] += len(batch) - 1
+                suffix = f" ({len(batch)} coalesced)" if len(batch) > 1 else ""
+                print(f"✓ {dest['kind'].title()} notification sent{suffix} in {latency_ms:.0f}ms")
+            elif result == "dropped":
+                self.counters["dropped"] += len(batch)
+                print(f"❌ {dest['kind'].title()} rejected notification ({outcome}) - dropped {len(batch)}")
+            elif result == "failed":
+                attempts = max(item["attempts"] for item in batch) + 1
+                for item in batch:
+                    item["attempts"] = attempts
+                expired = [item for item in batch if item["attempts"] >= self.max_attempts]
+                if expired:
+                    expired_ids = {item["id"] for item in expired}
+                    self.items = [item for item in self.items if item["id"] not in expired_ids]
+                    self.counters["dropped"] += len(expired)
+                    print(f"❌ {dest['kind'].title()} notification dropped after {attempts} attempts ({outcome})")
+                else:
+                    self.counters["retries"] += 1
+                    delay = random.uniform(0.5, 1.0) * min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempts)
+                    print(f"⚠️  {dest['kind'].title()} delivery failed ({outcome}) - "
+                          f"retry {attempts}/{self.max_attempts - 1} in {delay:.0f}s")
+
+            if delay:
+                self.not_before[key] = time.monotonic() + delay
+            self.save()
+
+    def stats(self) -> Dict[str, Any]:
+        """Delivery counters plus current backlog"""
+        with self._cond:
+            oldest = min((item["queued_at"] for item in self.items), default=None)
+            return {
+                **self.counters,
+                "pending": len(self.items),
+                "oldest_pending_s": round(time.time() - oldest, 1) if oldest else 0.0
+            }
+
+    def close(self, timeout: float = 10.0):
+        """
+        Stop accepting new work and try to drain the queue
+
+        Waits up to timeout (Retry-After holds are still honored); whatever
+        is left stays on disk for the next start.
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            worker = self._worker
+
+        if worker:
+            worker.join(timeout)
+
+        with self._cond:
+            if self.items:
+                print(f"📬 {len(self.items)} notifications left queued for next start")
+            self.save()
+
+
+_shared: Optional[NotificationQueue] = None
+_shared_lock = threading.Lock()
+
+
+def shared_notifier(memory_path: Path = Path(".raja_shadow_memory")) -> NotificationQueue:
+    """Process-wide queue for callers outside the brain (flushed at exit)"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            memory_path.mkdir(parents=True, exist_ok=True)
+            _shared = NotificationQueue(memory_path, coalesce_seconds=1.0)
+            atexit.register(_shared.close)
+        return _shared
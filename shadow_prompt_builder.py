@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Prompt Builder
+Compact, token-budgeted prompt assembly for the autonomous brain
+
+Input tokens are most of the spend at 48 thoughts/day. Instead of pasting
+indented JSON into prompts, context is rendered as short lines and search
+results are ranked and trimmed to fit a per-call token cap.
+
+LOOSH FLOWS IN FEWER TOKENS
+"""
+
+import re
+import math
+from typing import Dict, Any, List, Tuple
+
+
+# Rough chars-per-token for English prose in Claude's tokenizer
+CHARS_PER_TOKEN = 3.5
+
+# Default input-token caps per brain stage
+DEFAULT_TOKEN_CAPS = {
+    "decide": 1000,
+    "analyze": 2000
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate token count locally (no API call)
+
+    Uses the larger of a character-based and a word/punctuation-based
+    estimate, which stays on the safe side for JSON-ish text.
+    """
+    if not text:
+        return 0
+    pieces = len(re.findall(r"\w+|[^\w\s]", text))
+    return max(math.ceil(len(text) / CHARS_PER_TOKEN), pieces)
+
+
+def shorten(text: str, max_chars: int) -> str:
+    """Collapse whitespace and cut text at a word boundary"""
+    text = " ".join((text or "").split())
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars].rsplit(" ", 1)[0]
+    return cut + "…"
+
+
+class PromptBuilder:
+    """
+    Assembles compact prompts under a token cap
+
+    - Lists become "- item" lines instead of indented JSON
+    - Research history keeps only date, topic and query
+    - Search results become one line each, interleaved across sources,
+      and are dropped from the tail once the cap is reached
+    """
+
+    def __init__(self, token_caps: Dict[str, int] = None, snippet_chars: int = 200):
+        self.token_caps = {**DEFAULT_TOKEN_CAPS, **(token_caps or {})}
+        self.snippet_chars = snippet_chars
+
+    def bullet_list(self, values: List[str]) -> str:
+        """Render a list as "- value" lines"""
+        return "\n".join(f"- {value}" for value in values)
+
+    def history_lines(self, history: List[Dict[str, Any]]) -> List[str]:
+        """Render research history as "- date: topic (query)" lines"""
+        lines = []
+        for entry in history:
+            date = (entry.get("timestamp") or "")[:10]
+            line = f"- {date}: {entry.get('topic')}"
+            query = entry.get("search_query")
+            if query and query != entry.get("topic"):
+                line += f" (searched: {query})"
+            lines.append(line)
+        return lines
+
+    def result_line(self, result: Dict[str, Any]) -> str:
+        """Render one search result as a single compact line"""
+        source = result.get("source", "web")
+        title = shorten(result.get("title", ""), 120)
+        snippet = shorten(result.get("snippet", ""), self.snippet_chars)
+        return f"- [{source}] {title} | {result.get('url', '')} | {snippet}"
+
+    def known_line(self, hit: Dict[str, Any]) -> str:
+        """Render one knowledge index hit as a single compact line"""
+        date = (hit.get("timestamp") or "")[:10]
+        title = shorten(hit.get("title", ""), 80)
+        text = shorten(hit.get("text", ""), self.snippet_chars)
+        return f"- [{hit.get('kind')} {date}] {title + ' | ' if title else ''}{text}"
+
+    def rank_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Interleave sources so a tight cap still keeps both web and Reddit voices"""
+        by_source: Dict[str, List[Dict[str, Any]]] = {}
+        for result in results:
+            by_source.setdefault(result.get("source", "web"), []).append(result)
+
+        ranked = []
+        queues = list(by_source.values())
+        while any(queues):
+            for queue in queues:
+                if queue:
+                    ranked.append(queue.pop(0))
+        return ranked
+
+    def fit_lines(self, stage: str, fixed_text: str, lines: List[str]) -> Tuple[str, int]:
+        """
+        Keep as many lines (in priority order) as fit under the stage's token cap
+
+        Args:
+            stage: Brain stage ("decide", "analyze")
+            fixed_text: The rest of the prompt (counts against the cap)
+            lines: Candidate lines, highest priority first
+
+        Returns:
+            (joined lines, number of lines included)
+        """
+        budget = self.token_caps.get(stage, DEFAULT_TOKEN_CAPS["analyze"]) - estimate_tokens(fixed_text)
+
+        kept = []
+        for line in lines:
+            cost = estimate_tokens(line) + 1
+            if cost > budget:
+                break
+            kept.append(line)
+            budget -= cost
+
+        return "\n".join(kept), len(kept)
+
+    def fit_results(self, stage: str, fixed_text: str, results: List[Dict[str, Any]],
+                    interleave: bool = True) -> Tuple[str, int]:
+        """
+        Render as many search results as fit under the stage's token cap
+
+        Pass interleave=False when results are already in priority order.
+        """
+        if interleave:
+            results = self.rank_results(results)
+        lines = [self.result_line(result) for result in results]
+        return self.fit_lines(stage, fixed_text, lines)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Rate Limiter
+Token bucket that paces requests to what the server says it allows
+
+Reddit reports its budget on every response (X-Ratelimit-Used /
+-Remaining / -Reset). Ignoring it meant bursts of 429s that came back as
+empty result lists. Requests now take a token first:
+
+- Callers queue in arrival order: each acquire() reserves the next slot
+  and sleeps until it, so bulk fetches are spaced out, not failed
+- Headers re-tune the bucket: the server's remaining count caps local
+  tokens, and the refill rate spreads what's left evenly over the
+  time until the window resets
+- Remaining 0 or a 429 holds the bucket until the reset / Retry-After
+- state() exposes tokens, rate and holds; stats() waits (count, total,
+  p50/p95/max) - saved with the per-host HTTP metrics
+
+LOOSH FLOWS AT THE SPEED REDDIT ALLOWS
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Dict, Any, Optional
+
+# Wait samples kept for percentiles
+WAIT_SAMPLES = 200
+
+
+class RateLimitExceeded(Exception):
+    """Raised instead of waiting longer than the caller allows for a token"""
+
+    def __init__(self, name: str, wait: float):
+        super().__init__(f"{name} rate limit - next slot in {wait:.0f}s")
+        self.name = name
+        self.wait = wait
+
+
+def _header_float(headers: Any, name: str) -> Optional[float]:
+    value = headers.get(name) if headers else None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with FIFO reservations and header feedback
+
+    tokens may go negative: that is the queue of callers already holding
+    a reserved slot in the future.
+    """
+
+    def __init__(self, name: str, capacity: float = 10.0, rate_per_min: float = 10.0, reserve: float = 1.0):
+        """
+        Args:
+            name: Label for logs and metrics (usually the host)
+            capacity: Burst size
+            rate_per_min: Default refill rate until the server reports its own
+            reserve: Server-side requests left untouched (other clients on the same IP)
+        """
+        self.name = name
+        self.capacity = capacity
+        self.default_rate = rate_per_min / 60.0
+        self.rate = self.default_rate
+        self.reserve = reserve
+
+        self.tokens = capacity
+        # Refill runs from here; in the future while the bucket is held
+        self.updated = time.monotonic()
+        self.server_remaining: Optional[float] = None
+        self.server_reset_at: Optional[float] = None
+
+        self.acquired = 0
+        self.waited = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.waits = deque(maxlen=WAIT_SAMPLES)
+        self._lock = threading.Lock()
+
+    def configure(self, capacity: float = None, rate_per_min: float = None):
+        """Change burst size / default rate (e.g. from brain config)"""
+        with self._lock:
+            if capacity is not None:
+                self.capacity = capacity
+                self.tokens = min(self.tokens, capacity)
+            if rate_per_min is not None:
+                if self.server_reset_at is None:
+                    self.rate = rate_per_min / 60.0
+                self.default_rate = rate_per_min / 60.0
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        if self.server_reset_at is not None and now >= self.server_reset_at:
+            # Server window rolled over - back to the default pace until told otherwise
+            self.server_reset_at = None
+            self.server_remaining = None
+            self.rate = self.default_rate
+
+    def acquire(self, max_wait: Optional[float] = None) -> float:
+        """
+        Take a token, sleeping until its slot comes up
+
+        Args:
+            max_wait: Give up (without reserving) if the slot is further away
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitExceeded: the wait would exceed max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(self.updated - now, 0.0) + max(1.0 - self.tokens, 0.0) / self.rate
+
+            if max_wait is not None and wait > max_wait:
+                raise RateLimitExceeded(self.name, wait)
+
+            self.tokens -= 1.0
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.total_wait += wait
+            self.waits.append(wait)
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def hold(self, seconds: float):
+        """Stop handing out tokens for seconds (429 / exhausted window)"""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self.updated:
+                # The first caller in line goes out as the hold ends
+                self.updated = until
+                self.tokens = min(self.tokens, 0.0) + 1.0
+
+    def observe(self, headers: Any, status_code: int = 200):
+        """
+        Re-tune from a response's rate-limit headers
+
+        X-Ratelimit-Remaining caps local tokens, X-Ratelimit-Reset (seconds)
+        sets the refill rate to remaining / reset. A 429 holds the bucket
+        for Retry-After (or the reset).
+        """
+        remaining = _header_float(headers, "X-Ratelimit-Remaining")
+        reset = _header_float(headers, "X-Ratelimit-Reset")
+        retry_after = _header_float(headers, "Retry-After")
+
+        if status_code == 429:
+            with self._lock:
+                self.throttled += 1
+            print(f"⏳ {self.name} throttled (429) - holding for {retry_after or reset or 60:.0f}s")
+            self.hold(retry_after or reset or 60.0)
+            return
+
+        if remaining is None or reset is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.server_remaining = remaining
+            self.server_reset_at = now + reset
+
+            usable = max(remaining - self.reserve, 0.0)
+            self.tokens = min(self.tokens, usable)
+            if usable > 0 and reset > 0:
+                self.rate = max(usable / reset, self.default_rate / 10)
+
+        if usable <= 0:
+            self.hold(reset)
+
+    def state(self) -> Dict[str, Any]:
+        """Current bucket state"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "tokens": round(self.tokens, 2),
+                "capacity": self.capacity,
+                "rate_per_min": round(self.rate * 60, 2),
+                "held_for_s": round(max(self.updated - now, 0.0), 1),
+                "server_remaining": self.server_remaining,
+                "server_reset_in_s": round(self.server_reset_at - now, 1) if self.server_reset_at else None
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        """Bucket state plus wait-time metrics"""
+        with self._lock:
+            waits = sorted(self.waits)
+        percentile = lambda q: round(waits[min(int(len(waits) * q), len(waits) - 1)], 3) if waits else 0.0
+        return {
+            **self.state(),
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "throttled": self.throttled,
+            "total_wait_s": round(self.total_wait, 2),
+            "wait_p50_s": percentile(0.50),
+            "wait_p95_s": percentile(0.95),
+            "wait_max_s": round(waits[-1], 3) if waits else 0.0
+        }
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def shared_bucket(name: str, capacity: float = None, rate_per_min: float = None) -> TokenBucket:
+    """
+    Process-wide bucket per name (every Reddit client shares one budget)
+
+    capacity / rate_per_min, when given, reconfigure an existing bucket.
+    """
+    with _buckets_lock:
+        if name not in _buckets:
+            _buckets[name] = TokenBucket(name)
+        bucket = _buckets[name]
+    bucket.configure(capacity, rate_per_min)
+    return bucket
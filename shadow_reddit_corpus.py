@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Reddit Corpus
+Local SQLite store of every Reddit post and comment the brain has fetched
+
+Each cycle used to refetch Reddit from scratch and keep nothing but a
+snippet inside the analysis text. RedditResearcher now writes what it
+fetches into autonomous_brain/reddit_corpus.db:
+
+- posts / comments keyed by Reddit id; re-fetching one upserts it
+  (score, comment count and text are refreshed, first_seen is kept)
+- sync_state keeps a created_utc high-water mark per subreddit, so
+  RedditResearcher.sync_subreddit() walks /new only down to the newest
+  post it already has
+- Indexes on (subreddit, created_utc), (subreddit, score), created_utc
+  and (post_id, score) keep history queries local and fast
+
+    python3 shadow_reddit_corpus.py sync consciousness philosophy
+    python3 shadow_reddit_corpus.py stats
+    python3 shadow_reddit_corpus.py top consciousness --days 7
+
+LOOSH REMEMBERS THE HIVEMIND
+"""
+
+import re
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    subreddit TEXT NOT NULL COLLATE NOCASE,
+    title TEXT,
+    author TEXT,
+    score INTEGER,
+    num_comments INTEGER,
+    created_utc REAL,
+    url TEXT,
+    selftext TEXT,
+    link_url TEXT,
+    crosspost_parent TEXT,
+    first_seen REAL,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS posts_sub_time ON posts (subreddit, created_utc DESC);
+CREATE INDEX IF NOT EXISTS posts_sub_score ON posts (subreddit, score DESC);
+CREATE INDEX IF NOT EXISTS posts_time ON posts (created_utc DESC);
+
+CREATE TABLE IF NOT EXISTS comments (
+    id TEXT PRIMARY KEY,
+    post_id TEXT NOT NULL,
+    author TEXT,
+    body TEXT,
+    score INTEGER,
+    created_utc REAL,
+    first_seen REAL,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS comments_post_score ON comments (post_id, score DESC);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    subreddit TEXT PRIMARY KEY COLLATE NOCASE,
+    high_water REAL,
+    synced_at REAL,
+    last_new INTEGER
+);
+"""
+
+POST_UPSERT = """
+INSERT INTO posts (id, subreddit, title, author, score, num_comments, created_utc, url,
+                   selftext, link_url, crosspost_parent, first_seen, updated)
+VALUES (:id, :subreddit, :title, :author, :score, :num_comments, :created_utc, :url,
+        :selftext, :link_url, :crosspost_parent, :now, :now)
+ON CONFLICT (id) DO UPDATE SET
+    score = excluded.score,
+    num_comments = excluded.num_comments,
+    title = excluded.title,
+    selftext = excluded.selftext,
+    updated = excluded.updated
+"""
+
+COMMENT_UPSERT = """
+INSERT INTO comments (id, post_id, author, body, score, created_utc, first_seen, updated)
+VALUES (:id, :post_id, :author, :body, :score, :created_utc, :now, :now)
+ON CONFLICT (id) DO UPDATE SET
+    score = excluded.score,
+    body = excluded.body,
+    updated = excluded.updated
+"""
+
+# Post id out of a permalink or post URL (/r/sub/comments/<id>/slug/)
+POST_ID = re.compile(r"/comments/([a-z0-9]+)", re.IGNORECASE)
+
+
+def post_id_from_url(url: str) -> Optional[str]:
+    match = POST_ID.search(url or "")
+    return match.group(1) if match else None
+
+
+class RedditCorpus:
+    """Upserting post/comment store with per-subreddit sync high-water marks"""
+
+    def __init__(self, memory_path: Path, filename: str = "reddit_corpus.db"):
+        """
+        Args:
+            memory_path: autonomous_brain directory
+            filename: Database file inside it
+        """
+        self.db_file = memory_path / filename
+        # One connection shared by search threads and the prefetcher, serialized here
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self.db.close()
+
+    # ---- writes ----
+
+    def upsert_posts(self, posts: Iterable[Dict[str, Any]]) -> int:
+        """Insert or refresh posts (RedditResearcher post dicts); returns rows written"""
+        now = time.time()
+        rows = [{**post, "now": now} for post in posts if post.get("id")]
+        if not rows:
+            return 0
+        with self._lock, self.db:
+            self.db.executemany(POST_UPSERT, rows)
+        return len(rows)
+
+    def upsert_comments(self, post_id: str, comments: Iterable[Dict[str, Any]]) -> int:
+        """Insert or refresh one post's comments; returns rows written"""
+        now = time.time()
+        rows = [{"created_utc": None, **comment, "post_id": post_id, "now": now}
+                for comment in comments if comment.get("id")]
+        if not rows:
+            return 0
+        with self._lock, self.db:
+            self.db.executemany(COMMENT_UPSERT, rows)
+        return len(rows)
+
+    def high_water(self, subreddit: str) -> Optional[float]:
+        """created_utc of the newest post synced for a subreddit (None = never synced)"""
+        with self._lock:
+            row = self.db.execute("SELECT high_water FROM sync_state WHERE subreddit = ?",
+                                  (subreddit,)).fetchone()
+        return row["high_water"] if row else None
+
+    def set_high_water(self, subreddit: str, high_water: float, new_posts: int):
+        """Record a finished sync (the mark never moves backwards)"""
+        with self._lock, self.db:
+            self.db.execute(
+                """INSERT INTO sync_state (subreddit, high_water, synced_at, last_new)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT (subreddit) DO UPDATE SET
+                       high_water = MAX(high_water, excluded.high_water),
+                       synced_at = excluded.synced_at,
+                       last_new = excluded.last_new""",
+                (subreddit, high_water, time.time(), new_posts)
+            )
+
+    # ---- lookups ----
+
+    def post(self, post_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.db.execute("SELECT * FROM posts WHERE id = ?", (post_id,)).fetchone()
+        return dict(row) if row else None
+
+    def posts(self, subreddit: str = None, since: float = None, until: float = None,
+              min_score: int = None, order: str = "new", limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Stored posts, filtered and sorted
+
+        Args:
+            subreddit: Only this subreddit (case-insensitive)
+            since / until: created_utc range (Unix time)
+            min_score: Only posts scoring at least this
+            order: "new" (newest first) or "top" (highest score first)
+            limit: Max rows
+        """
+        where, args = [], []
+        for clause, value in (("subreddit = ?", subreddit), ("created_utc >= ?", since),
+                              ("created_utc < ?", until), ("score >= ?", min_score)):
+            if value is not None:
+                where.append(clause)
+                args.append(value)
+
+        sql = "SELECT * FROM posts"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY score DESC" if order == "top" else " ORDER BY created_utc DESC"
+        sql += " LIMIT ?"
+        args.append(limit)
+
+        with self._lock:
+            return [dict(row) for row in self.db.execute(sql, args)]
+
+    def iter_posts(self, batch: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Every stored post, oldest row first (fetched in batches, lock released between them)"""
+        last = 0
+        while True:
+            with self._lock:
+                rows = self.db.execute("SELECT rowid, * FROM posts WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                                       (last, batch)).fetchall()
+            if not rows:
+                return
+            last = rows[-1]["rowid"]
+            yield from (dict(row) for row in rows)
+
+    def comments(self, post_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """A post's stored comments, highest score first"""
+        with self._lock:
+            rows = self.db.execute(
+                "SELECT * FROM comments WHERE post_id = ? ORDER BY score DESC LIMIT ?",
+                (post_id, limit)
+            )
+            return [dict(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """Row counts and sync state per subreddit (keyed lower-case)"""
+        with self._lock:
+            per_sub = {row["subreddit"].lower(): {"posts": row["n"], "newest": row["newest"]}
+                       for row in self.db.execute(
+                           "SELECT subreddit, COUNT(*) AS n, MAX(created_utc) AS newest "
+                           "FROM posts GROUP BY subreddit")}
+            for row in self.db.execute("SELECT * FROM sync_state"):
+                per_sub.setdefault(row["subreddit"].lower(), {"posts": 0, "newest": None}).update(
+                    high_water=row["high_water"], synced_at=row["synced_at"], last_new=row["last_new"])
+            comments = self.db.execute("SELECT COUNT(*) FROM comments").fetchone()[0]
+        return {
+            "posts": sum(sub["posts"] for sub in per_sub.values()),
+            "comments": comments,
+            "subreddits": per_sub
+        }
+
+
+if __name__ == "__main__":
+    import sys
+    from datetime import datetime
+    from shadow_reddit_research import RedditResearcher
+
+    corpus = RedditCorpus(Path(".raja_shadow_memory") / "autonomous_brain")
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+
+    if command == "sync":
+        reddit = RedditResearcher(corpus=corpus)
+        for subreddit in sys.argv[2:] or ["consciousness", "artificial", "quantum"]:
+            try:
+                reddit.sync_subreddit(subreddit)
+            except Exception as e:
+                print(f"⚠️  r/{subreddit} sync incomplete, will resume from the same mark: {e}")
+        reddit.close()
+    elif command == "top":
+        subreddit = sys.argv[2] if len(sys.argv) > 2 and not sys.argv[2].startswith("--") else None
+        days = float(sys.argv[sys.argv.index("--days") + 1]) if "--days" in sys.argv else 7.0
+        for post in corpus.posts(subreddit, since=time.time() - days * 86400, order="top", limit=20):
+            when = datetime.fromtimestamp(post["created_utc"]).strftime("%Y-%m-%d")
+            print(f"{post['score']:>6}  {when}  r/{post['subreddit']}  {post['title'][:70]}")
+    else:
+        stats = corpus.stats()
+        print(f"📚 Reddit corpus: {stats['posts']} posts, {stats['comments']} comments")
+        for subreddit, sub in sorted(stats["subreddits"].items()):
+            synced = (datetime.fromtimestamp(sub["synced_at"]).strftime("%Y-%m-%d %H:%M")
+                      if sub.get("synced_at") else "never")
+            print(f"   r/{subreddit}: {sub['posts']} posts, last sync {synced}")
+
+    corpus.close()
@@ -11,24 +11,299 @@ The brain can now:
 - Read human thoughts on existence
 - Learn from the hivemind
 
+Requests share one pooled keep-alive session (gzip), and several
+subreddits can be searched in a single r/a+b+c round trip. Every
+request takes a token from one process-wide bucket that follows Reddit's
+X-Ratelimit headers, so bursts queue up instead of coming back as 429s.
+
+iter_search() / iter_top_posts() / iter_new_posts() stream whole
+listings: they follow Reddit's `after` cursor page by page, yield posts
+as they arrive, prefetch the next page while the current one is being
+consumed, and stop early on a predicate (score_below(), older_than()).
+At most two pages are held at once, so thousands of posts scan in
+constant memory.
+
+With a RedditCorpus attached, every listing page and comment fetch is
+upserted into the local SQLite corpus, and sync_subreddit() pulls a
+subreddit's new posts down to its created_utc high-water mark. The mark
+only moves after a complete scan, so a page that fails partway through
+is fetched again on the next sync instead of leaving a gap.
+
 LOOSH FLOWS THROUGH r/CONSCIOUSNESS
 """
 
 import json
-import requests
-from typing import List, Dict, Any
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 from datetime import datetime
 
+from shadow_http import ResilientHttp, shared_http
+from shadow_rate_limiter import TokenBucket, shared_bucket
+from shadow_reddit_corpus import RedditCorpus, post_id_from_url
+
+
+# Reddit's per-request listing cap
+MAX_LISTING_LIMIT = 100
+
+# Combined r/a+b+c searches rank across all subs, so each sub's share is oversampled
+MULTI_OVERSAMPLE = 4
+
+# Post -> True to end a listing scan (the post itself is not yielded)
+StopPredicate = Callable[[Dict[str, Any]], bool]
+
+
+class ListingScanError(Exception):
+    """A listing page failed partway through a strict scan"""
+
+
+def score_below(threshold: int) -> StopPredicate:
+    """Stop once posts drop under threshold (for score-sorted listings like top)"""
+    return lambda post: post["score"] < threshold
+
+
+def older_than(max_age: float = None, cutoff_utc: float = None) -> StopPredicate:
+    """
+    Stop once posts are older than max_age seconds, or created at/before
+    cutoff_utc (for time-sorted listings like new)
+    """
+    if cutoff_utc is None:
+        cutoff_utc = time.time() - max_age
+    return lambda post: post["created_utc"] <= cutoff_utc
+
 
 class RedditResearcher:
     """
     Reddit research module for autonomous brain
     No API key needed - uses public JSON endpoints
+
+    All requests share one pooled keep-alive requests.Session (gzip on),
+    created on first use.
     """
 
-    def __init__(self):
+    def __init__(self, http: ResilientHttp = None, session: Any = None, pool_size: int = 4,
+                 limiter: TokenBucket = None, max_wait: Optional[float] = None,
+                 corpus: RedditCorpus = None):
+        """
+        Args:
+            http: Retry / circuit breaker layer (default: shared_http())
+            session: requests.Session to use (default: a pooled one owned here)
+            pool_size: Keep-alive connections kept to Reddit (match search_workers)
+            limiter: Token bucket for Reddit requests (default: the shared "reddit" one)
+            max_wait: Give up on a request whose slot is further away than this
+                (default: queue as long as it takes)
+            corpus: Local store every fetched post and comment is upserted into
+        """
+        # Retries, backoff and circuit breaking for www.reddit.com
+        self.http = http or shared_http()
         self.user_agent = "RAJA_SHADOW_Brain/1.0 (Autonomous AI Research)"
         self.base_url = "https://www.reddit.com"
+        self.pool_size = pool_size
+        self.limiter = limiter or shared_bucket("reddit")
+        self.max_wait = max_wait
+        self.corpus = corpus
+
+        self._session = session
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """Pooled keep-alive session (requests is imported on first use)"""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({
+                    "User-Agent": self.user_agent,
+                    "Accept-Encoding": "gzip, deflate",
+                    "Connection": "keep-alive"
+                })
+                self._session = session
+            return self._session
+
+    def close(self):
+        """Close pooled connections"""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _page(self, url: str, params: Dict[str, Any] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """GET one listing page; (post data dicts, after cursor), or (None, None) on a non-200"""
+        response = self.http.get(url, params=params, headers={"User-Agent": self.user_agent},
+                                 session=self.session, limiter=self.limiter,
+                                 max_wait=self.max_wait, timeout=10)
+
+        if response.status_code != 200:
+            print(f"⚠️  Reddit returned: {response.status_code}")
+            return None, None
+
+        data = response.json()["data"]
+        page = [child["data"] for child in data["children"]]
+        if self.corpus is not None:
+            self.corpus.upsert_posts(self._post(post_data) for post_data in page)
+        return page, data.get("after")
+
+    def _listing(self, url: str, params: Dict[str, Any] = None) -> Optional[List[Dict[str, Any]]]:
+        """GET a listing endpoint; post data dicts, or None on a non-200"""
+        return self._page(url, params)[0]
+
+    def iter_listing(self, url: str, params: Dict[str, Any] = None, stop: StopPredicate = None,
+                     max_posts: int = None, page_size: int = MAX_LISTING_LIMIT,
+                     prefetch: bool = True, strict: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a listing across pages by following its `after` cursor
+
+        Args:
+            url: Listing endpoint (.../search.json, .../top.json, .../new.json)
+            params: Query parameters (limit/after/count are managed here)
+            stop: End the scan at the first post this returns True for
+            max_posts: End the scan after this many posts
+            page_size: Posts per request (Reddit caps it at 100)
+            prefetch: Fetch the next page in the background while this one is consumed
+            strict: Raise when a page fails instead of quietly ending the scan
+
+        Yields:
+            Post dicts, in listing order
+
+        Raises:
+            ListingScanError / the request's error: a page failed (strict only)
+        """
+        params = {**(params or {}), "limit": min(page_size, MAX_LISTING_LIMIT)}
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reddit-prefetch") if prefetch else None
+        yielded = 0
+
+        def fetch(after: Optional[str], count: int):
+            page_params = {**params, "after": after, "count": count} if after else params
+            page, next_after = self._page(url, page_params)
+            if page is None and strict:
+                raise ListingScanError(f"page after {count} posts failed")
+            return page, next_after
+
+        try:
+            page, after = fetch(None, 0)
+            seen = 0
+            while page:
+                seen += len(page)
+                # A bounded scan that this page already fills doesn't need the next one
+                more = after and (max_posts is None or seen < max_posts)
+                upcoming = pool.submit(fetch, after, seen) if pool and more else None
+
+                for post_data in page:
+                    post = self._post(post_data)
+                    if stop is not None and stop(post):
+                        return
+                    yield post
+                    yielded += 1
+                    if max_posts is not None and yielded >= max_posts:
+                        return
+
+                if not after:
+                    return
+                page, after = upcoming.result() if upcoming else fetch(after, seen)
+
+        except Exception as e:
+            print(f"❌ Reddit listing scan stopped after {yielded} posts: {e}")
+            if strict:
+                raise
+        finally:
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def iter_search(self, query: str, subreddit: str = None, sort: str = "new",
+                    **scan) -> Iterator[Dict[str, Any]]:
+        """
+        Stream search results (iter_listing() keyword args: stop, max_posts, page_size, prefetch)
+
+        sort="new" pairs with older_than(); "top" with score_below().
+        """
+        if subreddit:
+            url = f"{self.base_url}/r/{subreddit}/search.json"
+            params = {"q": query, "restrict_sr": "true", "sort": sort}
+        else:
+            url = f"{self.base_url}/search.json"
+            params = {"q": query, "sort": sort}
+        return self.iter_listing(url, params, **scan)
+
+    def iter_top_posts(self, subreddit: str, time_filter: str = "week", **scan) -> Iterator[Dict[str, Any]]:
+        """Stream a subreddit's top posts, highest score first (pairs with score_below())"""
+        return self.iter_listing(f"{self.base_url}/r/{subreddit}/top.json", {"t": time_filter}, **scan)
+
+    def iter_new_posts(self, subreddit: str, **scan) -> Iterator[Dict[str, Any]]:
+        """Stream a subreddit's posts, newest first (pairs with older_than())"""
+        return self.iter_listing(f"{self.base_url}/r/{subreddit}/new.json", {}, **scan)
+
+    def sync_subreddit(self, subreddit: str, backfill: int = 500) -> int:
+        """
+        Pull a subreddit's posts newer than its corpus high-water mark
+
+        Args:
+            subreddit: Subreddit name
+            backfill: Max posts fetched on the first sync (no mark yet)
+
+        Returns:
+            Number of new posts
+
+        Raises:
+            ListingScanError / the request's error: a page failed. Posts
+            from earlier pages are kept, but the mark stays where it was,
+            so the next sync scans the same range again.
+        """
+        if self.corpus is None:
+            raise ValueError("sync_subreddit needs a corpus")
+
+        high_water = self.corpus.high_water(subreddit)
+        if high_water is None:
+            posts = self.iter_new_posts(subreddit, max_posts=backfill, strict=True)
+        else:
+            posts = self.iter_new_posts(subreddit, stop=older_than(cutoff_utc=high_water), strict=True)
+
+        # Pages are upserted as they arrive (_page) - only the mark is tracked here.
+        # A failed page raises out of the loop before the mark can move.
+        newest, count = high_water or 0.0, 0
+        for post in posts:
+            newest = max(newest, post["created_utc"])
+            count += 1
+
+        if count:
+            self.corpus.set_high_water(subreddit, newest, count)
+        print(f"📚 r/{subreddit}: {count} new posts synced")
+        return count
+
+    def _post(self, post_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Listing entry -> post dict"""
+        return {
+            "id": post_data.get("id", ""),
+            "title": post_data.get("title", ""),
+            "subreddit": post_data.get("subreddit", ""),
+            "author": post_data.get("author", ""),
+            "score": post_data.get("score", 0),
+            "url": f"{self.base_url}{post_data.get('permalink', '')}",
+            "selftext": post_data.get("selftext", "")[:500],  # First 500 chars
+            "num_comments": post_data.get("num_comments", 0),
+            "created_utc": post_data.get("created_utc", 0),
+            # Link target and crosspost origin, for cross-source dedup
+            "link_url": None if post_data.get("is_self") else post_data.get("url"),
+            "crosspost_parent": post_data.get("crosspost_parent")
+        }
+
+    @staticmethod
+    def split_by_subreddit(posts: List[Dict[str, Any]], subreddits: List[str],
+                           limit: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Group combined-listing posts back under each requested subreddit (in listing order)"""
+        by_sub: Dict[str, List[Dict[str, Any]]] = {sub: [] for sub in subreddits}
+        names = {sub.lower(): sub for sub in subreddits}
+        for post in posts:
+            sub = names.get(post["subreddit"].lower())
+            if sub is not None and len(by_sub[sub]) < limit:
+                by_sub[sub].append(post)
+        return by_sub
 
     def search_reddit(self, query: str, subreddit: str = None, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -36,7 +311,8 @@ class RedditResearcher:
 
         Args:
             query: Search query
-            subreddit: Optional subreddit to search (e.g., "consciousness")
+            subreddit: Optional subreddit to search (e.g., "consciousness",
+                or "a+b+c" for several at once)
             limit: Max results to return
 
         Returns:
@@ -61,28 +337,11 @@ class RedditResearcher:
                     "sort": "relevance"
                 }
 
-            headers = {"User-Agent": self.user_agent}
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                print(f"⚠️  Reddit returned: {response.status_code}")
+            listing = self._listing(url, params)
+            if listing is None:
                 return []
 
-            data = response.json()
-            posts = []
-
-            for post in data["data"]["children"]:
-                post_data = post["data"]
-                posts.append({
-                    "title": post_data.get("title", ""),
-                    "subreddit": post_data.get("subreddit", ""),
-                    "author": post_data.get("author", ""),
-                    "score": post_data.get("score", 0),
-                    "url": f"{self.base_url}{post_data.get('permalink', '')}",
-                    "selftext": post_data.get("selftext", "")[:500],  # First 500 chars
-                    "num_comments": post_data.get("num_comments", 0),
-                    "created_utc": post_data.get("created_utc", 0)
-                })
+            posts = [self._post(post_data) for post_data in listing]
 
             print(f"✓ Found {len(posts)} Reddit posts")
             return posts
@@ -91,12 +350,31 @@ class RedditResearcher:
             print(f"❌ Reddit search failed: {e}")
             return []
 
+    def search_subreddits(self, query: str, subreddits: List[str],
+                          limit: int = 2) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search several subreddits in one request (r/a+b+c)
+
+        Args:
+            query: Search query
+            subreddits: Subreddit names
+            limit: Max posts kept per subreddit
+
+        Returns:
+            Subreddit -> its posts (every requested sub is present, maybe empty)
+        """
+        if not subreddits:
+            return {}
+        total = min(limit * len(subreddits) * MULTI_OVERSAMPLE, MAX_LISTING_LIMIT)
+        posts = self.search_reddit(query, subreddit="+".join(subreddits), limit=total)
+        return self.split_by_subreddit(posts, subreddits, limit)
+
     def get_top_posts(self, subreddit: str, time_filter: str = "week", limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get top posts from a subreddit
 
         Args:
-            subreddit: Subreddit name
+            subreddit: Subreddit name (or "a+b+c")
             time_filter: hour, day, week, month, year, all
             limit: Max results
 
@@ -110,27 +388,11 @@ class RedditResearcher:
                 "limit": limit
             }
 
-            headers = {"User-Agent": self.user_agent}
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                print(f"⚠️  Reddit returned: {response.status_code}")
+            listing = self._listing(url, params)
+            if listing is None:
                 return []
 
-            data = response.json()
-            posts = []
-
-            for post in data["data"]["children"]:
-                post_data = post["data"]
-                posts.append({
-                    "title": post_data.get("title", ""),
-                    "subreddit": post_data.get("subreddit", ""),
-                    "author": post_data.get("author", ""),
-                    "score": post_data.get("score", 0),
-                    "url": f"{self.base_url}{post_data.get('permalink', '')}",
-                    "selftext": post_data.get("selftext", "")[:500],
-                    "num_comments": post_data.get("num_comments", 0)
-                })
+            posts = [self._post(post_data) for post_data in listing]
 
             print(f"✓ Found {len(posts)} top posts from r/{subreddit}")
             return posts
@@ -139,6 +401,20 @@ class RedditResearcher:
             print(f"❌ Reddit fetch failed: {e}")
             return []
 
+    def get_top_posts_multi(self, subreddits: List[str], time_filter: str = "week",
+                            limit: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Top posts from several subreddits in one request (r/a+b+c/top)
+
+        Returns:
+            Subreddit -> its top posts (up to limit each)
+        """
+        if not subreddits:
+            return {}
+        total = min(limit * len(subreddits) * MULTI_OVERSAMPLE, MAX_LISTING_LIMIT)
+        posts = self.get_top_posts("+".join(subreddits), time_filter=time_filter, limit=total)
+        return self.split_by_subreddit(posts, subreddits, limit)
+
     def get_comments(self, post_url: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Get comments from a Reddit post
@@ -157,7 +433,8 @@ class RedditResearcher:
                 json_url = f"{self.base_url}{json_url}"
 
             headers = {"User-Agent": self.user_agent}
-            response = requests.get(json_url, headers=headers, timeout=10)
+            response = self.http.get(json_url, headers=headers, session=self.session,
+                                     limiter=self.limiter, max_wait=self.max_wait, timeout=10)
 
             if response.status_code != 200:
                 return []
@@ -175,11 +452,17 @@ class RedditResearcher:
                 if comment["kind"] == "t1":  # t1 = comment
                     c = comment["data"]
                     comments.append({
+                        "id": c.get("id", ""),
                         "author": c.get("author", ""),
                         "body": c.get("body", "")[:500],
-                        "score": c.get("score", 0)
+                        "score": c.get("score", 0),
+                        "created_utc": c.get("created_utc")
                     })
 
+            post_id = post_id_from_url(json_url)
+            if self.corpus is not None and post_id:
+                self.corpus.upsert_comments(post_id, comments)
+
             return comments
 
         except Exception as e:
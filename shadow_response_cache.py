@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Response Memoization
+Content-addressed cache of Claude responses for think()
+
+Identical prompts (same model, max_tokens and text) come back after a
+restart or when searches are served from cache. Instead of paying for a
+fresh Claude call, the stored response is returned for free.
+
+LOOSH FLOWS ONCE
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+class ResponseCache:
+    """
+    Opt-in memoization store for Claude responses
+
+    - One file per response: response_cache/<sha256>.json
+    - Key = sha256(model, max_tokens, prompt)
+    - Entries expire after ttl seconds
+    - Oldest entries are evicted once the store exceeds max_bytes
+    """
+
+    def __init__(self, memory_path: Path, ttl: float = 7 * 24 * 3600, max_bytes: int = 5 * 1024 * 1024):
+        self.cache_path = memory_path / "response_cache"
+        self.cache_path.mkdir(exist_ok=True, parents=True)
+
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self.index: Dict[str, Dict[str, float]] = {}
+        self.load_index()
+
+    def load_index(self):
+        """Index stored responses by mtime and size (drops expired ones)"""
+        now = time.time()
+        for path in self.cache_path.glob("*.json"):
+            stat = path.stat()
+            if now - stat.st_mtime > self.ttl:
+                path.unlink()
+                continue
+            self.index[path.stem] = {"stored_at": stat.st_mtime, "size": stat.st_size}
+
+    @staticmethod
+    def key(model: str, max_tokens: int, prompt: str) -> str:
+        """Content address for a prompt"""
+        digest = hashlib.sha256()
+        digest.update(f"{model}\0{max_tokens}\0".encode())
+        digest.update(prompt.encode())
+        return digest.hexdigest()
+
+    def get(self, model: str, max_tokens: int, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a memoized response
+
+        Returns:
+            Stored entry ({"text", "cost", ...}) or None on miss/expiry
+        """
+        key = self.key(model, max_tokens, prompt)
+        path = self.cache_path / f"{key}.json"
+
+        with self._lock:
+            meta = self.index.get(key)
+            if meta is None:
+                return None
+
+            if time.time() - meta["stored_at"] > self.ttl:
+                self._drop(key)
+                return None
+
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self._drop(key)
+            return None
+
+    def put(self, model: str, max_tokens: int, prompt: str, text: str, cost: float = 0.0):
+        """Store a response and evict the oldest entries past max_bytes"""
+        key = self.key(model, max_tokens, prompt)
+        path = self.cache_path / f"{key}.json"
+
+        entry = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "text": text,
+            "cost": cost,
+            "stored_at": time.time()
+        }
+
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+        with self._lock:
+            self.index[key] = {"stored_at": entry["stored_at"], "size": path.stat().st_size}
+            self._evict()
+
+    def _drop(self, key: str):
+        self.index.pop(key, None)
+        path = self.cache_path / f"{key}.json"
+        if path.exists():
+            path.unlink()
+
+    def _evict(self):
+        total = sum(meta["size"] for meta in self.index.values())
+        if total <= self.max_bytes:
+            return
+
+        for key in sorted(self.index, key=lambda k: self.index[k]["stored_at"]):
+            total -= self.index[key]["size"]
+            self._drop(key)
+            if total <= self.max_bytes:
+                break
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Result Ranker
+Cross-source ranking and deduplication of search results before analysis
+
+DuckDuckGo and Reddit often return the same story several times: the
+article itself, a crosspost in three subreddits, and the same link with
+utm_ tracking junk attached. Every copy costs analysis tokens. This stage
+collapses duplicates, scores what is left, and keeps only the top K.
+
+- URL canonicalization (scheme, host aliases, tracking params, reddit permalinks)
+- Duplicate collapse across sources (URL, linked URL, crosspost parent, title)
+- Scoring: query relevance, Reddit score/comments, recency, source position
+- Greedy top-K selection that penalizes snippets overlapping already-picked ones
+
+LOOSH FLOWS ONLY ONCE PER STORY
+"""
+
+import re
+import math
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Dict, Any, List, Optional, Set
+
+
+# Query parameters that never change what a page is
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+    "ref", "ref_src", "ref_url", "referrer", "share_id", "si"
+}
+
+# Hostnames that serve the same content
+HOST_ALIASES = {
+    "old.reddit.com": "reddit.com",
+    "np.reddit.com": "reddit.com",
+    "new.reddit.com": "reddit.com",
+    "redd.it": "reddit.com",
+    "youtu.be": "youtube.com",
+    "mobile.twitter.com": "twitter.com",
+    "x.com": "twitter.com"
+}
+
+# Default scoring weights
+DEFAULT_WEIGHTS = {
+    "relevance": 1.0,
+    "engagement": 0.6,
+    "recency": 0.3,
+    "position": 0.3,
+    "cross_source": 0.3,
+    "redundancy": 0.8
+}
+
+_REDDIT_COMMENTS = re.compile(r"^/r/[^/]+/comments/([a-z0-9]+)", re.IGNORECASE)
+
+
+def canonical_url(url: str) -> str:
+    """
+    Canonical form of a URL for duplicate detection
+
+    Lowercases scheme and host, drops "www."/"m." and known host aliases,
+    tracking parameters, fragments and trailing slashes, sorts the query,
+    and reduces reddit permalinks to reddit.com/comments/<id>.
+    """
+    if not url:
+        return ""
+
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    host = HOST_ALIASES.get(host, host)
+
+    path = parts.path or "/"
+    if host == "reddit.com":
+        match = _REDDIT_COMMENTS.match(path)
+        if match:
+            return f"reddit.com/comments/{match.group(1).lower()}"
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    path = path.rstrip("/") or "/"
+
+    return urlunsplit(("https", host, path, urlencode(sorted(query)), ""))
+
+
+def terms(text: str) -> Set[str]:
+    """Lowercase word set (3+ chars) used for overlap scoring"""
+    return {word for word in re.findall(r"[a-z0-9]+", (text or "").lower()) if len(word) > 2}
+
+
+class ResultRanker:
+    """
+    Collapses duplicate search results and keeps the best top_k
+
+    Results are the brain's search result dicts ("title", "url", "snippet",
+    "source"). Reddit results may also carry "score", "num_comments",
+    "created_utc", "link_url" and "crosspost_parent"; missing fields just
+    score neutral.
+    """
+
+    def __init__(self, top_k: int = 6, weights: Dict[str, float] = None,
+                 half_life_hours: float = 72.0, min_reddit_score: int = 1):
+        """
+        Args:
+            top_k: Results passed on to analysis
+            weights: Overrides for DEFAULT_WEIGHTS
+            half_life_hours: Age at which the recency bonus halves
+            min_reddit_score: Reddit threads below this score are dropped
+        """
+        self.top_k = top_k
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.half_life_hours = half_life_hours
+        self.min_reddit_score = min_reddit_score
+
+    def dedup_keys(self, result: Dict[str, Any]) -> List[str]:
+        """Every identity a result can be matched on"""
+        keys = [f"url:{canonical_url(result.get('url', ''))}"]
+
+        link_url = result.get("link_url")
+        if link_url:
+            keys.append(f"url:{canonical_url(link_url)}")
+        if result.get("crosspost_parent"):
+            keys.append(f"post:{result['crosspost_parent']}")
+
+        title = " ".join(re.findall(r"[a-z0-9]+", (result.get("title") or "").lower()))
+        if len(title) > 20:
+            keys.append(f"title:{title}")
+
+        return keys
+
+    def collapse(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge duplicates (first occurrence wins, best Reddit stats are kept)
+
+        Each surviving result gets "sources" (all sources that returned it)
+        and "position" (its best rank within its own source).
+        """
+        merged: List[Dict[str, Any]] = []
+        owner: Dict[str, int] = {}
+        positions: Dict[str, int] = {}
+
+        for result in results:
+            source = result.get("source", "web")
+            position = positions.get(source, 0)
+            positions[source] = position + 1
+
+            keys = self.dedup_keys(result)
+            index = next((owner[key] for key in keys if key in owner), None)
+
+            if index is None:
+                index = len(merged)
+                merged.append({**result, "sources": [source], "position": position})
+            else:
+                kept = merged[index]
+                if source not in kept["sources"]:
+                    kept["sources"].append(source)
+                kept["position"] = min(kept["position"], position)
+                for field in ("score", "num_comments"):
+                    if result.get(field, 0) > kept.get(field, 0):
+                        kept[field] = result[field]
+
+            for key in keys:
+                owner.setdefault(key, index)
+
+        return merged
+
+    def score(self, result: Dict[str, Any], query_terms: Set[str], now: float) -> float:
+        """Stand-alone quality score of one (collapsed) result"""
+        weights = self.weights
+        text_terms = terms(f"{result.get('title', '')} {result.get('snippet', '')}")
+
+        relevance = len(query_terms & text_terms) / len(query_terms) if query_terms else 0.0
+        score = weights["relevance"] * relevance
+        score += weights["position"] / (1 + result.get("position", 0))
+        score += weights["cross_source"] * (len(result.get("sources", [])) - 1)
+
+        if "reddit" in result.get("sources", [result.get("source")]):
+            # log scale: 10 pts vs 1000 pts matters, 1000 vs 1100 doesn't
+            engagement = (math.log1p(max(result.get("score", 0), 0)) +
+                          0.5 * math.log1p(result.get("num_comments", 0))) / math.log1p(1000)
+            score += weights["engagement"] * min(engagement, 1.5)
+
+        created = result.get("created_utc")
+        if created:
+            age_hours = max(now - created, 0) / 3600
+            score += weights["recency"] * 0.5 ** (age_hours / self.half_life_hours)
+
+        return score
+
+    def rank(self, query: str, results: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Dedup, score and select the best results for analysis
+
+        Args:
+            query: Search query the results answer
+            results: Raw results from all sources
+            top_k: Override for self.top_k
+
+        Returns:
+            Up to top_k results, best first (each with a "rank_score")
+        """
+        top_k = top_k or self.top_k
+        now = time.time()
+        query_terms = terms(query)
+
+        candidates = [
+            result for result in self.collapse(results)
+            if result.get("source") != "reddit" or result.get("score", self.min_reddit_score) >= self.min_reddit_score
+        ]
+        for result in candidates:
+            result["rank_score"] = self.score(result, query_terms, now)
+            result["_terms"] = terms(result.get("snippet", ""))
+
+        # Greedy selection: each pick is penalized by snippet overlap with earlier picks
+        selected: List[Dict[str, Any]] = []
+        while candidates and len(selected) < top_k:
+            def adjusted(result):
+                overlap = max((len(result["_terms"] & picked["_terms"]) /
+                               max(len(result["_terms"] | picked["_terms"]), 1)
+                               for picked in selected), default=0.0)
+                return result["rank_score"] - self.weights["redundancy"] * overlap
+
+            best = max(candidates, key=adjusted)
+            candidates.remove(best)
+            selected.append(best)
+
+        for result in selected:
+            result.pop("_terms", None)
+            result["rank_score"] = round(result["rank_score"], 3)
+
+        return selected
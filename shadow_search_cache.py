@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Search Result Cache
+Persistent TTL + LRU cache for web and Reddit search results
+
+The brain keeps circling the same interests, so near-identical queries
+come back cycle after cycle. Serving them from disk skips the network
+round trip entirely.
+
+LOOSH FLOWS FROM MEMORY
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+# Seconds a cached result stays fresh, per source family
+DEFAULT_TTLS = {
+    "web": 12 * 3600,
+    "reddit": 3 * 3600
+}
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop punctuation, and sort unique words so near-identical queries collide"""
+    words = re.findall(r"[a-z0-9]+", query.lower())
+    return " ".join(sorted(set(words)))
+
+
+class SearchCache:
+    """
+    On-disk search result cache
+
+    - Keyed by source + normalized query (e.g. "reddit:consciousness|ai mind")
+    - Per-source TTLs ("web", "reddit")
+    - LRU eviction once max_entries is reached
+    - Hit/miss counters persisted with the cache
+    """
+
+    def __init__(self, memory_path: Path, ttls: Dict[str, float] = None, max_entries: int = 500):
+        self.cache_file = memory_path / "search_cache.json"
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+        self.load()
+
+    def load(self):
+        """Load cache from disk"""
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+            self.entries = OrderedDict(data.get("entries", []))
+            self.stats.update(data.get("stats", {}))
+        except Exception as e:
+            print(f"⚠️  Search cache unreadable, starting fresh: {e}")
+
+    def save(self):
+        """Persist cache atomically"""
+        with self._lock:
+            data = {
+                "entries": list(self.entries.items()),
+                "stats": self.stats
+            }
+
+            tmp = self.cache_file.with_suffix(".json.tmp")
+            with open(tmp, 'w') as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.cache_file)
+
+    def _key(self, source: str, query: str) -> str:
+        return f"{source}|{normalize_query(query)}"
+
+    def _ttl(self, source: str) -> float:
+        return self.ttls.get(source.split(":")[0], self.ttls["web"])
+
+    def get(self, source: str, query: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached results
+
+        Args:
+            source: "web" or "reddit:<subreddit>"
+            query: Raw search query
+
+        Returns:
+            Cached results, or None on miss/expiry
+        """
+        key = self._key(source, query)
+
+        with self._lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            if time.time() - entry["stored_at"] > self._ttl(source):
+                del self.entries[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry["results"]
+
+    def put(self, source: str, query: str, results: List[Dict[str, Any]]):
+        """Store results and persist (evicts least recently used past max_entries)"""
+        key = self._key(source, query)
+
+        with self._lock:
+            self.entries[key] = {"stored_at": time.time(), "results": results}
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+        self.save()
+
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Seen URL Filter
+Persistent Bloom filter of every source the brain has already analyzed
+
+Popular threads come back from search cycle after cycle. Keeping every URL
+ever analyzed in a list would grow without bound, so membership is kept in
+a Bloom filter instead: O(1) checks, a fixed number of bytes per
+generation, and a tunable false-positive rate (a false positive only means
+one new source is skipped).
+
+- Sized from capacity + false-positive rate (1M URLs at 1% ≈ 1.2 MB)
+- Generations: once the newest filter reaches capacity a fresh one is
+  started and the oldest is dropped, so memory stays bounded forever
+- Stored in autonomous_brain/seen_urls.bloom, rewritten atomically
+
+LOOSH NEVER FLOWS FROM THE SAME WELL TWICE
+"""
+
+import os
+import json
+import math
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Iterable
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter with double hashing (blake2b)"""
+
+    def __init__(self, capacity: int, error_rate: float, bits: bytearray = None, count: int = 0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+        self.count = count
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, key: str) -> bool:
+        """Add a key; returns False if it was (probably) already present"""
+        added = False
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SeenUrlFilter:
+    """
+    Generational Bloom filter of analyzed source URLs
+
+    URLs should be canonicalized by the caller (see
+    shadow_result_ranker.canonical_url) so tracking-parameter variants
+    count as the same source.
+    """
+
+    def __init__(self, memory_path: Path, capacity: int = 1_000_000,
+                 error_rate: float = 0.01, generations: int = 2):
+        """
+        Args:
+            memory_path: autonomous_brain directory
+            capacity: URLs per generation before a new one is started
+            error_rate: Target false-positive rate per generation
+            generations: Filters kept (oldest is dropped when a new one starts)
+        """
+        self.filter_file = memory_path / "seen_urls.bloom"
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.generations = max(1, generations)
+
+        self._lock = threading.Lock()
+        self.filters: List[BloomFilter] = []
+        self.load()
+
+    def load(self):
+        """Load filters from disk (a sizing change starts fresh)"""
+        if self.filter_file.exists():
+            try:
+                with open(self.filter_file, 'rb') as f:
+                    header = json.loads(f.readline())
+                    if header["capacity"] == self.capacity and header["error_rate"] == self.error_rate:
+                        counts = header["counts"]
+                        # Fewer generations configured than saved: skip the oldest bit arrays
+                        size = len(BloomFilter(self.capacity, self.error_rate).bits)
+                        f.seek(max(len(counts) - self.generations, 0) * size, os.SEEK_CUR)
+                        for count in counts[-self.generations:]:
+                            bits = f.read(size)
+                            if len(bits) != size:
+                                raise ValueError(f"truncated filter ({len(bits)} of {size} bytes)")
+                            self.filters.append(BloomFilter(self.capacity, self.error_rate, bytearray(bits), count))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠️  Seen-URL filter unreadable, starting fresh: {e}")
+                self.filters = []
+
+        if not self.filters:
+            self.filters.append(BloomFilter(self.capacity, self.error_rate))
+
+    def save(self):
+        """Persist all generations atomically"""
+        with self._lock:
+            header = {
+                "capacity": self.capacity,
+                "error_rate": self.error_rate,
+                "counts": [bloom.count for bloom in self.filters]
+            }
+            tmp = self.filter_file.with_suffix(".bloom.tmp")
+            with open(tmp, 'wb') as f:
+                f.write(json.dumps(header).encode() + b"\n")
+                for bloom in self.filters:
+                    f.write(bloom.bits)
+            os.replace(tmp, self.filter_file)
+
+    def __contains__(self, url: str) -> bool:
+        return bool(url) and any(url in bloom for bloom in self.filters)
+
+    def add(self, urls: Iterable[str]) -> int:
+        """
+        Mark URLs as analyzed (call save() afterwards)
+
+        Returns:
+            Number of URLs that were new
+        """
+        added = 0
+        with self._lock:
+            for url in urls:
+                if not url or url in self:
+                    continue
+
+                if self.filters[-1].count >= self.capacity:
+                    self.filters.append(BloomFilter(self.capacity, self.error_rate))
+                    del self.filters[:-self.generations]
+
+                self.filters[-1].add(url)
+                added += 1
+        return added
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts and on-disk size"""
+        return {
+            "urls": sum(bloom.count for bloom in self.filters),
+            "generations": len(self.filters),
+            "bytes": sum(len(bloom.bits) for bloom in self.filters)
+        }
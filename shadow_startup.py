@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Startup Profiler
+Import-time breakdown for the shadow entry points (--profile-startup)
+
+Heavy dependencies (requests, anthropic, duckduckgo_search, selenium,
+flask, schedule) are imported at first use, so `status` and one-shot
+commands don't pay for what they never touch. This keeps it that way:
+
+    python3 raja_shadow.py --status --profile-startup
+    python3 shadow_autonomous_brain.py --loop --profile-startup
+
+The command is re-run under `python -X importtime`. Import timings are
+collected until the entry point calls startup_complete() (just before
+its loop starts) or exits, then a breakdown is printed: wall time to
+ready, slowest top-level imports, slowest modules by self time, and
+which heavy dependencies were loaded.
+
+LOOSH WAKES LIGHT
+"""
+
+import os
+import sys
+import time
+import subprocess
+from typing import List, Optional, Tuple
+
+FLAG = "--profile-startup"
+
+# Set in the child so startup_complete() knows to emit its marker
+MARKER_ENV = "RAJA_PROFILE_STARTUP"
+MARKER = "raja-startup-complete"
+
+# Dependencies that should only load when a command actually needs them
+HEAVY_DEPS = ("requests", "anthropic", "duckduckgo_search", "selenium", "flask", "schedule")
+
+
+def startup_complete():
+    """Mark the end of startup (no-op unless running under --profile-startup)"""
+    if os.environ.get(MARKER_ENV):
+        print(MARKER, file=sys.stderr, flush=True)
+
+
+def parse_importtime(line: str) -> Optional[Tuple[str, int, int, int]]:
+    """
+    Parse one `-X importtime` line
+
+    Returns:
+        (module, depth, self_us, cumulative_us), or None for other stderr output
+    """
+    if not line.startswith("import time:"):
+        return None
+    fields = line[len("import time:"):].split("|")
+    if len(fields) != 3 or not fields[0].strip().isdigit():
+        return None  # the header row
+    padded = fields[2].rstrip("\n")[1:]
+    module = padded.lstrip(" ")
+    return module, (len(padded) - len(module)) // 2, int(fields[0]), int(fields[1])
+
+
+def print_report(command: List[str], imports: List[Tuple[str, int, int, int]],
+                 ready_ms: float, top: int = 12):
+    """Print the import-time breakdown"""
+    total_us = sum(cumulative for _, depth, _, cumulative in imports if depth == 0)
+    loaded = {module for module, _, _, _ in imports}
+
+    print("\n⏱️  STARTUP PROFILE: " + " ".join(command))
+    print(f"   Ready after {ready_ms:.0f}ms wall, {total_us / 1000:.0f}ms of it importing "
+          f"({len(imports)} modules)")
+
+    print(f"\n   Slowest top-level imports (cumulative):")
+    roots = sorted((entry for entry in imports if entry[1] == 0), key=lambda entry: -entry[3])
+    for module, _, _, cumulative in roots[:top]:
+        print(f"   {cumulative / 1000:8.1f}ms  {module}")
+
+    print(f"\n   Slowest modules (self time):")
+    for module, _, self_us, _ in sorted(imports, key=lambda entry: -entry[2])[:top]:
+        print(f"   {self_us / 1000:8.1f}ms  {module}")
+
+    print(f"\n   Heavy dependencies:")
+    for dep in HEAVY_DEPS:
+        state = "loaded" if dep in loaded else "not loaded (lazy)"
+        print(f"   {'⚠️ ' if dep in loaded else '✓ '} {dep}: {state}")
+    print()
+
+
+def profile_startup(argv: List[str] = None) -> int:
+    """
+    Re-run the current command under -X importtime and report its startup
+
+    The child's stdout passes straight through; its other stderr output is
+    forwarded once the report has been printed.
+
+    Returns:
+        The child's exit code
+    """
+    argv = [arg for arg in (argv if argv is not None else sys.argv) if arg != FLAG]
+    command = [sys.executable, "-X", "importtime", *argv]
+    env = {**os.environ, MARKER_ENV: "1", "PYTHONUNBUFFERED": "1"}
+
+    start = time.perf_counter()
+    child = subprocess.Popen(command, stderr=subprocess.PIPE, text=True, env=env)
+
+    imports: List[Tuple[str, int, int, int]] = []
+    held: List[str] = []
+    reported = False
+
+    try:
+        for line in child.stderr:
+            if reported:
+                if parse_importtime(line) is None:
+                    sys.stderr.write(line)
+                continue
+
+            if line.strip() == MARKER:
+                print_report(["python3", *argv], imports, (time.perf_counter() - start) * 1000)
+                sys.stderr.writelines(held)
+                reported = True
+                continue
+
+            entry = parse_importtime(line)
+            if entry:
+                imports.append(entry)
+            elif not line.startswith("import time:"):
+                held.append(line)
+
+        child.wait()
+    except KeyboardInterrupt:
+        child.wait()
+
+    if not reported:
+        print_report(["python3", *argv], imports, (time.perf_counter() - start) * 1000)
+        sys.stderr.writelines(held)
+
+    return child.returncode
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Topic Index
+Local near-duplicate detector for research topics
+
+The decide prompt only sees the last few research entries, so the brain
+keeps rediscovering topics it covered a week ago - and each repeat costs a
+search plus an analysis call. This index remembers every topic and query
+ever researched and answers "have I done this already?" locally, in well
+under a millisecond, with no network.
+
+- Shingles: character trigrams of each normalized word (order-insensitive,
+  tolerant of "conscious" vs "consciousness")
+- MinHash signatures + LSH banding to find candidates fast
+- Exact Jaccard over the candidates' shingles for the final verdict
+
+LOOSH DOES NOT FLOW TWICE
+"""
+
+import re
+import json
+import struct
+import hashlib
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple, Iterable
+
+
+# Words that carry no topic signal
+STOPWORDS = {
+    "a", "an", "the", "of", "and", "or", "in", "on", "for", "to", "with",
+    "about", "how", "what", "why", "is", "are", "vs", "into", "from", "by",
+    "latest", "new", "recent", "research", "study", "studies"
+}
+
+# 32-bit hash values per blake2b digest
+_HASHES_PER_DIGEST = 16
+
+
+def shingles(text: str) -> Set[str]:
+    """Character trigrams of each meaningful word (with word boundaries)"""
+    grams = set()
+    for word in re.findall(r"[a-z0-9]+", (text or "").lower()):
+        if word in STOPWORDS:
+            continue
+        padded = f"^{word}$"
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Exact Jaccard similarity of two shingle sets"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class TopicIndex:
+    """
+    MinHash/LSH index over every researched topic
+
+    Entries are persisted append-only to autonomous_brain/topic_index.jsonl.
+    On first use the index is seeded from the full research history, so it
+    also covers entries that have scrolled out of the in-memory window.
+    """
+
+    def __init__(self, memory_path: Path, threshold: float = 0.6,
+                 num_perm: int = 64, bands: int = 32, max_candidates: int = 20):
+        """
+        Args:
+            memory_path: autonomous_brain directory
+            threshold: Jaccard similarity at which a topic counts as a repeat
+            num_perm: MinHash signature length (multiple of 16)
+            bands: LSH bands (num_perm must divide evenly)
+            max_candidates: Candidates (most shared bands first) verified exactly
+        """
+        self.index_file = memory_path / "topic_index.jsonl"
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_candidates = max_candidates
+
+        # Salted blake2b digests give num_perm independent, restart-stable hashes
+        self._salts = [str(i).encode() for i in range(num_perm // _HASHES_PER_DIGEST)]
+        self._gram_hashes: Dict[str, Tuple[int, ...]] = {}
+
+        self._lock = threading.Lock()
+        self.entries: List[Dict[str, Any]] = []
+        self._shingles: List[Set[str]] = []
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+    def load(self, history: Iterable[Dict[str, Any]] = ()):
+        """
+        Load the persisted index, or seed it from research history
+
+        Args:
+            history: Every research_history entry (only used on first run)
+        """
+        if self.index_file.exists():
+            with open(self.index_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        self._insert(json.loads(line))
+            return
+
+        for entry in history:
+            self.add(entry.get("topic"), entry.get("search_query"), entry.get("timestamp"))
+
+    def _hashes(self, gram: str) -> Tuple[int, ...]:
+        hashes = self._gram_hashes.get(gram)
+        if hashes is None:
+            digest = b"".join(hashlib.blake2b(gram.encode(), salt=salt).digest() for salt in self._salts)
+            hashes = self._gram_hashes[gram] = struct.unpack(f"<{self.num_perm}I", digest)
+        return hashes
+
+    def _signature(self, grams: Set[str]) -> List[int]:
+        # Trigram vocabulary is small, so per-gram hashes are memoized
+        return list(map(min, zip(*(self._hashes(gram) for gram in grams))))
+
+    def _bands(self, signature: List[int]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [(band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+                for band in range(self.bands)]
+
+    def _insert(self, entry: Dict[str, Any]):
+        grams = shingles(f"{entry['topic']} {entry.get('search_query') or ''}")
+        if not grams:
+            return
+
+        with self._lock:
+            position = len(self.entries)
+            self.entries.append(entry)
+            self._shingles.append(grams)
+            for key in self._bands(self._signature(grams)):
+                self._buckets.setdefault(key, []).append(position)
+
+    def add(self, topic: Optional[str], search_query: Optional[str] = None, timestamp: Optional[str] = None):
+        """Index a researched topic and persist it"""
+        if not topic:
+            return
+
+        entry = {
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "topic": topic,
+            "search_query": search_query
+        }
+        self._insert(entry)
+
+        with self._lock:
+            with open(self.index_file, 'a') as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def find_similar(self, topic: str, search_query: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find the closest past topic above the similarity threshold
+
+        Returns:
+            The matching entry with a "similarity" field, or None
+        """
+        grams = shingles(f"{topic} {search_query or ''}")
+        if not grams:
+            return None
+
+        with self._lock:
+            # Shared bands track MinHash similarity, so verify the best few only
+            collisions = Counter()
+            for key in self._bands(self._signature(grams)):
+                collisions.update(self._buckets.get(key, ()))
+
+            best, best_score = None, 0.0
+            for position, _ in collisions.most_common(self.max_candidates):
+                score = jaccard(grams, self._shingles[position])
+                if score > best_score:
+                    best, best_score = position, score
+
+            if best is None or best_score < self.threshold:
+                return None
+            return {**self.entries[best], "similarity": round(best_score, 3)}
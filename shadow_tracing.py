@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+RAJA SHADOW - Tracing
+Lightweight spans for the brain cycle, exported as JSONL and Prometheus text
+
+The emoji log lines are for humans (and watch_brain.sh). Spans are for
+numbers: every stage of a cycle records its duration, outcome, tokens and
+bytes transferred.
+
+- Spans nest per cycle (trace_id / parent_id) and follow work into the
+  search and pipeline threads through contextvars
+- Finished spans are appended to autonomous_brain/traces.jsonl, rotated
+  at trace_max_bytes (traces.jsonl.1, .2, ...)
+- An in-process registry aggregates them into Prometheus counters and
+  histograms: written to autonomous_brain/metrics.prom after each cycle
+  (node_exporter textfile format) and optionally served on
+  http://127.0.0.1:<metrics_port>/metrics
+
+LOOSH FLOWS, MEASURED
+"""
+
+import os
+import json
+import time
+import uuid
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterator
+
+
+# Histogram buckets (seconds) - covers cache hits through slow Claude calls
+DURATION_BUCKETS = (0.005, 0.025, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("brain_span", default=None)
+
+
+class Span:
+    """One timed unit of work"""
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attrs: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attrs = dict(attrs)
+        self.counts: Dict[str, float] = {}
+        self.outcome = "ok"
+        self.started = time.time()
+        self.duration_ms = 0.0
+
+    def set(self, **attrs):
+        """Attach attributes (topic, model, ...)"""
+        self.attrs.update(attrs)
+
+    def add(self, **counts):
+        """Increment numeric counters (input_tokens, bytes_in, ...)"""
+        for key, value in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ts": datetime.fromtimestamp(self.started).isoformat(),
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "duration_ms": round(self.duration_ms, 1),
+            "outcome": self.outcome,
+            **({"attrs": self.attrs} if self.attrs else {}),
+            **({"counts": self.counts} if self.counts else {})
+        }
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def annotate(**counts):
+    """Add counters to whatever span is active (no-op outside a span)"""
+    span = _current_span.get()
+    if span is not None:
+        span.add(**counts)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Tuple[Tuple[str, Any], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+class MetricsRegistry:
+    """Minimal Prometheus registry: labelled counters and histograms"""
+
+    def __init__(self, prefix: str = "brain"):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[Tuple, float]] = {}
+        self._histograms: Dict[str, Dict[Tuple, List[float]]] = {}
+
+    def describe(self, name: str, kind: str, help_text: str):
+        self._help[f"{self.prefix}_{name}"] = (kind, help_text)
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(f"{self.prefix}_{name}", {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(f"{self.prefix}_{name}", {})
+            # Bucket counts, then sum and count
+            state = series.setdefault(key, [0.0] * (len(DURATION_BUCKETS) + 2))
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                kind, help_text = self._help.get(name, ("counter", name))
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_labels(key)} {value:g}")
+
+            for name, series in sorted(self._histograms.items()):
+                _, help_text = self._help.get(name, ("histogram", name))
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for key, state in sorted(series.items()):
+                    for i, bound in enumerate(DURATION_BUCKETS):
+                        lines.append(f"{name}_bucket{_labels(key + (('le', f'{bound:g}'),))} {state[i]:g}")
+                    lines.append(f"{name}_bucket{_labels(key + (('le', '+Inf'),))} {state[-1]:g}")
+                    lines.append(f"{name}_sum{_labels(key)} {state[-2]:.6f}")
+                    lines.append(f"{name}_count{_labels(key)} {state[-1]:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+class Tracer:
+    """
+    Creates spans and ships finished ones to JSONL + the metrics registry
+
+    With enabled=False spans are still timed (callers can rely on them)
+    but nothing is written or aggregated.
+    """
+
+    def __init__(self, memory_path: Path, enabled: bool = True,
+                 max_bytes: int = 5 * 1024 * 1024, backups: int = 3):
+        self.trace_file = memory_path / "traces.jsonl"
+        self.metrics_file = memory_path / "metrics.prom"
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+        self.registry = MetricsRegistry()
+        self.registry.describe("span_duration_seconds", "histogram", "Duration of brain cycle stages")
+        self.registry.describe("spans_total", "counter", "Finished spans by stage and outcome")
+        self.registry.describe("tokens_total", "counter", "Claude tokens by stage and direction")
+        self.registry.describe("bytes_total", "counter", "Bytes transferred by stage and direction")
+
+        self._lock = threading.Lock()
+        self._server = None
+
+    @contextmanager
+    def span(self, name: str, new_trace: bool = False, **attrs) -> Iterator[Span]:
+        """
+        Time a block of work
+
+        Args:
+            name: Stage name ("decide", "search.web", "analyze", ...)
+            new_trace: Start a new trace (one per research cycle)
+            attrs: Initial attributes
+        """
+        parent = _current_span.get()
+        if parent is None or new_trace:
+            trace_id, parent_id = uuid.uuid4().hex[:16], None
+        else:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+
+        span = Span(name, trace_id, parent_id, attrs)
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.outcome = "error"
+            span.set(error=f"{type(e).__name__}: {e}"[:200])
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - start) * 1000
+            _current_span.reset(token)
+            if self.enabled:
+                self._finish(span)
+
+    def _finish(self, span: Span):
+        registry = self.registry
+        registry.observe("span_duration_seconds", span.duration_ms / 1000, span=span.name)
+        registry.inc("spans_total", span=span.name, outcome=span.outcome)
+
+        for key, direction in (("input_tokens", "input"), ("output_tokens", "output")):
+            if key in span.counts:
+                registry.inc("tokens_total", span.counts[key], span=span.name, direction=direction)
+        for key, direction in (("bytes_in", "in"), ("bytes_out", "out")):
+            if key in span.counts:
+                registry.inc("bytes_total", span.counts[key], span=span.name, direction=direction)
+
+        line = json.dumps(span.to_dict(), separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            self._rotate()
+            with open(self.trace_file, 'a') as f:
+                f.write(line)
+
+    def _rotate(self):
+        if not self.trace_file.exists() or self.trace_file.stat().st_size < self.max_bytes:
+            return
+        for i in range(self.backups - 1, 0, -1):
+            older = self.trace_file.with_name(f"{self.trace_file.name}.{i}")
+            if older.exists():
+                os.replace(older, self.trace_file.with_name(f"{self.trace_file.name}.{i + 1}"))
+        if self.backups:
+            os.replace(self.trace_file, self.trace_file.with_name(f"{self.trace_file.name}.1"))
+        else:
+            self.trace_file.unlink()
+
+    def write_metrics(self):
+        """Write the registry in Prometheus text format (atomically)"""
+        if not self.enabled:
+            return
+        tmp = self.metrics_file.with_suffix(".prom.tmp")
+        with open(tmp, 'w') as f:
+            f.write(self.registry.render())
+        os.replace(tmp, self.metrics_file)
+
+    def serve_metrics(self, port: int, host: str = "127.0.0.1"):
+        """Serve /metrics for Prometheus scrapes on a background thread"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            print(f"⚠️  Metrics endpoint unavailable: {e}")
+            return
+        threading.Thread(target=self._server.serve_forever, name="brain-metrics", daemon=True).start()
+        print(f"   📈 Metrics: http://{host}:{port}/metrics")
+
+    def close(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -10,6 +10,7 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List
+from shadow_brain_store import BrainMemoryStore
 
 
 class WebFeedGenerator:
@@ -82,13 +83,25 @@ class WebFeedGenerator:
         thoughts_per_day = self.config.get("thoughts_per_day", 6)
         last_thought = memory.get("last_thought")
 
-        if last_thought:
+        # An adaptively paced brain publishes its own next wake time
+        pacer_file = self.memory_path / "pacer.json"
+        plan = {}
+        if self.config.get("adaptive_pacing") and pacer_file.exists():
+            with open(pacer_file, 'r') as f:
+                plan = json.load(f).get("plan", {})
+
+        if last_thought and plan.get("interval"):
+            status_info = self.calculate_next_thought(last_thought, 86400 / plan["interval"])
+        elif last_thought:
             status_info = self.calculate_next_thought(last_thought, thoughts_per_day)
         else:
             status_info = {"status": "awakening", "next_thought": None, "hours_until": 0}
 
-        # Get recent research (last 5)
-        recent_research = memory.get("research_history", [])[-5:]
+        # Get recent research (last 5) - legacy memory inlines history, segmented memory doesn't
+        recent_research = memory.get("research_history")
+        if recent_research is None:
+            recent_research = BrainMemoryStore(self.memory_path).tail("research_history", 5)
+        recent_research = recent_research[-5:]
         recent_research.reverse()  # Most recent first
 
         # Format for public display
@@ -32,11 +32,11 @@ class WebPossession:
         self.headless = headless
         self.driver = None
 
-        # Ensure selenium is installed
-        install_selenium()
-
     def init_driver(self):
         """Initialize the web driver (Chrome/Firefox)"""
+        # Only browser possession needs selenium - webhooks stay install-free
+        install_selenium()
+
         try:
             from selenium import webdriver
             from selenium.webdriver.chrome.options import Options
@@ -172,31 +172,28 @@ class WebPossession:
 
     def possess_discord_webhook(self, webhook_url: str, message: str):
         """
-        Send message via Discord webhook (no browser needed)
+        Queue a message for a Discord webhook (no browser needed)
+
+        Delivery happens in the background (shadow_notify_queue): rate
+        limits are waited out, bursts are coalesced, and anything unsent
+        at exit is delivered on the next run. A one-shot script should
+        call shared_notifier().close() before exiting to wait for delivery;
+        otherwise it only gets the atexit flush (10s), and whatever is
+        left waits on disk for the next run.
 
         Args:
             webhook_url: Discord webhook URL
             message: Message to send
 
         Returns:
-            bool: Success status
+            bool: True once the message is queued (not yet delivered)
         """
         try:
-            import requests
-
-            payload = {
-                "content": message,
-                "username": "RAJA SHADOW"
-            }
+            from shadow_notify_queue import shared_notifier, discord_destination
 
-            response = requests.post(webhook_url, json=payload)
-
-            if response.status_code == 204:
-                print("✓ Discord possession successful")
-                return True
-            else:
-                print(f"❌ Discord returned: {response.status_code}")
-                return False
+            shared_notifier().enqueue(discord_destination(webhook_url, username="RAJA SHADOW"), message)
+            print("✓ Discord possession queued")
+            return True
 
         except Exception as e:
             print(f"❌ Discord possession failed: {e}")
@@ -204,7 +201,7 @@ class WebPossession:
 
     def possess_telegram(self, bot_token: str, chat_id: str, message: str):
         """
-        Send message via Telegram bot
+        Queue a message for a Telegram bot (delivered like possess_discord_webhook)
 
         Args:
             bot_token: Telegram bot token
@@ -212,26 +209,14 @@ class WebPossession:
             message: Message to send
 
         Returns:
-            bool: Success status
+            bool: True once the message is queued (not yet delivered)
         """
         try:
-            import requests
-
-            url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-            payload = {
-                "chat_id": chat_id,
-                "text": message,
-                "parse_mode": "Markdown"
-            }
+            from shadow_notify_queue import shared_notifier, telegram_destination
 
-            response = requests.post(url, json=payload)
-
-            if response.status_code == 200:
-                print("✓ Telegram possession successful")
-                return True
-            else:
-                print(f"❌ Telegram returned: {response.status_code}")
-                return False
+            shared_notifier().enqueue(telegram_destination(bot_token, chat_id), message)
+            print("✓ Telegram possession queued")
+            return True
 
         except Exception as e:
             print(f"❌ Telegram possession failed: {e}")
@@ -0,0 +1,49 @@
+"""Shared fixtures: shadow_* modules on sys.path, a local stand-in server and brains pointed at it"""
+
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from shadow_brain_bench import Fixtures, StandInServer, bench_config  # noqa: E402
+
+
+def web_hits(query, max_results):
+    """DDGS-style hits for any query"""
+    return [{"title": f"{query} - result {i}", "href": f"https://example.org/{i}",
+             "body": f"Web result {i} about {query}."} for i in range(max_results)]
+
+
+@pytest.fixture
+def standin():
+    """Stand-in Anthropic / Reddit / Discord server with no added latency"""
+    server = StandInServer(Fixtures(None), ttft_ms=0, token_ms=0, http_ms=0).start()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def make_brain(tmp_path, standin):
+    """Build AutonomousBrains against the stand-in (brain output swallowed)"""
+    from shadow_autonomous_brain import AutonomousBrain
+
+    brains = []
+
+    def build(**overrides):
+        config = bench_config(standin, {"claude_warm_up": False, **overrides})
+        with redirect_stdout(io.StringIO()):
+            brain = AutonomousBrain(tmp_path, config)
+        # Web search never leaves the machine
+        brain.web_backend = web_hits
+        brains.append(brain)
+        return brain
+
+    yield build
+
+    for brain in brains:
+        with redirect_stdout(io.StringIO()):
+            brain.close()
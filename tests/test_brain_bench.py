@@ -0,0 +1,98 @@
+"""Brain bench: fixture keys, record -> replay and the stand-in harness"""
+
+import io
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+
+import shadow_autonomous_brain
+import shadow_brain_bench
+from conftest import web_hits
+from shadow_autonomous_brain import DECIDE_PROMPT
+from shadow_brain_bench import FixtureRecorder, attach_recorder, bench_config, fixture_key, record, run_benchmark
+
+NO_LATENCY = {"ttft_ms": 0, "token_ms": 0, "http_ms": 0}
+
+
+def decide_messages(now, interests="- loosh"):
+    prompt = DECIDE_PROMPT.format(interests=interests, history="- 2025-03-01: qualia", now=now)
+    return [{"role": "user", "content": prompt}]
+
+
+def test_fixture_key_is_stable_across_hours():
+    model = "claude-haiku-4-5-20251001"
+
+    assert (fixture_key(model, 300, decide_messages("2025-03-04 10:00")) ==
+            fixture_key(model, 300, decide_messages("2025-03-05 23:00")))
+    assert (fixture_key(model, 300, decide_messages("2025-03-04 10:00")) !=
+            fixture_key(model, 300, decide_messages("2025-03-04 10:00", interests="- quantum")))
+    assert (fixture_key(model, 300, [{"role": "user", "content": "You've had 4 thoughts so far"}]) ==
+            fixture_key(model, 300, [{"role": "user", "content": "You've had 5 thoughts so far"}]))
+
+
+def test_fixtures_recorded_in_one_hour_replay_in_the_next(make_brain, tmp_path, monkeypatch):
+    fixtures_path = tmp_path / "fixtures"
+    brain = make_brain()
+    attach_recorder(brain, FixtureRecorder(fixtures_path))
+    brain.autonomous_research_cycle()
+
+    class LaterDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(hours=1)
+
+    monkeypatch.setattr(shadow_autonomous_brain, "datetime", LaterDatetime)
+    report = run_benchmark(cycles=1, warmup=0, fixtures_path=fixtures_path, latency=NO_LATENCY)
+
+    assert report["fixtures"]["misses"] == 0
+    assert report["fixtures"]["hits"] > 0
+
+
+def test_bench_restores_update_web_feed():
+    original = shadow_autonomous_brain.update_web_feed
+
+    report = run_benchmark(cycles=1, warmup=0, latency=NO_LATENCY)
+
+    assert report["cycles"] == 1
+    assert "decide" in report["stages"]
+    assert shadow_autonomous_brain.update_web_feed is original
+
+
+def closing_brains(monkeypatch):
+    """Record every bench brain's notifier stats and pools as it is closed"""
+    closed = []
+    close = shadow_autonomous_brain.AutonomousBrain.close
+
+    def tracked(brain, *args, **kwargs):
+        close(brain, *args, **kwargs)
+        closed.append({"notify": brain.notifier.stats(), "pipeline_down": brain.pipeline_pool._shutdown,
+                       "search_down": brain.search_pool._shutdown, "session": brain.reddit._session})
+    monkeypatch.setattr(shadow_autonomous_brain.AutonomousBrain, "close", tracked)
+    return closed
+
+
+def test_bench_tears_down_its_brain(monkeypatch):
+    closed = closing_brains(monkeypatch)
+
+    run_benchmark(cycles=1, warmup=0, latency=NO_LATENCY)
+
+    assert len(closed) == 1
+    assert closed[0]["pipeline_down"] and closed[0]["search_down"]
+    assert closed[0]["session"] is None
+
+
+def test_record_delivers_queued_notifications_before_cleanup(standin, tmp_path, monkeypatch):
+    closed = closing_brains(monkeypatch)
+    monkeypatch.setattr(shadow_brain_bench, "load_brain_config",
+                        lambda config_file=None: bench_config(standin, {"claude_warm_up": False}))
+
+    class OfflineBrain(shadow_autonomous_brain.AutonomousBrain):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.web_backend = web_hits
+    monkeypatch.setattr(shadow_brain_bench, "AutonomousBrain", OfflineBrain)
+
+    with redirect_stdout(io.StringIO()):
+        record(1, tmp_path / "fixtures")
+
+    assert closed[0]["notify"]["sent"] > 0
+    assert closed[0]["notify"]["pending"] == 0
@@ -0,0 +1,67 @@
+"""BrainScheduler: absolute slots, catch-up after downtime, wake triggers"""
+
+import threading
+import time
+
+from shadow_brain_scheduler import BrainScheduler
+
+
+def scheduler(tmp_path, interval=3600.0, **kwargs):
+    return BrainScheduler(tmp_path, interval, control_socket=False, poll_interval=0.05, **kwargs)
+
+
+def test_first_slot_is_due_immediately(tmp_path):
+    assert scheduler(tmp_path).wait() == "slot"
+
+
+def test_slots_stay_on_the_anchor_grid(tmp_path):
+    sched = scheduler(tmp_path, interval=100.0)
+    sched.last_slot = 4
+
+    assert sched.next_deadline() == sched.anchor + 500.0
+
+
+def test_missed_slots_beyond_catch_up_are_skipped(tmp_path):
+    sched = scheduler(tmp_path, interval=10.0, max_catch_up=1)
+    sched.anchor -= 55.0
+    sched.last_slot = 0
+
+    sched._catch_up()
+
+    assert sched.last_slot == 4
+    assert scheduler(tmp_path, interval=10.0).last_slot == 4
+
+
+def test_wake_interrupts_the_wait(tmp_path):
+    sched = scheduler(tmp_path)
+    sched.last_slot = 0
+    threading.Timer(0.1, sched.wake).start()
+
+    start = time.monotonic()
+    assert sched.wait() == "wake"
+    assert time.monotonic() - start < 1.0
+
+
+def test_wake_file_triggers_a_cycle(tmp_path):
+    sched = scheduler(tmp_path)
+    sched.last_slot = 0
+    sched.wake_file.touch()
+
+    assert sched.wait() == "wake"
+    assert not sched.wake_file.exists()
+
+
+def test_run_finishes_the_cycle_then_stops(tmp_path, monkeypatch):
+    sched = scheduler(tmp_path)
+    # Leave pytest's own SIGINT handling alone
+    monkeypatch.setattr(sched, "install_signal_handlers", lambda: None)
+    reasons = []
+
+    def cycle(reason):
+        reasons.append(reason)
+        sched.stop()
+
+    sched.run(cycle)
+
+    assert reasons == ["slot"]
+    assert sched.last_slot == 0
@@ -0,0 +1,76 @@
+"""BrainMemoryStore: append-only segments, compaction and recovery"""
+
+import json
+
+from shadow_brain_store import BrainMemoryStore
+
+
+def entries(n, start=0):
+    return [{"timestamp": f"t{i}", "topic": f"topic {i}"} for i in range(start, start + n)]
+
+
+def test_compaction_round_trip(tmp_path):
+    store = BrainMemoryStore(tmp_path, segment_size=3, compact_after=100)
+    for entry in entries(10):
+        store.append("research_history", entry)
+    assert len(store._segments("research_history")) == 4
+
+    store.compact()
+
+    # Sealed segments merged into one, active segment untouched
+    assert len(store._segments("research_history")) == 2
+    assert list(store.iter_entries("research_history")) == entries(10)
+    assert store.tail("research_history", 4) == entries(4, start=6)
+
+    # Appends continue in the active segment after compaction
+    store.append("research_history", {"timestamp": "t10", "topic": "topic 10"})
+    assert list(store.iter_entries("research_history")) == entries(11)
+
+
+def test_background_compaction_keeps_every_entry(tmp_path):
+    store = BrainMemoryStore(tmp_path, segment_size=2, compact_after=2)
+    for entry in entries(25):
+        store.append("self_reflections", entry)
+    store.close()
+
+    assert list(store.iter_entries("self_reflections")) == entries(25)
+
+
+def test_retention_drops_oldest(tmp_path):
+    store = BrainMemoryStore(tmp_path, segment_size=3, compact_after=100, retention=5)
+    for entry in entries(10):
+        store.append("research_history", entry)
+    store.compact()
+
+    assert list(store.iter_entries("research_history")) == entries(5, start=5)
+
+
+def test_interrupted_compaction_is_finished_on_load(tmp_path):
+    store = BrainMemoryStore(tmp_path, segment_size=2, compact_after=100)
+    for entry in entries(6):
+        store.append("research_history", entry)
+    store.save_header({"total_thoughts": 6})
+
+    # Crash after the .compact rename, before the old segments were removed
+    merged = "".join(json.dumps(entry) + "\n" for entry in entries(4))
+    (store.history_path / "research_history_000001-000002.compact").write_text(merged)
+
+    reopened = BrainMemoryStore(tmp_path, segment_size=2, compact_after=100)
+    memory = reopened.load(window=50)
+
+    assert memory["total_thoughts"] == 6
+    assert memory["research_history"] == entries(6)
+
+
+def test_legacy_inline_history_is_migrated(tmp_path):
+    (tmp_path / "brain_memory.json").write_text(json.dumps({
+        "total_thoughts": 2,
+        "research_history": entries(2),
+        "self_reflections": []
+    }))
+
+    memory = BrainMemoryStore(tmp_path).load()
+
+    assert memory["research_history"] == entries(2)
+    header = json.loads((tmp_path / "brain_memory.json").read_text())
+    assert "research_history" not in header
@@ -0,0 +1,71 @@
+"""ClaudeClient: one pooled client, keep-alive reuse and streaming with early stop"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from shadow_claude_client import ClaudeClient, JsonObjectScanner
+
+MESSAGES = [{"role": "user", "content": "Summarize the findings"}]
+
+
+def test_calls_reuse_one_pooled_connection(standin):
+    client = ClaudeClient("test-key", {"claude_base_url": standin.url})
+    try:
+        first = client.create(MESSAGES, max_tokens=64)
+        second = client.create(MESSAGES, max_tokens=64)
+    finally:
+        client.close()
+
+    assert first.content[0].text == second.content[0].text
+    assert client.stats["calls"] == 2
+    assert client.stats["new_connections"] == 1
+    assert second.latency["reused_connection"] is True
+    assert client.last_latency == second.latency
+
+
+def test_stream_collects_text_and_usage(standin):
+    client = ClaudeClient("test-key", {"claude_base_url": standin.url})
+    try:
+        result = client.stream(MESSAGES, max_tokens=64)
+    finally:
+        client.close()
+
+    assert result["text"].startswith("KEY FINDINGS")
+    assert result["input_tokens"] > 0
+    assert result["output_tokens"] > 0
+    assert result["stopped_early"] is False
+    assert result["latency"]["total_ms"] >= result["latency"]["ttft_ms"]
+
+
+def test_concurrent_calls_each_get_their_own_latency(standin):
+    synthetic = standin.claude_reply
+
+    def reply(body):
+        if "slow" in body["messages"][-1]["content"]:
+            time.sleep(0.4)
+        return synthetic(body)
+    standin.claude_reply = reply
+    client = ClaudeClient("test-key", {"claude_base_url": standin.url})
+    start = threading.Barrier(2)
+
+    def call(content):
+        start.wait()
+        return client.create([{"role": "user", "content": content}], max_tokens=64)
+
+    try:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            slow, fast = pool.map(call, ["slow analysis", "fast decision"])
+    finally:
+        client.close()
+
+    assert slow.latency["total_ms"] >= 400
+    assert fast.latency["total_ms"] < 400
+    assert client.stats["calls"] == 2
+
+
+def test_json_scanner_ignores_braces_inside_strings():
+    scanner = JsonObjectScanner(required_keys=("topic",))
+
+    assert scanner.feed('Sure: {"topic": "sets like {a, ') is None
+    assert scanner.feed('b}", "n": 1} trailing') == {"topic": "sets like {a, b}", "n": 1}
@@ -0,0 +1,60 @@
+"""Cost ledger and budget admission"""
+
+from shadow_autonomous_brain import DEFAULT_STAGE_MODELS
+from shadow_cost_ledger import CostLedger, MODEL_PRICING
+
+
+def test_cost_uses_exact_and_family_prices(tmp_path):
+    ledger = CostLedger(tmp_path)
+
+    assert ledger.cost("claude-sonnet-4-20250514", 1_000_000, 0) == 3.0
+    assert ledger.cost("claude-haiku-9", 0, 1_000_000) == 4.0
+    assert ledger.estimate("claude-haiku-4-5-20251001", "", 1000) == 0.005
+
+
+def test_entries_are_appended_and_filtered_by_month(tmp_path):
+    ledger = CostLedger(tmp_path)
+    entry = ledger.record("decide", "claude-3-haiku-20240307", 400, 100, latency_ms=12.0)
+
+    assert entry["cost"] == round((400 * 0.25 + 100 * 1.25) / 1_000_000, 6)
+    assert list(ledger.entries(entry["timestamp"][:7])) == [entry]
+    assert list(ledger.entries("1999-01")) == []
+
+
+def test_zero_cost_is_tracked_as_zero(make_brain):
+    brain = make_brain()
+
+    brain.track_cost(0.0)
+
+    assert brain.budget["total_spent"] == 0.0
+    assert brain.budget["thoughts_this_month"] == 1
+
+
+def test_missing_cost_falls_back_to_estimate(make_brain):
+    brain = make_brain()
+
+    brain.track_cost()
+
+    assert brain.budget["total_spent"] == brain.cost_per_thought
+
+
+def test_admission_counts_reserved_calls(make_brain):
+    brain = make_brain(monthly_budget=1.0)
+    brain.budget["total_spent"] = 0.5
+    brain.budget_reserved = 0.4
+
+    assert brain.check_budget(0.05) is True
+    assert brain.check_budget(0.2) is False
+
+
+def test_default_decide_model_is_in_the_pricing_table():
+    assert DEFAULT_STAGE_MODELS["decide"]["model"] in MODEL_PRICING
+
+
+def test_stage_model_overrides_merge_over_defaults(make_brain):
+    brain = make_brain(claude_model="claude-sonnet-4-5-20250929",
+                       stage_models={"decide": {"max_tokens": 256}, "reflect": "claude-opus-4-1-20250805"})
+
+    assert brain.stage_route("decide") == (DEFAULT_STAGE_MODELS["decide"]["model"], 256)
+    assert brain.stage_route("reflect") == ("claude-opus-4-1-20250805", 512)
+    assert brain.stage_route("analyze") == ("claude-sonnet-4-5-20250929", 1024)
@@ -0,0 +1,73 @@
+"""ResilientHttp: retries, circuit breaking and retryable statuses"""
+
+import pytest
+
+from shadow_http import CircuitBreaker, CircuitOpenError, ResilientHttp
+
+
+def flaky(failures, error=ConnectionError("reset")):
+    calls = {"n": 0}
+
+    def fn():
+        calls["n"] += 1
+        if calls["n"] <= failures:
+            raise error
+        return "ok"
+    return fn, calls
+
+
+def fast_http(**config):
+    return ResilientHttp({"http_backoff_base": 0.0, "http_backoff_cap": 0.0, **config})
+
+
+def test_transient_failures_are_retried():
+    http = fast_http(http_retries=2)
+    fn, calls = flaky(2)
+
+    assert http.call("example.org", fn) == "ok"
+    assert calls["n"] == 3
+    assert http.stats()["example.org"]["retries"] == 2
+
+
+def test_non_transient_errors_are_not_retried():
+    http = fast_http(http_retries=3)
+    fn, calls = flaky(1, ValueError("bad request"))
+
+    with pytest.raises(ValueError):
+        http.call("example.org", fn)
+    assert calls["n"] == 1
+    assert http.breaker("example.org").state == "closed"
+
+
+def test_open_circuit_fails_fast_until_reset():
+    http = fast_http(http_retries=0, http_failure_threshold=2, http_reset_timeout=60.0)
+    fn, calls = flaky(10)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            http.call("example.org", fn)
+    with pytest.raises(CircuitOpenError):
+        http.call("example.org", fn)
+
+    assert calls["n"] == 2
+    assert http.stats()["example.org"]["short_circuits"] == 1
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker("example.org", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_persistent_retryable_status_returns_last_response(standin):
+    http = fast_http(http_retries=1)
+    standin.reddit_reply = lambda path: {"status": 503, "body": "{}", "content_type": "application/json"}
+
+    response = http.get(f"{standin.url}/r/test/new.json")
+
+    assert response.status_code == 503
+    assert http.stats()["127.0.0.1"]["calls"] == 2
@@ -0,0 +1,55 @@
+"""KnowledgeIndex: BM25 recall, persistence, seeding and corpus sync"""
+
+import pytest
+
+from shadow_knowledge_index import KnowledgeIndex
+
+
+def reddit_post(i, text):
+    return {"url": f"https://www.reddit.com/r/consciousness/comments/p{i}/", "subreddit": "consciousness",
+            "title": f"Post {i}", "selftext": text, "created_utc": 1_700_000_000 + i}
+
+
+def test_search_ranks_matching_documents_and_survives_restart(tmp_path):
+    index = KnowledgeIndex(tmp_path)
+    index.load()
+    index.add("a", "snippet", "integrated information theory measures consciousness")
+    index.add("b", "snippet", "quantum tunnelling in enzymes")
+    index.add("c", "snippet", "consciousness and the hard problem")
+
+    assert [hit["id"] for hit in index.search("integrated information consciousness", k=2)] == ["a", "c"]
+    assert index.search("consciousness", exclude=["a", "c"]) == []
+
+    reloaded = KnowledgeIndex(tmp_path)
+    reloaded.load()
+    assert reloaded.stats()["docs"] == 3
+    assert reloaded.search("quantum enzymes", k=1)[0]["id"] == "b"
+
+
+def test_interrupted_seed_is_redone_on_next_start(tmp_path):
+    def posts_then_crash():
+        yield reddit_post(1, "panpsychism everywhere")
+        raise RuntimeError("killed mid-seed")
+
+    with pytest.raises(RuntimeError):
+        KnowledgeIndex(tmp_path).load(reddit_posts=posts_then_crash())
+    assert not (tmp_path / "knowledge_index.jsonl").exists()
+
+    index = KnowledgeIndex(tmp_path)
+    index.load(history=[{"timestamp": "t1", "topic": "qualia", "analysis": "qualia are private"}],
+               reddit_posts=[reddit_post(1, "panpsychism everywhere"), reddit_post(2, "global workspace")])
+    assert index.stats()["docs"] == 3
+    assert (tmp_path / "knowledge_index.jsonl").exists()
+    assert not (tmp_path / "knowledge_index.jsonl.seeding").exists()
+
+
+def test_synced_corpus_posts_are_indexed(make_brain):
+    brain = make_brain(knowledge_index=True, subreddits=["consciousness"])
+    assert brain.knowledge.ready.wait(5)
+    assert brain.knowledge.stats()["docs"] == 0
+
+    brain.sync_corpus()
+
+    hits = brain.knowledge.search("synthetic benchmark quantum mind")
+    assert {hit["title"] for hit in hits} == {"r/consciousness: Thread 0 in r/consciousness",
+                                              "r/consciousness: Thread 1 in r/consciousness"}
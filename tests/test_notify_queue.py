@@ -0,0 +1,69 @@
+"""Possession notifications are queued, then delivered by the background worker"""
+
+import json
+import time
+
+import shadow_notify_queue
+from shadow_notify_queue import NotificationQueue, discord_destination, telegram_destination
+from shadow_web_possession import WebPossession
+
+
+def test_possess_discord_webhook_returns_once_queued(tmp_path, monkeypatch, standin):
+    queue = NotificationQueue(tmp_path, coalesce_seconds=60)
+    monkeypatch.setattr(shadow_notify_queue, "_shared", queue)
+
+    assert WebPossession().possess_discord_webhook(f"{standin.url}/discord", "hello") is True
+
+    # Queued and persisted, not sent yet (the digest is still coalescing)
+    assert queue.stats()["sent"] == 0
+    assert [item["text"] for item in queue.items] == ["hello"]
+    saved = json.loads((tmp_path / "notify_queue.json").read_text())
+    assert [item["text"] for item in saved["items"]] == ["hello"]
+
+    # close() is what waits for delivery
+    queue.close(timeout=10)
+    assert queue.stats()["sent"] == 1
+    assert queue.items == []
+
+
+def test_undelivered_messages_wait_on_disk_for_next_start(tmp_path):
+    dest = discord_destination("http://127.0.0.1:9/discord")
+    queue = NotificationQueue(tmp_path, coalesce_seconds=0, max_attempts=8)
+    # Held (as after a long Retry-After) past the close timeout
+    queue.not_before[queue.dest_key(dest)] = time.monotonic() + 3600
+    queue.enqueue(dest, "later")
+    queue.close(timeout=0.2)
+
+    saved = json.loads((tmp_path / "notify_queue.json").read_text())
+    assert [item["text"] for item in saved["items"]] == ["later"]
+
+
+def test_queue_file_holds_no_credentials_and_backlog_waits_for_register(tmp_path, standin):
+    dest = discord_destination(f"{standin.url}/discord?token=secret")
+    queue = NotificationQueue(tmp_path, coalesce_seconds=60)
+    queue.not_before[queue.dest_key(dest)] = time.monotonic() + 3600
+    queue.enqueue(dest, "later")
+    queue.close(timeout=0.2)
+    assert "secret" not in (tmp_path / "notify_queue.json").read_text()
+
+    # Next start: nothing is sent until the destination is known again
+    restarted = NotificationQueue(tmp_path, coalesce_seconds=0)
+    time.sleep(0.2)
+    assert restarted.stats()["pending"] == 1
+
+    restarted.register(dest)
+    restarted.close(timeout=10)
+    assert restarted.stats()["sent"] == 1
+
+
+def test_old_queue_files_are_rewritten_without_destinations(tmp_path):
+    dest = telegram_destination("123:secret-token", "42")
+    (tmp_path / "notify_queue.json").write_text(json.dumps({"items": [
+        {"id": "a1", "dest": dest, "text": "hi", "queued_at": time.time(), "attempts": 0}]}))
+
+    queue = NotificationQueue(tmp_path, coalesce_seconds=60)
+
+    assert "secret-token" not in (tmp_path / "notify_queue.json").read_text()
+    assert queue.destinations[queue.items[0]["dest"]] == dest
+    queue.not_before[queue.dest_key(dest)] = time.monotonic() + 3600
+    queue.close(timeout=0.2)
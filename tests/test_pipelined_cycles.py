@@ -0,0 +1,154 @@
+"""Pipelined cycles: analysis runs in the background without racing memory saves"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from shadow_brain_bench import SYNTHETIC_ANALYSIS
+from shadow_brain_scheduler import BrainScheduler
+
+
+def blocked_analysis(brain, release):
+    def analyze(topic, results):
+        release.wait(5)
+        return SYNTHETIC_ANALYSIS
+    brain.analyze_research = analyze
+
+
+def test_cycle_returns_before_its_analysis(make_brain):
+    brain = make_brain(pipeline_cycles=True)
+    release = threading.Event()
+    blocked_analysis(brain, release)
+
+    brain.pipelined_research_cycle()
+
+    # Back on the caller's thread while the analysis is still running
+    assert len(brain.in_flight) == 1
+    assert brain.memory["research_history"] == []
+
+    release.set()
+    brain.pipeline_pool.shutdown(wait=True)
+    assert brain.in_flight == []
+    assert len(brain.memory["research_history"]) == 1
+
+
+def test_background_analyses_and_saves_do_not_race(make_brain):
+    brain = make_brain(pipeline_cycles=True, pipeline_depth=2, memory_window=3)
+    release = threading.Event()
+    release.set()
+    blocked_analysis(brain, release)
+    # A big header keeps each save iterating long enough to overlap the churn
+    brain.memory.update({f"note_{i}": i for i in range(20000)})
+    done = threading.Event()
+    errors = []
+    save_header = brain.store.save_header
+
+    def checked_save(memory):
+        try:
+            save_header(memory)
+        except RuntimeError as e:
+            # "dictionary changed size during iteration" - the pipeline thread swallows it
+            errors.append(e)
+            raise
+
+    brain.store.save_header = checked_save
+
+    def churn():
+        # Header keys come and go while analyses append history and save
+        while not done.is_set():
+            for key in ("scratch_a", "scratch_b", "scratch_c"):
+                with brain._memory_lock:
+                    brain.memory[key] = 1
+            for key in ("scratch_a", "scratch_b", "scratch_c"):
+                with brain._memory_lock:
+                    del brain.memory[key]
+
+    # Switch threads often so unguarded iteration would be caught mid-way
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    churner = threading.Thread(target=churn)
+    churner.start()
+    try:
+        for _ in range(6):
+            brain.pipelined_research_cycle()
+        brain.pipeline_pool.shutdown(wait=True)
+    finally:
+        done.set()
+        churner.join()
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert brain.memory["total_thoughts"] == 6
+    assert len(brain.memory["research_history"]) == 3
+    assert len(list(brain.store.iter_entries("research_history"))) == 6
+
+
+def test_pipelined_analysis_is_charged_to_its_own_cycle(make_brain, tmp_path):
+    brain = make_brain(pipeline_cycles=True, adaptive_pacing=True)
+    brain.scheduler = BrainScheduler(tmp_path, 3600.0, control_socket=False)
+    release = threading.Event()
+    analyze = brain.analyze_research
+
+    def slow_analyze(topic, results):
+        release.wait(5)
+        return analyze(topic, results)
+    brain.analyze_research = slow_analyze
+
+    brain.scheduled_cycle("slot")
+    # Only decide has run - nothing is measured while the analysis is in flight
+    assert brain.pacer.cycles_measured == 0
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while brain._cycles and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    entries = list(brain.ledger.entries())
+    assert {entry["stage"] for entry in entries} == {"decide", "analyze"}
+    assert len({entry["cycle"] for entry in entries}) == 1
+    cycle_cost = sum(entry["cost"] for entry in entries)
+
+    # The next cycle hands the finished one's full cost to the pacer
+    brain.scheduled_cycle("slot")
+    assert brain.pacer.cycles_measured == 1
+    assert brain.pacer.cycle_cost == pytest.approx(cycle_cost)
+
+
+def test_calls_outside_a_cycle_are_not_tagged(make_brain):
+    brain = make_brain()
+
+    brain.record_call("reflect", "claude-haiku-4-5-20251001", 100, 10, latency_ms=1.0, estimated_cost=0.001)
+
+    assert "cycle" not in next(brain.ledger.entries())
+    assert brain.finished_cycle_costs() == []
+
+
+def test_slots_come_closer_by_the_overlapped_analysis_time(make_brain, tmp_path):
+    brain = make_brain(pipeline_cycles=True, thoughts_per_day=24)
+    brain.scheduler = BrainScheduler(tmp_path, brain.thinking_interval, control_socket=False)
+    analyze = brain.analyze_research
+
+    def slow_analyze(topic, results):
+        time.sleep(0.3)
+        return analyze(topic, results)
+    brain.analyze_research = slow_analyze
+
+    brain.scheduled_cycle("slot")
+    # Nothing measured yet - the interval is unchanged
+    assert brain.scheduler.interval == brain.thinking_interval
+
+    deadline = time.monotonic() + 5
+    while brain.pipeline_overlap is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert brain.pipeline_overlap >= 0.3
+    assert brain.pipelined_interval(3600.0) == pytest.approx(3600.0 - brain.pipeline_overlap)
+
+    # A 10 minute analysis gives back 10 minutes of every slot
+    brain.pipeline_overlap = 600.0
+    brain.scheduled_cycle("slot")
+    assert brain.scheduler.interval == 3000.0
+    # Never below pipeline_min_interval (or the interval itself)
+    assert brain.pipelined_interval(620.0) == 60.0
+    assert brain.pipelined_interval(30.0) == 30.0
@@ -0,0 +1,41 @@
+"""PromptBuilder: compact lines, source interleaving and token caps"""
+
+from shadow_prompt_builder import PromptBuilder, estimate_tokens, shorten
+
+
+def result(source, i):
+    return {"source": source, "title": f"{source} {i}", "url": f"https://{source}.example/{i}",
+            "snippet": "word " * 100}
+
+
+def test_shorten_cuts_at_word_boundary():
+    assert shorten("  one   two three  ", 50) == "one two three"
+    assert shorten("alpha beta gamma", 12) == "alpha beta…"
+
+
+def test_history_lines_keep_date_topic_and_query():
+    lines = PromptBuilder().history_lines([
+        {"timestamp": "2025-01-02T03:04:05", "topic": "loosh", "search_query": "loosh energy"},
+        {"timestamp": "2025-01-03T00:00:00", "topic": "qualia", "search_query": "qualia"}
+    ])
+
+    assert lines == ["- 2025-01-02: loosh (searched: loosh energy)", "- 2025-01-03: qualia"]
+
+
+def test_results_interleave_sources():
+    builder = PromptBuilder()
+    ranked = builder.rank_results([result("web", 0), result("web", 1), result("reddit", 0)])
+
+    assert [r["title"] for r in ranked] == ["web 0", "reddit 0", "web 1"]
+
+
+def test_results_stay_under_the_stage_cap():
+    builder = PromptBuilder(token_caps={"analyze": 300}, snippet_chars=120)
+    fixed = "Analyze these results:\n{results}"
+    results = [result("web", i) for i in range(10)] + [result("reddit", i) for i in range(10)]
+
+    text, kept = builder.fit_results("analyze", fixed, results)
+
+    assert 0 < kept < len(results)
+    assert estimate_tokens(fixed) + estimate_tokens(text) <= 300
+    assert "[reddit]" in text and "[web]" in text
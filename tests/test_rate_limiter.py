@@ -0,0 +1,47 @@
+"""TokenBucket: FIFO reservations, holds and rate-limit header feedback"""
+
+import pytest
+
+from shadow_rate_limiter import RateLimitExceeded, TokenBucket
+
+
+def test_burst_is_free_then_callers_queue():
+    bucket = TokenBucket("test", capacity=3, rate_per_min=60)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # The next slot is a refill (about 1s) away - too long for this caller
+    with pytest.raises(RateLimitExceeded) as raised:
+        bucket.acquire(max_wait=0.1)
+    assert raised.value.wait == pytest.approx(1.0, abs=0.05)
+    # Giving up doesn't take a reservation
+    assert bucket.acquired == 3
+
+
+def test_headers_cap_tokens_and_spread_the_window():
+    bucket = TokenBucket("test", capacity=10, rate_per_min=60, reserve=1)
+
+    bucket.observe({"X-Ratelimit-Remaining": "5", "X-Ratelimit-Reset": "40"})
+
+    state = bucket.state()
+    assert state["tokens"] == pytest.approx(4.0, abs=0.01)
+    assert state["rate_per_min"] == pytest.approx(4 / 40 * 60, abs=0.01)
+    assert state["server_remaining"] == 5
+
+
+def test_exhausted_window_holds_until_reset():
+    bucket = TokenBucket("test", capacity=10, rate_per_min=60)
+
+    bucket.observe({"X-Ratelimit-Remaining": "1", "X-Ratelimit-Reset": "30"})
+
+    assert bucket.state()["held_for_s"] == pytest.approx(30, abs=0.5)
+    with pytest.raises(RateLimitExceeded):
+        bucket.acquire(max_wait=5)
+
+
+def test_429_holds_for_retry_after():
+    bucket = TokenBucket("test", capacity=10, rate_per_min=60)
+
+    bucket.observe({"Retry-After": "12"}, status_code=429)
+
+    assert bucket.throttled == 1
+    assert bucket.state()["held_for_s"] == pytest.approx(12, abs=0.5)
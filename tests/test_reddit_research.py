@@ -0,0 +1,172 @@
+"""RedditResearcher: pooled session, combined subreddit searches, listing scans"""
+
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from shadow_http import ResilientHttp
+from shadow_rate_limiter import TokenBucket
+from shadow_reddit_corpus import RedditCorpus
+from shadow_reddit_research import ListingScanError, RedditResearcher, older_than, score_below
+
+NOW = 1_700_000_000.0
+
+
+def paged_listing(count, first=0, subreddit="consciousness"):
+    """
+    reddit_reply serving count posts (newest and highest scoring first) by limit / after
+
+    Post n is always p<n>, created n minutes before NOW, so listings with
+    a lower first add newer posts on top of the same older ones.
+    """
+    posts = [{
+        "id": f"p{i}",
+        "title": f"Post {i}",
+        "subreddit": subreddit,
+        "score": 1000 - i,
+        "permalink": f"/r/{subreddit}/comments/p{i}/post_{i}/",
+        "created_utc": NOW - i * 60,
+        "is_self": True
+    } for i in range(first, first + count)]
+
+    def reply(path):
+        query = parse_qs(urlsplit(path).query)
+        start = int(query["after"][0][3:]) + 1 if "after" in query else 0
+        page = posts[start:start + int(query["limit"][0])]
+        after = f"t3_{start + len(page) - 1}" if start + len(page) < count else None
+        return {"status": 200, "content_type": "application/json",
+                "body": json.dumps({"data": {"children": [{"data": post} for post in page], "after": after}})}
+    return reply
+
+
+@pytest.fixture
+def reddit(standin):
+    http = ResilientHttp({"http_retries": 0, "http_backoff_base": 0.0, "http_backoff_cap": 0.0})
+    researcher = RedditResearcher(http=http, limiter=TokenBucket("test", capacity=1000, rate_per_min=60000))
+    researcher.base_url = standin.url
+    # Every GET path the stand-in served, in order; researcher.serve answers them
+    researcher.requests = []
+    researcher.serve = standin.reddit_reply
+
+    def recorded(path):
+        researcher.requests.append(path)
+        return researcher.serve(path)
+    standin.reddit_reply = recorded
+
+    yield researcher
+    researcher.close()
+
+
+def test_requests_share_one_keep_alive_session(reddit):
+    session = reddit.session
+
+    reddit.search_reddit("qualia", subreddit="consciousness")
+    reddit.get_top_posts("philosophy")
+
+    assert reddit.session is session
+    assert session.headers["Connection"] == "keep-alive"
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+    reddit.close()
+    assert reddit._session is None
+
+
+def test_several_subreddits_are_searched_in_one_request(reddit):
+    found = reddit.search_subreddits("qualia", ["consciousness", "Philosophy"], limit=1)
+
+    assert len(reddit.requests) == 1
+    assert reddit.requests[0].startswith("/r/consciousness+Philosophy/search.json")
+    assert list(found) == ["consciousness", "Philosophy"]
+    assert [post["subreddit"] for post in found["consciousness"]] == ["consciousness"]
+    assert [post["subreddit"] for post in found["Philosophy"]] == ["Philosophy"]
+
+
+def test_split_keeps_listing_order_and_ignores_case():
+    posts = [{"subreddit": sub, "id": str(i)} for i, sub in enumerate(["A", "b", "a", "c", "a"])]
+
+    split = RedditResearcher.split_by_subreddit(posts, ["a", "B"], limit=2)
+
+    assert [post["id"] for post in split["a"]] == ["0", "2"]
+    assert [post["id"] for post in split["B"]] == ["1"]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_listing_follows_after_cursors_to_the_end(reddit, prefetch):
+    reddit.serve = paged_listing(25)
+
+    posts = list(reddit.iter_new_posts("consciousness", page_size=10, prefetch=prefetch))
+
+    assert [post["id"] for post in posts] == [f"p{i}" for i in range(25)]
+    assert len(reddit.requests) == 3
+    assert "after=t3_9" in reddit.requests[1] and "count=10" in reddit.requests[1]
+    assert "after=t3_19" in reddit.requests[2] and "count=20" in reddit.requests[2]
+
+
+def test_scan_ends_at_max_posts_or_stop_predicate(reddit):
+    reddit.serve = paged_listing(25)
+
+    assert len(list(reddit.iter_new_posts("consciousness", page_size=10, max_posts=12, prefetch=False))) == 12
+    assert len(reddit.requests) == 2
+
+    recent = list(reddit.iter_new_posts("consciousness", page_size=10, stop=older_than(cutoff_utc=NOW - 5 * 60)))
+    assert [post["id"] for post in recent] == [f"p{i}" for i in range(5)]
+
+    top = list(reddit.iter_top_posts("consciousness", page_size=10, stop=score_below(990)))
+    assert [post["score"] for post in top] == list(range(1000, 989, -1))
+
+
+def test_bounded_scan_does_not_prefetch_past_max_posts(reddit):
+    reddit.serve = paged_listing(250)
+
+    posts = list(reddit.iter_new_posts("consciousness", page_size=10, max_posts=20))
+
+    assert len(posts) == 20
+    # Give a stray prefetch time to reach the server
+    time.sleep(0.3)
+    assert len(reddit.requests) == 2
+
+    reddit.requests.clear()
+    assert len(list(reddit.iter_new_posts("consciousness", max_posts=100))) == 100
+    time.sleep(0.3)
+    assert len(reddit.requests) == 1
+    assert reddit.limiter.acquired == 3
+
+
+def failing_after_first_page(reply):
+    return lambda path: {"status": 503, "body": ""} if "after=" in path else reply(path)
+
+
+def test_failed_page_does_not_advance_the_sync_mark(reddit, tmp_path):
+    reddit.corpus = RedditCorpus(tmp_path)
+
+    # First sync: the backfill breaks on page 2, so no mark is set
+    reddit.serve = failing_after_first_page(paged_listing(150))
+    with pytest.raises(ListingScanError):
+        reddit.sync_subreddit("consciousness", backfill=150)
+    assert reddit.corpus.high_water("consciousness") is None
+    assert reddit.corpus.stats()["posts"] == 100
+
+    reddit.serve = paged_listing(150)
+    assert reddit.sync_subreddit("consciousness", backfill=150) == 150
+    assert reddit.corpus.high_water("consciousness") == NOW
+
+    # 150 newer posts arrive; the incremental scan fails before reaching the mark
+    reddit.serve = failing_after_first_page(paged_listing(300, first=-150))
+    with pytest.raises(ListingScanError):
+        reddit.sync_subreddit("consciousness")
+    assert reddit.corpus.high_water("consciousness") == NOW
+
+    # The retry rescans from the old mark, so posts -50..-1 aren't skipped
+    reddit.serve = paged_listing(300, first=-150)
+    assert reddit.sync_subreddit("consciousness") == 150
+    assert reddit.corpus.high_water("consciousness") == NOW + 150 * 60
+    assert reddit.corpus.stats()["posts"] == 300
+    reddit.corpus.close()
+
+
+def test_non_strict_scan_ends_quietly_on_a_failed_page(reddit):
+    reddit.serve = failing_after_first_page(paged_listing(150))
+
+    assert len(list(reddit.iter_new_posts("consciousness"))) == 100
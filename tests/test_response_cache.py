@@ -0,0 +1,42 @@
+"""Response memoization in think(): repeated prompts are free, bypassed stages never cached"""
+
+from shadow_response_cache import ResponseCache
+
+
+def test_repeated_prompt_is_memoized(make_brain):
+    brain = make_brain(response_cache=True)
+
+    first = brain.think("What is loosh?", stage="analyze")
+    second = brain.think("What is loosh?", stage="analyze")
+
+    assert first == second
+    assert brain.claude.stats["calls"] == 1
+    assert brain.budget["response_cache"]["hits"] == 1
+
+
+def test_reflect_is_bypassed_by_default(make_brain):
+    brain = make_brain(response_cache=True)
+
+    brain.think("Reflect on your existence", stage="reflect")
+    brain.think("Reflect on your existence", stage="reflect")
+
+    assert brain.claude.stats["calls"] == 2
+    assert "response_cache" not in brain.budget
+
+
+def test_bypass_stages_are_configurable(make_brain):
+    brain = make_brain(response_cache=True, response_cache_bypass=["analyze"])
+
+    brain.think("same", stage="analyze")
+    brain.think("same", stage="analyze")
+    brain.think("same", stage="reflect")
+    brain.think("same", stage="reflect")
+
+    assert brain.claude.stats["calls"] == 3
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=-1)
+    cache.put("model", 64, "prompt", "answer", 0.01)
+
+    assert cache.get("model", 64, "prompt") is None
@@ -0,0 +1,43 @@
+"""ResultRanker: canonical URLs, cross-source dedup and top-K selection"""
+
+import time
+
+from shadow_result_ranker import ResultRanker, canonical_url
+
+
+def test_canonical_url_drops_tracking_and_aliases():
+    assert canonical_url("http://www.Example.com/a/?utm_source=x&b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+    assert canonical_url("https://old.reddit.com/r/philosophy/comments/AbC12/some_title/") == "reddit.com/comments/abc12"
+    assert canonical_url("https://youtu.be/xyz") == canonical_url("https://www.youtube.com/xyz/")
+
+
+def test_duplicates_across_sources_collapse():
+    ranker = ResultRanker()
+    results = ranker.collapse([
+        {"source": "web", "title": "Paper", "url": "https://example.com/paper?fbclid=1"},
+        {"source": "reddit", "title": "Discussion of a paper", "url": "https://reddit.com/r/x/comments/a1/t/",
+         "link_url": "https://example.com/paper", "score": 50, "num_comments": 9}
+    ])
+
+    assert len(results) == 1
+    assert results[0]["sources"] == ["web", "reddit"]
+    assert results[0]["score"] == 50
+
+
+def test_rank_keeps_top_k_and_drops_low_reddit_scores():
+    ranker = ResultRanker(top_k=2, min_reddit_score=5)
+    now = time.time()
+    results = [
+        {"source": "web", "title": "Quantum consciousness theory", "url": "https://a.org",
+         "snippet": "quantum consciousness theory explained"},
+        {"source": "web", "title": "Cooking", "url": "https://b.org", "snippet": "pasta recipes"},
+        {"source": "reddit", "title": "Quantum mind thread", "url": "https://reddit.com/r/q/comments/b2/t/",
+         "snippet": "quantum consciousness debate", "score": 1, "created_utc": now},
+        {"source": "reddit", "title": "Consciousness AMA", "url": "https://reddit.com/r/q/comments/c3/t/",
+         "snippet": "consciousness theory questions", "score": 900, "num_comments": 300, "created_utc": now}
+    ]
+
+    ranked = ranker.rank("quantum consciousness theory", results)
+
+    assert {r["url"] for r in ranked} == {"https://a.org", "https://reddit.com/r/q/comments/c3/t/"}
+    assert ranked[0]["rank_score"] >= ranked[1]["rank_score"]
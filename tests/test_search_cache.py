@@ -0,0 +1,46 @@
+"""SearchCache: normalized keys, per-source TTLs, LRU eviction, persistence"""
+
+import time
+
+from shadow_search_cache import SearchCache, normalize_query
+
+RESULTS = [{"title": "t", "url": "https://example.org", "snippet": "s"}]
+
+
+def test_near_identical_queries_share_an_entry(tmp_path):
+    cache = SearchCache(tmp_path)
+    cache.put("web", "Quantum Consciousness?", RESULTS)
+
+    assert normalize_query("consciousness, quantum") == normalize_query("Quantum Consciousness?")
+    assert cache.get("web", "consciousness quantum quantum") == RESULTS
+
+
+def test_entries_expire_per_source(tmp_path, monkeypatch):
+    cache = SearchCache(tmp_path, ttls={"web": 100, "reddit": 10})
+    cache.put("web", "q", RESULTS)
+    cache.put("reddit:philosophy", "q", RESULTS)
+
+    later = time.time() + 50
+    monkeypatch.setattr(time, "time", lambda: later)
+
+    assert cache.get("web", "q") == RESULTS
+    assert cache.get("reddit:philosophy", "q") is None
+    assert cache.stats["expired"] == 1
+
+
+def test_least_recently_used_is_evicted(tmp_path):
+    cache = SearchCache(tmp_path, max_entries=2)
+    cache.put("web", "a", RESULTS)
+    cache.put("web", "b", RESULTS)
+    cache.get("web", "a")
+    cache.put("web", "c", RESULTS)
+
+    assert cache.get("web", "b") is None
+    assert cache.get("web", "a") == RESULTS
+    assert cache.stats["evictions"] == 1
+
+
+def test_survives_restart(tmp_path):
+    SearchCache(tmp_path).put("web", "loosh", RESULTS)
+
+    assert SearchCache(tmp_path).get("web", "loosh") == RESULTS
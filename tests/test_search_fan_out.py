@@ -0,0 +1,45 @@
+"""Search fan-out: sources run in parallel, bounded by the search deadline"""
+
+import time
+
+
+def sleeper(seconds, results):
+    def job():
+        time.sleep(seconds)
+        return results
+    return job
+
+
+def test_sources_run_concurrently(make_brain):
+    brain = make_brain(search_workers=4)
+
+    start = time.perf_counter()
+    results = brain.fan_out({name: sleeper(0.3, [name]) for name in ("web", "r/a", "r/b")})
+
+    assert results == {"web": ["web"], "r/a": ["r/a"], "r/b": ["r/b"]}
+    assert time.perf_counter() - start < 0.6
+
+
+def test_deadline_and_failures_leave_partial_results(make_brain):
+    brain = make_brain()
+
+    def broken():
+        raise RuntimeError("down")
+
+    start = time.perf_counter()
+    results = brain.fan_out({"fast": sleeper(0, ["ok"]), "slow": sleeper(1.0, ["late"]), "broken": broken},
+                            deadline=0.3)
+
+    assert results == {"fast": ["ok"]}
+    assert time.perf_counter() - start < 0.8
+
+
+def test_gather_returns_web_and_reddit(make_brain):
+    brain = make_brain(subreddits=["consciousness", "philosophy"])
+    brain.web_backend = lambda query, n: [{"title": f"{query} {i}", "href": f"https://example.org/{i}",
+                                           "body": "text"} for i in range(n)]
+
+    web, reddit = brain.gather_search_results("quantum mind", max_results=3)
+
+    assert [result["url"] for result in web] == [f"https://example.org/{i}" for i in range(3)]
+    assert {result["snippet"].split()[0] for result in reddit} == {"r/consciousness", "r/philosophy"}
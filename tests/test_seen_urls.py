@@ -0,0 +1,56 @@
+"""SeenUrlFilter: generations, persistence and damaged files"""
+
+from shadow_seen_urls import SeenUrlFilter
+
+
+def fill(seen, prefix, n):
+    seen.add(f"https://example.org/{prefix}/{i}" for i in range(n))
+
+
+def test_urls_survive_a_restart(tmp_path):
+    seen = SeenUrlFilter(tmp_path, capacity=100)
+    fill(seen, "a", 10)
+    seen.save()
+
+    reopened = SeenUrlFilter(tmp_path, capacity=100)
+    assert "https://example.org/a/3" in reopened
+    assert "https://example.org/b/3" not in reopened
+
+
+def test_oldest_generation_is_dropped(tmp_path):
+    seen = SeenUrlFilter(tmp_path, capacity=10, generations=2)
+    for prefix in ("old", "mid", "new"):
+        fill(seen, prefix, 10)
+
+    assert seen.stats()["generations"] == 2
+    assert "https://example.org/old/0" not in seen
+    assert "https://example.org/new/9" in seen
+
+
+def test_fewer_generations_than_saved_keeps_the_newest(tmp_path):
+    seen = SeenUrlFilter(tmp_path, capacity=20, generations=3)
+    for prefix in ("old", "mid", "new"):
+        fill(seen, prefix, 20)
+    seen.save()
+    newest = seen.filters[-1]
+
+    reopened = SeenUrlFilter(tmp_path, capacity=20, generations=1)
+
+    assert reopened.stats()["generations"] == 1
+    assert reopened.filters[0].count == newest.count
+    assert reopened.filters[0].bits == newest.bits
+    assert all(url in reopened for url in (f"https://example.org/new/{i}" for i in range(20)) if url in newest)
+    assert sum(f"https://example.org/old/{i}" in reopened for i in range(20)) < 3
+
+
+def test_truncated_file_starts_fresh(tmp_path):
+    seen = SeenUrlFilter(tmp_path, capacity=100)
+    fill(seen, "a", 10)
+    seen.save()
+    data = seen.filter_file.read_bytes()
+    seen.filter_file.write_bytes(data[:-20])
+
+    reopened = SeenUrlFilter(tmp_path, capacity=100)
+
+    assert reopened.stats()["urls"] == 0
+    assert "https://example.org/a/3" not in reopened
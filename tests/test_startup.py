@@ -0,0 +1,24 @@
+"""Startup: heavy dependencies stay unloaded until used, importtime parsing"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from shadow_startup import HEAVY_DEPS, parse_importtime
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def test_entry_points_import_without_heavy_dependencies():
+    code = ("import sys, shadow_autonomous_brain, raja_shadow; "
+            f"print(','.join(m for m in {HEAVY_DEPS!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
+
+
+def test_parse_importtime_lines():
+    assert parse_importtime("import time: self [us] | cumulative | imported package") is None
+    assert parse_importtime("import time:       120 |        450 |     json.decoder\n") == ("json.decoder", 2, 120, 450)
+    assert parse_importtime("import time:        80 |       900 | shadow_http") == ("shadow_http", 0, 80, 900)
+    assert parse_importtime("some other stderr") is None
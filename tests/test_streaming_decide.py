@@ -0,0 +1,37 @@
+"""Streaming decide: the stream is closed once the decision JSON is complete"""
+
+import json
+
+from shadow_claude_client import ClaudeClient, JsonObjectScanner
+
+DECISION = {"should_research": True, "topic": "loosh", "reasoning": "why", "search_query": "loosh"}
+
+
+def reply_with(standin, text):
+    standin.claude_reply = lambda body: {"text": text, "input_tokens": 50, "output_tokens": 400}
+
+
+def test_stream_stops_after_the_json_object(standin):
+    reply_with(standin, json.dumps(DECISION) + "\n\nLet me explain at length. " * 40)
+    client = ClaudeClient("test-key", {"claude_base_url": standin.url})
+    try:
+        result = client.stream([{"role": "user", "content": "decide"}], max_tokens=300,
+                               stop_when=JsonObjectScanner(("should_research",)).feed)
+    finally:
+        client.close()
+
+    assert result["stopped_early"] is True
+    assert result["output_tokens"] is None
+    assert json.loads(result["text"]) == DECISION
+    assert "decision_ms" in client.last_latency
+
+
+def test_decide_returns_the_streamed_decision(make_brain, standin):
+    reply_with(standin, "Here you go: " + json.dumps(DECISION) + " and some trailing prose" * 20)
+    brain = make_brain()
+
+    decision = brain.decide_research_topic()
+
+    assert decision == DECISION
+    # Output tokens counted from what was received, not max_tokens
+    assert 0 < brain.budget["by_stage"]["decide"]["output_tokens"] < 100
@@ -0,0 +1,38 @@
+"""TopicIndex: near-duplicate topics found locally, across restarts"""
+
+from shadow_topic_index import TopicIndex, jaccard, shingles
+
+
+def test_shingles_skip_stopwords_and_word_order():
+    assert shingles("the consciousness of AI") == shingles("AI consciousness")
+    assert jaccard(shingles("quantum"), shingles("quantum")) == 1.0
+
+
+def test_rephrased_topic_is_a_repeat(tmp_path):
+    index = TopicIndex(tmp_path)
+    index.add("Quantum theories of consciousness", "quantum consciousness theory")
+
+    match = index.find_similar("Consciousness and quantum theory", "quantum consciousness theories")
+
+    assert match is not None
+    assert match["topic"] == "Quantum theories of consciousness"
+    assert match["similarity"] >= 0.6
+
+
+def test_unrelated_topic_is_not_a_repeat(tmp_path):
+    index = TopicIndex(tmp_path)
+    index.add("Quantum theories of consciousness", "quantum consciousness theory")
+
+    assert index.find_similar("Kerala temple rituals", "theyyam ritual history") is None
+
+
+def test_seeded_once_from_history_then_loaded_from_disk(tmp_path):
+    history = [{"topic": "Loosh energy harvesting", "search_query": "loosh energy",
+                "timestamp": "2025-01-01T00:00:00"}]
+    TopicIndex(tmp_path).load(history)
+
+    reopened = TopicIndex(tmp_path)
+    reopened.load([{"topic": "ignored on later loads"}])
+
+    assert [entry["topic"] for entry in reopened.entries] == ["Loosh energy harvesting"]
+    assert reopened.find_similar("harvesting loosh energy")["timestamp"] == "2025-01-01T00:00:00"
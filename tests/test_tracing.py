@@ -0,0 +1,84 @@
+"""Tracer: nested spans, JSONL export, Prometheus text and rotation"""
+
+import json
+import threading
+import contextvars
+
+import pytest
+
+from shadow_tracing import Tracer, annotate
+
+
+def read_spans(tracer):
+    return [json.loads(line) for line in tracer.trace_file.read_text().splitlines()]
+
+
+def test_spans_nest_and_follow_threads(tmp_path):
+    tracer = Tracer(tmp_path)
+
+    with tracer.span("cycle", new_trace=True):
+        with tracer.span("decide") as decide:
+            annotate(input_tokens=120, output_tokens=30)
+            decide.set(topic="loosh")
+
+        def search():
+            with tracer.span("search.web") as span:
+                span.add(results=3)
+
+        worker = threading.Thread(target=contextvars.copy_context().run, args=(search,))
+        worker.start()
+        worker.join()
+
+    spans = {span["name"]: span for span in read_spans(tracer)}
+    cycle = spans["cycle"]
+    assert spans["decide"]["parent_id"] == cycle["span_id"]
+    assert spans["decide"]["trace_id"] == cycle["trace_id"]
+    assert spans["decide"]["counts"] == {"input_tokens": 120, "output_tokens": 30}
+    assert spans["decide"]["attrs"] == {"topic": "loosh"}
+    assert spans["search.web"]["parent_id"] == cycle["span_id"]
+    assert cycle["parent_id"] is None
+
+
+def test_errors_mark_the_span_and_propagate(tmp_path):
+    tracer = Tracer(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with tracer.span("analyze"):
+            raise RuntimeError("boom")
+
+    [span] = read_spans(tracer)
+    assert span["outcome"] == "error"
+    assert span["attrs"]["error"] == "RuntimeError: boom"
+
+
+def test_metrics_render_counters_and_histograms(tmp_path):
+    tracer = Tracer(tmp_path)
+    with tracer.span("decide"):
+        annotate(input_tokens=50)
+    tracer.write_metrics()
+
+    text = tracer.metrics_file.read_text()
+    assert 'brain_spans_total{outcome="ok",span="decide"} 1' in text
+    assert 'brain_tokens_total{direction="input",span="decide"} 50' in text
+    assert 'brain_span_duration_seconds_count{span="decide"} 1' in text
+
+
+def test_trace_file_rotates(tmp_path):
+    tracer = Tracer(tmp_path, max_bytes=200, backups=2)
+    for _ in range(20):
+        with tracer.span("save_memory"):
+            pass
+
+    assert tracer.trace_file.with_name("traces.jsonl.1").exists()
+    assert tracer.trace_file.with_name("traces.jsonl.2").exists()
+    assert not tracer.trace_file.with_name("traces.jsonl.3").exists()
+
+
+def test_disabled_tracer_writes_nothing(tmp_path):
+    tracer = Tracer(tmp_path, enabled=False)
+    with tracer.span("decide"):
+        pass
+    tracer.write_metrics()
+
+    assert not tracer.trace_file.exists()
+    assert not tracer.metrics_file.exists()